@@ -0,0 +1,74 @@
+"""Benchmark manifestu zasobów: pierwsze zbudowanie, weryfikacja niezmienionego drzewa i po zmianie części plików.
+
+Uruchomienie: python3 benchmarks/bench_assets.py [--files N] [--size BAJTY] [--changed K] [--workers W]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from launcher_assets import AssetManifest
+
+PNG_HEADER = b"\x89PNG\r\n\x1a\n"
+PNG_TRAILER = b"\x00\x00\x00\x00IEND\xaeB`\x82"
+
+
+def make_tree(root, files, size, seed=1234):
+    """Tworzy drzewo plików PNG (poprawna sygnatura i IEND) rozłożonych w podkatalogach."""
+    rng = random.Random(seed)
+    paths = []
+    for i in range(files):
+        directory = os.path.join(root, "static", "locations", f"{i % 100:02d}")
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"loc_{i:06d}.png")
+        with open(path, "wb") as f:
+            f.write(PNG_HEADER + rng.randbytes(max(0, size - len(PNG_HEADER) - len(PNG_TRAILER))) + PNG_TRAILER)
+        paths.append(path)
+    return paths
+
+
+def timed(manifest):
+    started = time.perf_counter()
+    report = manifest.verify()
+    return time.perf_counter() - started, report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=20000)
+    parser.add_argument("--size", type=int, default=4096, help="rozmiar jednego pliku (bajty)")
+    parser.add_argument("--changed", type=int, default=100, help="liczba plików zmienianych przed trzecim pomiarem")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = os.path.join(tmp, "backend")
+        print(f"Tworzę {args.files} plików po {args.size} B...")
+        paths = make_tree(root, args.files, args.size)
+        manifest = AssetManifest(root, os.path.join(tmp, "assets.manifest"), workers=args.workers)
+
+        elapsed, report = timed(manifest)
+        print(f"Pierwsze zbudowanie:  {elapsed * 1000:9.1f} ms  (przeliczono {report.hashed}, pula: {'tak' if report.pooled else 'nie'})")
+        print(f"Manifest na dysku:    {os.path.getsize(manifest.path) / 1024:9.1f} KiB")
+
+        elapsed, report = timed(manifest)
+        print(f"Bez zmian:            {elapsed * 1000:9.1f} ms  (przeliczono {report.hashed})")
+
+        for path in paths[:args.changed]:
+            with open(path, "r+b") as f:
+                f.seek(len(PNG_HEADER))
+                f.write(b"zmiana")
+        elapsed, report = timed(manifest)
+        print(f"Po zmianie {args.changed:5d} plików: {elapsed * 1000:7.1f} ms  (przeliczono {report.hashed}, zmienione {len(report.modified)})")
+        if report.corrupt:
+            print(f"Nieoczekiwanie uszkodzone pliki: {len(report.corrupt)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
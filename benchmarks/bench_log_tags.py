@@ -0,0 +1,95 @@
+"""Mikrobenchmark klasyfikacji tagów logów: dawny łańcuch `in` kontra LogTagClassifier.
+
+Uruchomienie: python3 benchmarks/bench_log_tags.py [--lines N] [--repeat R]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from launcher_logs import LogTagClassifier, LOG_TAG_RULES
+
+
+def legacy_get_log_tag(line):
+    """Kopia dawnego AppLauncher._get_log_tag (punkt odniesienia)."""
+    if "[FRONTEND_INFO]" in line: return "FRONTEND"
+    elif "[FRONTEND_BŁĄD]" in line or "[FRONTEND_ERROR]" in line: return "ERROR"
+    elif "[FRONTEND_SUKCES]" in line or "[FRONTEND_SUCCESS]" in line: return "SUCCESS"
+    elif "[FRONTEND_LICENCJA]" in line: return "LICENCJA"
+    elif "[FRONTEND_KRYTYCZNY]" in line or "[FRONTEND_CRITICAL]" in line: return "CRITICAL"
+
+    elif "[BACKEND_INFO]" in line: return "BACKEND"
+    elif "[BACKEND_DEBUG]" in line: return "DEBUG"
+    elif "[BACKEND_SUKCES]" in line or "[BACKEND_SUCCESS]" in line: return "SUCCESS"
+    elif "[BACKEND_BŁĄD]" in line or "[BACKEND_ERROR]" in line: return "ERROR"
+    elif "[BACKEND_LICENCJA]" in line: return "LICENCJA"
+    elif "[BACKEND_KRYTYCZNY]" in line or "[BACKEND_CRITICAL]" in line: return "CRITICAL"
+
+    elif "[PANEL_ADMINA_FLASK_OUTPUT]" in line: return "BACKEND"
+    elif "[BACKEND_GRY_OUTPUT]" in line: return "BACKEND"
+
+    elif "[LAUNCHER]" in line: return "LAUNCHER"
+    elif "[LAUNCHER_ERROR]" in line: return "ERROR"
+    elif "[LAUNCHER_WARNING]" in line: return "WARNING"
+
+    elif "[INFO]" in line: return "INFO"
+    elif "[WARNING]" in line: return "WARNING"
+    elif "[ERROR]" in line: return "ERROR"
+    elif "[CRITICAL]" in line: return "CRITICAL"
+
+    return None
+
+
+def make_corpus(count, seed=1234):
+    """Generuje linie podobne do wyjścia backendu: większość bez znanego znacznika."""
+    rng = random.Random(seed)
+    markers = [marker for marker, _ in LOG_TAG_RULES]
+    templates = [
+        lambda: f'127.0.0.1 - - [17/Oct/2026 12:{rng.randint(0, 59):02d}:00] "GET /api/location/{rng.randint(1, 999)} HTTP/1.1" 200 -',
+        lambda: f" * Running on http://127.0.0.1:{rng.randint(5000, 5100)}",
+        lambda: f"Loaded {rng.randint(1, 5000)} images from cache",
+        lambda: f"[{rng.choice(markers)}] Zdarzenie {rng.randint(1, 10 ** 6)}",
+        lambda: f"[BACKEND_GRY_OUTPUT] [{rng.choice(markers)}] zagnieżdżony znacznik",
+    ]
+    weights = [50, 10, 20, 15, 5]
+    return [rng.choices(templates, weights)[0]() for _ in range(count)]
+
+
+def measure(func, lines, repeat):
+    """Zwraca najlepszą przepustowość (linie/s) z `repeat` przebiegów."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for line in lines:
+            func(line)
+        best = min(best, time.perf_counter() - start)
+    return len(lines) / best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=200000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    lines = make_corpus(args.lines)
+    classifier = LogTagClassifier()
+    mismatches = [line for line in lines if legacy_get_log_tag(line) != classifier.classify(line)]
+    if mismatches:
+        print(f"NIEZGODNOŚĆ z dawnym mapowaniem w {len(mismatches)} liniach, np.: {mismatches[0]!r}")
+        return 1
+
+    before = measure(legacy_get_log_tag, lines, args.repeat)
+    after = measure(classifier.classify, lines, args.repeat)
+    print(f"Linie: {len(lines)}, wyniki zgodne z dawnym mapowaniem.")
+    print(f"Przed (łańcuch 'in'):   {before:12,.0f} linii/s")
+    print(f"Po (LogTagClassifier):  {after:12,.0f} linii/s")
+    print(f"Przyspieszenie:         {after / before:12.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+"""Porównanie startu procesu na zimno (subprocess.Popen) i na ciepło (fork z zygoty).
+
+Mierzony jest czas od żądania uruchomienia do pierwszej linii wypisanej przez skrypt
+po zaimportowaniu modułów. Zygota wczytuje te same moduły z wyprzedzeniem.
+
+Uruchomienie: python3 benchmarks/bench_spawn.py [--repeat R] [--modules flask,requests]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from launcher_zygote import ZygoteClient, zygote_supported
+
+DEFAULT_MODULES = "flask,requests,json,http.server,asyncio"
+
+# Skrypt uruchamiany w obu trybach; importuje dostępne moduły i zgłasza gotowość
+SCRIPT = r"""
+import importlib, sys
+for name in {modules!r}:
+    try:
+        importlib.import_module(name)
+    except ImportError:
+        pass
+print("ready", flush=True)
+"""
+
+
+def time_to_first_line(process):
+    process.stdout.readline()
+    return time.perf_counter()
+
+
+def measure_cold(script_path, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        process = subprocess.Popen([sys.executable, script_path], stdout=subprocess.PIPE)
+        times.append(time_to_first_line(process) - start)
+        process.wait()
+        process.stdout.close()
+    return times
+
+
+def measure_warm(script_path, repeat, zygote):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        process = zygote.spawn(script_path)
+        times.append(time_to_first_line(process) - start)
+        process.wait()
+        process.stdout.close()
+    return times
+
+
+def report(label, times):
+    print(f"{label:6s} mediana: {statistics.median(times) * 1000:8.1f} ms  "
+          f"min: {min(times) * 1000:8.1f} ms  max: {max(times) * 1000:8.1f} ms")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--modules", default=DEFAULT_MODULES, help="moduły oddzielone przecinkami")
+    args = parser.parse_args(argv)
+    if not zygote_supported():
+        print("Zygota nie jest dostępna w tym systemie.")
+        return 1
+
+    modules = [m for m in args.modules.split(",") if m]
+    with tempfile.NamedTemporaryFile("w", suffix=".py", delete=False) as f:
+        f.write(SCRIPT.format(modules=modules))
+        script_path = f.name
+    zygote = ZygoteClient(sys.executable, modules)
+    try:
+        zygote.start()
+        print(f"Zygota: moduły {', '.join(zygote.loaded_modules) or 'brak'} wczytane w {zygote.preload_time * 1000:.1f} ms")
+        report("zimny", measure_cold(script_path, args.repeat))
+        report("ciepły", measure_warm(script_path, args.repeat, zygote))
+    finally:
+        zygote.stop()
+        os.unlink(script_path)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
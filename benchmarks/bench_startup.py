@@ -0,0 +1,95 @@
+"""Pomiar czasu importu i startu launchera w trybie GUI i bezgłowym.
+
+Każdy pomiar wykonywany jest w świeżym interpreterze. Raport pokazuje najlepszy
+czas importu modułu wejściowego, czas zbudowania obiektu launchera z wczytaniem
+config.py oraz to, czy przy starcie zostały zaimportowane tkinter i requests.
+
+Uruchomienie: python3 benchmarks/bench_startup.py [--repeat R]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Kod wykonywany w procesie potomnym; wypisuje wynik jako JSON
+PROBE = r"""
+import json, sys, time
+t0 = time.perf_counter()
+import {module}
+t1 = time.perf_counter()
+import launcher_core
+for name, value in {paths!r}.items():
+    setattr(launcher_core, name, value)
+startup = None
+error = None
+try:
+    {startup_code}
+    startup = time.perf_counter() - t1
+except Exception as e:
+    error = str(e)
+print(json.dumps({{
+    "import": t1 - t0,
+    "startup": startup,
+    "error": error,
+    "tkinter": "tkinter" in sys.modules,
+    "requests": "requests" in sys.modules,
+}}))
+"""
+
+# Tryb: (moduł wejściowy, kod startu do pierwszego gotowego stanu)
+MODES = {
+    "headless": ("launcher_cli", "launcher_cli.HeadlessLauncher().load_config()"),
+    "gui": ("launcher_gui", "app = launcher_gui.AppLauncher(); app.update(); app.destroy()"),
+}
+
+
+def workdir_paths(root):
+    """Ścieżki launcher_core przekierowane do katalogu tymczasowego - pomiar nie zmienia logs/ ani .cache/ repozytorium."""
+    return {
+        "FRONTEND_CONFIG_PATH": os.path.join(root, "config.py"),
+        "LOG_STORE_DIR": os.path.join(root, "logs"),
+        "TRACE_DIR": os.path.join(root, "logs", "traces"),
+        "RECORDINGS_DIR": os.path.join(root, "logs", "sessions"),
+        "PREFLIGHT_CACHE_PATH": os.path.join(root, ".cache", "preflight.json"),
+        "ASSET_MANIFEST_PATH": os.path.join(root, ".cache", "assets.manifest"),
+    }
+
+
+def run_probe(mode, paths):
+    module, startup_code = MODES[mode]
+    code = PROBE.format(module=module, startup_code=startup_code, paths=paths)
+    output = subprocess.run([sys.executable, "-c", code], cwd=REPO_DIR, capture_output=True, text=True)
+    if output.returncode != 0:
+        return {"error": output.stderr.strip().splitlines()[-1] if output.stderr else "błąd"}
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="bench_startup_") as root:
+        paths = workdir_paths(root)
+        with open(paths["FRONTEND_CONFIG_PATH"], "w", encoding="utf-8") as f:
+            json.dump({"BACKEND_PORT": 5000}, f)
+        for mode in MODES:
+            runs = [run_probe(mode, paths) for _ in range(args.repeat)]
+            ok = [r for r in runs if r.get("import") is not None]
+            if not ok:
+                print(f"{mode:9s} niedostępny: {runs[0].get('error')}")
+                continue
+            best_import = min(r["import"] for r in ok) * 1000
+            startups = [r["startup"] for r in ok if r.get("startup") is not None]
+            startup = f"{min(startups) * 1000:8.1f} ms" if startups else f"niedostępny ({ok[0].get('error')})"
+            print(f"{mode:9s} import: {best_import:8.1f} ms  start: {startup}  "
+                  f"tkinter: {ok[0]['tkinter']}  requests: {ok[0]['requests']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
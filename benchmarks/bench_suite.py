@@ -0,0 +1,383 @@
+"""Zestaw benchmarków gorących ścieżek launchera na zastępczym backendzie i frontendzie (benchmarks/stubs).
+
+Mierzy:
+    - czas od uruchomienia do gotowości (cała ścieżka _start_app_logic z frontendem) i czas zamykania,
+    - przepustowość ścieżki logów: wyjście procesu -> OutputMultiplexer -> log_queue -> ujście
+      (LogSink z widżetem Text, gdy jest ekran - także wirtualny Xvfb - albo zapis jak w trybie bezgłowym),
+    - szybkość klasyfikacji tagów (_get_log_tag),
+    - koszt jednej sondy HealthMonitor i wynikający z niego narzut przy domyślnym interwale.
+
+Launcher działa w katalogu tymczasowym ze stubami w miejscu gry, więc repozytorium nie jest
+zmieniane. Wyniki można zapisać do JSON i porównać z zapisanymi wcześniej (np. na innym commicie);
+przy --compare kod wyjścia 1 oznacza regresję powyżej progu.
+
+Uruchomienie: python3 benchmarks/bench_suite.py [--output WYNIKI.json] [--compare BAZA.json] [--threshold PROC]
+              [--repeat R] [--log-lines N] [--backend-delay S] [--frontend-delay S] [--probes N]
+              [--display auto|xvfb|none]
+"""
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import shutil
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STUBS_DIR = os.path.join(REPO_DIR, "benchmarks", "stubs")
+sys.path.insert(0, REPO_DIR)
+
+import launcher_core
+from launcher_cli import HeadlessLauncher
+from launcher_logs import LogSink
+from launcher_monitor import HealthMonitor
+from bench_log_tags import make_corpus
+
+RESULTS_VERSION = 1
+READY_TIMEOUT = 30.0 # Limit czasu na gotowość w jednym pomiarze (sekundy)
+PIPELINE_TIMEOUT = 60.0 # Limit czasu na przejście wszystkich linii przez ścieżkę logów (sekundy)
+XVFB_START_TIMEOUT = 5.0 # Jak długo czekać na gniazdo uruchomionego Xvfb (sekundy)
+
+
+class BenchLauncher(HeadlessLauncher):
+    """Launcher bezgłowy, który zamiast kończyć pracę sygnalizuje gotowość i błędy zdarzeniem."""
+    def __init__(self, stream):
+        HeadlessLauncher.__init__(self, stream=stream, launch_frontend=True, monitor=False)
+        self.ready = threading.Event()
+        self.failure = None
+
+    def on_startup_status(self, text):
+        pass
+
+    def on_app_running(self):
+        self.ready.set()
+
+    def on_startup_failed(self, reason, message):
+        self.failure = message
+        self.ready.set()
+
+    def on_frontend_exited(self):
+        pass
+
+
+def free_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def prepare_workdir(root, port):
+    """Tworzy w `root` układ katalogów gry ze stubami i config.py, i kieruje na niego launcher_core."""
+    backend_dir = os.path.join(root, "geoguessr_backend")
+    os.makedirs(backend_dir)
+    shutil.copy(os.path.join(STUBS_DIR, "stub_backend.py"), os.path.join(backend_dir, launcher_core.BACKEND_APP_SCRIPT_NAME))
+    shutil.copy(os.path.join(STUBS_DIR, "stub_frontend.py"), os.path.join(root, launcher_core.FRONTEND_SCRIPT_NAME))
+    config = {
+        "BACKEND_PORT": port,
+        "BACKEND_WORKERS": 1,
+        "LOG_LEVEL": "DEBUG", # Wszystkie linie przechodzą przez całą ścieżkę logów
+        "LOG_STORE_ENABLED": False,
+        "STARTUP_TRACE_ENABLED": False,
+        "CONFIG_WATCH_ENABLED": False,
+    }
+    with open(os.path.join(root, "config.py"), "w", encoding="utf-8") as f:
+        json.dump(config, f)
+    paths = {
+        "BASE_DIR": root,
+        "BACKEND_DIR": backend_dir,
+        "FRONTEND_CONFIG_PATH": os.path.join(root, "config.py"),
+        "LOG_STORE_DIR": os.path.join(root, "logs"),
+        "TRACE_DIR": os.path.join(root, "logs", "traces"),
+        "RECORDINGS_DIR": os.path.join(root, "logs", "sessions"),
+        "PREFLIGHT_CACHE_PATH": os.path.join(root, ".cache", "preflight.json"),
+        "PREFLIGHT_MANIFESTS": [],
+        "ASSET_MANIFEST_PATH": os.path.join(root, ".cache", "assets.manifest"),
+    }
+    for name, value in paths.items():
+        setattr(launcher_core, name, value)
+
+
+def new_launcher(devnull):
+    launcher = BenchLauncher(devnull)
+    launcher.load_config()
+    return launcher
+
+
+def close_launcher(launcher):
+    launcher.stop_config_watcher()
+    launcher.flush_logs()
+    launcher.log_store.close()
+
+
+def metric(value, unit, better, samples=None):
+    result = {"value": value, "unit": unit, "better": better}
+    if samples is not None:
+        result["samples"] = samples
+    return result
+
+
+# --- Pomiary ---
+
+def bench_launch(devnull, repeat, backend_delay, frontend_delay):
+    """Czas do on_app_running (backend gotowy, frontend uruchomiony) i czas _stop_app_logic."""
+    os.environ["STUB_BACKEND_DELAY"] = str(backend_delay)
+    os.environ["STUB_FRONTEND_DELAY"] = str(frontend_delay)
+    launcher = new_launcher(devnull)
+    ready_times, shutdown_times = [], []
+    try:
+        for _ in range(repeat):
+            launcher.ready.clear()
+            started = time.perf_counter()
+            thread = threading.Thread(target=launcher._start_app_logic, kwargs={"launch_frontend": True}, daemon=True)
+            thread.start()
+            if not launcher.ready.wait(READY_TIMEOUT) or launcher.failure:
+                raise RuntimeError(launcher.failure or f"brak gotowości w ciągu {READY_TIMEOUT}s")
+            ready_times.append((time.perf_counter() - started) * 1000)
+            launcher.flush_logs()
+            started = time.perf_counter()
+            launcher._stop_app_logic()
+            shutdown_times.append((time.perf_counter() - started) * 1000)
+            thread.join(READY_TIMEOUT)
+            launcher.flush_logs()
+    finally:
+        launcher._stop_app_logic()
+        close_launcher(launcher)
+        for name in ("STUB_BACKEND_DELAY", "STUB_FRONTEND_DELAY"):
+            os.environ.pop(name, None)
+    return {
+        "launch_to_ready_ms": metric(round(statistics.median(ready_times), 2), "ms", "lower", [round(t, 2) for t in ready_times]),
+        "shutdown_ms": metric(round(statistics.median(shutdown_times), 2), "ms", "lower", [round(t, 2) for t in shutdown_times]),
+    }
+
+
+def bench_log_pipeline(devnull, lines, gui):
+    """Linie/s od wyjścia stubu backendu do ujścia logów (LogSink w Tk albo zapis do strumienia)."""
+    launcher = new_launcher(devnull)
+    root = sink = None
+    if gui:
+        import tkinter as tk
+        from launcher_gui import LOG_MAX_LINES # Ten sam limit historii co w oknie launchera
+        root = tk.Tk()
+        text = tk.Text(root)
+        text.pack()
+        sink = LogSink(text, launcher.log_queue, max_lines=launcher.frontend_config.get("LOG_MAX_LINES", LOG_MAX_LINES))
+        sink.start()
+    backend_script = os.path.join(launcher_core.BACKEND_DIR, launcher_core.BACKEND_APP_SCRIPT_NAME)
+    env = {"STUB_BACKEND_LOG_LINES": str(lines), "STUB_BACKEND_EXIT_AFTER_LOGS": "1"}
+    try:
+        started = time.perf_counter()
+        process = launcher._launch_process("backend gry", backend_script, cwd=launcher_core.BACKEND_DIR, env=env)
+        if process is None:
+            raise RuntimeError("nie udało się uruchomić stubu backendu")
+        deadline = time.monotonic() + PIPELINE_TIMEOUT
+        while True:
+            if root is not None:
+                root.update()
+            else:
+                launcher.flush_logs()
+            delivered = launcher.process_output_stats().get("backend gry", {}).get("lines", 0)
+            if delivered >= lines and launcher.log_queue.empty():
+                break
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"ścieżka logów nie przepuściła {lines} linii w {PIPELINE_TIMEOUT}s")
+            time.sleep(0.001)
+        elapsed = time.perf_counter() - started
+        process.wait()
+    finally:
+        if sink is not None:
+            sink.stop()
+            root.destroy()
+        close_launcher(launcher)
+    return {"log_pipeline_lines_per_s": metric(round(lines / elapsed), "linie/s", "higher")}
+
+
+def bench_log_tags(devnull, lines, repeat):
+    """Linie/s klasyfikowane przez _get_log_tag (najlepszy z `repeat` przebiegów)."""
+    launcher = new_launcher(devnull)
+    corpus = make_corpus(lines)
+    get_log_tag = launcher._get_log_tag
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for line in corpus:
+            get_log_tag(line)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    close_launcher(launcher)
+    return {"log_tag_lines_per_s": metric(round(lines / best), "linie/s", "higher")}
+
+
+def bench_monitor(devnull, probes):
+    """Czas i CPU jednej sondy HealthMonitor na działającym stubie oraz narzut przy interwale launchera."""
+    launcher = new_launcher(devnull)
+    try:
+        thread = threading.Thread(target=launcher._start_app_logic, kwargs={"launch_frontend": False}, daemon=True)
+        thread.start()
+        if not launcher.ready.wait(READY_TIMEOUT) or launcher.failure:
+            raise RuntimeError(launcher.failure or f"brak gotowości w ciągu {READY_TIMEOUT}s")
+        interval = launcher_core.CONNECTION_CHECK_INTERVAL / 1000
+        monitor = HealthMonitor(launcher.backend_port, launcher.is_backend_running, interval=interval)
+        monitor.probe_once() # Import requests i otwarcie połączenia keep-alive poza pomiarem
+        cpu_started, started = time.process_time(), time.perf_counter()
+        for _ in range(probes):
+            monitor.probe_once()
+        wall = (time.perf_counter() - started) / probes
+        cpu = (time.process_time() - cpu_started) / probes
+        monitor.stop()
+    finally:
+        launcher._stop_app_logic()
+        close_launcher(launcher)
+    return {
+        "monitor_probe_wall_ms": metric(round(wall * 1000, 3), "ms", "lower"),
+        "monitor_probe_cpu_ms": metric(round(cpu * 1000, 3), "ms", "lower"),
+        "monitor_overhead_pct": metric(round(cpu / interval * 100, 4), "% rdzenia", "lower"),
+    }
+
+
+# --- Ekran ---
+
+def start_xvfb():
+    """Uruchamia Xvfb na pierwszym wolnym numerze ekranu i ustawia DISPLAY. Zwraca proces albo None."""
+    if shutil.which("Xvfb") is None:
+        return None
+    number = next(n for n in range(99, 200) if not os.path.exists(f"/tmp/.X11-unix/X{n}"))
+    process = subprocess.Popen(["Xvfb", f":{number}", "-nolisten", "tcp", "-screen", "0", "1280x800x24"],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + XVFB_START_TIMEOUT
+    while not os.path.exists(f"/tmp/.X11-unix/X{number}"):
+        if process.poll() is not None or time.monotonic() > deadline:
+            process.kill()
+            return None
+        time.sleep(0.05)
+    os.environ["DISPLAY"] = f":{number}"
+    return process
+
+
+def setup_display(mode):
+    """Zwraca (ujście logów "gui" albo "headless", proces Xvfb albo None)."""
+    if mode == "none":
+        return "headless", None
+    if importlib.util.find_spec("tkinter") is None:
+        if mode == "xvfb":
+            raise RuntimeError("tkinter jest niedostępny")
+        return "headless", None
+    if mode == "auto" and os.environ.get("DISPLAY"):
+        return "gui", None
+    xvfb = start_xvfb()
+    if xvfb is None:
+        if mode == "xvfb":
+            raise RuntimeError("nie udało się uruchomić Xvfb")
+        return "headless", None
+    return "gui", xvfb
+
+
+# --- Wyniki ---
+
+def git_commit():
+    try:
+        result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_DIR, capture_output=True, text=True, timeout=5)
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=REPO_DIR,
+                               capture_output=True, text=True, timeout=5).stdout.strip()
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip() + ("-zmieniony" if dirty else "")
+
+
+def compare(base, current, threshold):
+    """Wypisuje zmiany względem `base` i zwraca liczbę regresji powyżej progu (ułamek)."""
+    regressions = 0
+    print(f"\nPorównanie z {base['meta'].get('commit') or 'bazą'} (próg {threshold * 100:.0f}%):")
+    for name, result in current["results"].items():
+        old = base["results"].get(name)
+        if old is None or not old.get("value"):
+            print(f"  {name:28s} brak w bazie")
+            continue
+        change = (result["value"] - old["value"]) / old["value"]
+        worse = change > threshold if result["better"] == "lower" else change < -threshold
+        regressions += worse
+        print(f"  {name:28s} {old['value']:>12} -> {result['value']:>12} {result['unit']:10s} {change * 100:+7.1f}%"
+              f"{'  REGRESJA' if worse else ''}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", help="zapisz wyniki do pliku JSON")
+    parser.add_argument("--compare", metavar="BAZA.json", help="porównaj z wcześniej zapisanymi wynikami")
+    parser.add_argument("--threshold", type=float, default=10.0, help="próg regresji w procentach (domyślnie 10)")
+    parser.add_argument("--repeat", type=int, default=5, help="liczba uruchomień i zamknięć")
+    parser.add_argument("--log-lines", type=int, default=100000, help="liczba linii w pomiarze ścieżki logów")
+    parser.add_argument("--backend-delay", type=float, default=0.0, help="opóźnienie startu stubu backendu (sekundy)")
+    parser.add_argument("--frontend-delay", type=float, default=0.0, help="opóźnienie startu stubu frontendu (sekundy)")
+    parser.add_argument("--probes", type=int, default=200, help="liczba sond w pomiarze monitora")
+    parser.add_argument("--display", choices=("auto", "xvfb", "none"), default="auto",
+                        help="ujście logów w Tk na ekranie (auto: DISPLAY albo Xvfb) lub bez ekranu")
+    args = parser.parse_args(argv)
+
+    try:
+        sink, xvfb = setup_display(args.display)
+    except RuntimeError as e:
+        print(f"Ekran niedostępny: {e}")
+        return 2
+    results = {}
+    devnull = open(os.devnull, "w")
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            prepare_workdir(tmp, free_port())
+            steps = [
+                ("uruchamianie i zamykanie", lambda: bench_launch(devnull, args.repeat, args.backend_delay, args.frontend_delay)),
+                (f"ścieżka logów ({sink})", lambda: bench_log_pipeline(devnull, args.log_lines, sink == "gui")),
+                ("klasyfikacja tagów", lambda: bench_log_tags(devnull, args.log_lines, args.repeat)),
+                ("monitor stanu", lambda: bench_monitor(devnull, args.probes)),
+            ]
+            for title, step in steps:
+                try:
+                    measured = step()
+                except (RuntimeError, OSError, ImportError) as e:
+                    print(f"{title:28s} niedostępny: {e}")
+                    continue
+                for name, result in measured.items():
+                    print(f"{name:28s} {result['value']:>12} {result['unit']}")
+                results.update(measured)
+    finally:
+        devnull.close()
+        if xvfb is not None:
+            xvfb.terminate()
+            xvfb.wait()
+
+    data = {
+        "version": RESULTS_VERSION,
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "log_sink": sink,
+            "params": {key: value for key, value in vars(args).items() if key not in ("output", "compare")},
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        print(f"\nWyniki zapisane w {args.output}.")
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            base = json.load(f)
+        if compare(base, data, args.threshold / 100):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,61 @@
+"""Zastępczy backend gry do benchmarków: serwer HTTP na FLASK_RUN_PORT z konfigurowalnym startem i ilością logów.
+
+Uruchamiany przez launcher zamiast geoguessr_backend/app.py (patrz benchmarks/bench_suite.py).
+Zmienne środowiskowe:
+    STUB_BACKEND_DELAY           - opóźnienie przed otwarciem portu (sekundy, domyślnie 0)
+    STUB_BACKEND_LOG_LINES       - liczba linii logu wypisywanych po starcie (domyślnie 0)
+    STUB_BACKEND_EXIT_AFTER_LOGS - "1": zakończ po wypisaniu logów, bez otwierania portu
+"""
+import http.server
+import os
+import sys
+import time
+
+# Mieszanka linii jak z prawdziwego backendu: większość bez znacznika, część ze znacznikami poziomów
+LOG_TEMPLATES = (
+    '127.0.0.1 - - [17/Oct/2026 12:00:00] "GET /api/location/{i} HTTP/1.1" 200 -',
+    "[BACKEND_INFO] Wczytano lokalizację {i}",
+    '127.0.0.1 - - [17/Oct/2026 12:00:01] "GET /static/img/loc_{i}.jpg HTTP/1.1" 200 -',
+    "[BACKEND_DEBUG] Pamięć podręczna: trafienie {i}",
+    "Loaded {i} images from cache",
+    "[BACKEND_ERROR] Symulowany błąd {i}",
+)
+LOG_BATCH = 1000 # Linie wypisywane jednym write()
+
+
+class StubHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True # Nagłówki i treść idą osobnymi write() - bez tego sonda czekałaby na opóźnione ACK
+
+    def do_GET(self):
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass # Logi żądań zaburzałyby pomiary wydajności ścieżki logów
+
+
+def emit_logs(count):
+    for start in range(0, count, LOG_BATCH):
+        lines = (LOG_TEMPLATES[i % len(LOG_TEMPLATES)].format(i=i) for i in range(start, min(count, start + LOG_BATCH)))
+        sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def main():
+    time.sleep(float(os.environ.get("STUB_BACKEND_DELAY", "0")))
+    emit_logs(int(os.environ.get("STUB_BACKEND_LOG_LINES", "0")))
+    if os.environ.get("STUB_BACKEND_EXIT_AFTER_LOGS") == "1":
+        return 0
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", int(os.environ["FLASK_RUN_PORT"])), StubHandler)
+    print(f"[BACKEND_SUCCESS] Stub backendu nasłuchuje na porcie {server.server_address[1]}", flush=True)
+    server.serve_forever()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
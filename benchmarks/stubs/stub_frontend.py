@@ -0,0 +1,30 @@
+"""Zastępczy frontend gry do benchmarków: bez okna, wypisuje logi i działa do zamknięcia przez launcher.
+
+Uruchamiany przez launcher zamiast geoguessr_game.py (patrz benchmarks/bench_suite.py).
+Zmienne środowiskowe:
+    STUB_FRONTEND_DELAY     - opóźnienie przed pierwszą linią wyjścia (sekundy, domyślnie 0)
+    STUB_FRONTEND_LOG_LINES - liczba linii logu wypisywanych po starcie (domyślnie 0)
+    STUB_FRONTEND_LIFETIME  - czas działania (sekundy); domyślnie do zakończenia przez launcher
+"""
+import os
+import sys
+import time
+
+
+def main():
+    time.sleep(float(os.environ.get("STUB_FRONTEND_DELAY", "0")))
+    print("[FRONTEND_INFO] Stub frontendu uruchomiony", flush=True)
+    count = int(os.environ.get("STUB_FRONTEND_LOG_LINES", "0"))
+    if count:
+        sys.stdout.write("".join(f"[FRONTEND_INFO] Runda {i}\n" for i in range(count)))
+        sys.stdout.flush()
+    lifetime = os.environ.get("STUB_FRONTEND_LIFETIME")
+    if lifetime is not None:
+        time.sleep(float(lifetime))
+        return 0
+    while True:
+        time.sleep(3600)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,45 @@
+import os
+import socket
+
+# --- Zmienne środowiskowe przekazywane procesowi backendu ---
+# Celowo bez LISTEN_FDS/LISTEN_FDNAMES: protokół systemd wymaga gniazda na fd 3 i LISTEN_PID, a biblioteki
+# zgodne z sd_listen_fds (także we wnukach dziedziczących środowisko) wzięłyby niewłaściwy deskryptor
+BACKEND_FD_ENV = "GEOGUESSR_BACKEND_FD" # Numer deskryptora gniazda w procesie backendu
+LISTEN_BACKLOG = 128 # Długość kolejki połączeń czekających, aż backend zacznie je przyjmować
+
+
+def create_listen_socket(port, host="127.0.0.1", backlog=LISTEN_BACKLOG):
+    """Wiąże i otwiera do nasłuchu gniazdo dla backendu. Rzuca OSError, gdy port jest zajęty."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        if os.name != "nt":
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((host, port))
+        sock.listen(backlog)
+        sock.set_inheritable(True)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def activation_env(sock):
+    """Zmienne środowiskowe, z których backend odczyta przekazane gniazdo."""
+    return {BACKEND_FD_ENV: str(sock.fileno())}
+
+
+def inherited_socket(environ=None):
+    """Po stronie backendu: zwraca gniazdo przekazane przez launcher albo None.
+
+    Przykład dla Flaska (werkzeug):
+        sock = inherited_socket()
+        if sock is not None:
+            make_server("127.0.0.1", port, app, fd=sock.detach()).serve_forever()
+        else:
+            app.run(port=port)
+    """
+    environ = os.environ if environ is None else environ
+    fd = environ.get(BACKEND_FD_ENV)
+    if not fd:
+        return None
+    return socket.socket(fileno=int(fd))
@@ -0,0 +1,276 @@
+import hashlib
+import json
+import multiprocessing
+import os
+import struct
+import time
+import zlib
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+ASSET_EXTENSIONS = (".png", ".jpg", ".jpeg", ".gif", ".webp", ".svg", ".ico", ".bmp") # Pliki objęte manifestem
+SKIPPED_DIRS = ("__pycache__", "node_modules") # Katalogi pomijane przy skanowaniu (oraz ukryte)
+MANIFEST_MAGIC = b"GGAM" # Nagłówek pliku manifestu
+MANIFEST_VERSION = 1
+MANIFEST_HEADER = struct.Struct("<4sBI") # magia, wersja, liczba plików; dalej treść skompresowana zlib
+HASH_DIGEST_SIZE = 16 # BLAKE2b-128: szybszy od SHA-256, w zupełności wystarcza do wykrywania zmian
+HASH_CHUNK_SIZE = 1024 * 1024 # Rozmiar bloku czytanego przy liczeniu skrótu
+TAIL_SIZE = 32 # Ile końcowych bajtów pliku zachować do sprawdzenia znacznika końca formatu
+POOL_MIN_FILES = 32 # Poniżej tej liczby plików do przeliczenia skróty liczone są w bieżącym procesie
+POOL_MIN_BYTES = 16 * 1024 * 1024 # ...albo poniżej tej łącznej wielkości (start puli kosztuje więcej niż zysk)
+POOL_BATCH_FILES = 64 # Maksymalna liczba plików w jednym zadaniu puli (mniej komunikacji między procesami)
+
+
+def check_image(ext, size, head, tail):
+    """Zwraca opis uszkodzenia na podstawie nagłówka i końca pliku albo None."""
+    if size == 0:
+        return "pusty plik"
+    if ext == ".png":
+        if not head.startswith(b"\x89PNG\r\n\x1a\n"):
+            return "brak sygnatury PNG"
+        if b"IEND" not in tail[-12:]:
+            return "obcięty plik PNG (brak IEND)"
+    elif ext in (".jpg", ".jpeg"):
+        if not head.startswith(b"\xff\xd8"):
+            return "brak sygnatury JPEG"
+        if not tail.rstrip(b"\0").endswith(b"\xff\xd9"):
+            return "obcięty plik JPEG (brak znacznika EOI)"
+    elif ext == ".gif":
+        if head[:6] not in (b"GIF87a", b"GIF89a"):
+            return "brak sygnatury GIF"
+        if not tail.endswith(b";"):
+            return "obcięty plik GIF"
+    elif ext == ".webp":
+        if head[:4] != b"RIFF" or head[8:12] != b"WEBP":
+            return "brak sygnatury WEBP"
+        if int.from_bytes(head[4:8], "little") + 8 > size:
+            return "obcięty plik WEBP"
+    return None
+
+
+def hash_asset(root, relpath):
+    """Liczy skrót pliku i sprawdza jego format. Zwraca (relpath, skrót, problem)."""
+    digest = hashlib.blake2b(digest_size=HASH_DIGEST_SIZE)
+    head = tail = b""
+    size = 0
+    try:
+        with open(os.path.join(root, relpath), "rb") as f:
+            while True:
+                chunk = f.read(HASH_CHUNK_SIZE)
+                if not chunk:
+                    break
+                if not size:
+                    head = chunk[:TAIL_SIZE]
+                digest.update(chunk)
+                tail = (tail + chunk)[-TAIL_SIZE:]
+                size += len(chunk)
+    except OSError as e:
+        return relpath, None, f"nie można odczytać: {e.strerror or e}"
+    return relpath, digest.digest(), check_image(os.path.splitext(relpath)[1].lower(), size, head, tail)
+
+
+def _hash_batch(root, relpaths):
+    return [hash_asset(root, relpath) for relpath in relpaths]
+
+
+def scan_assets(root, extensions=ASSET_EXTENSIONS):
+    """Zwraca {ścieżka względna: (rozmiar, mtime_ns)} dla plików zasobów pod `root`."""
+    found = {}
+    stack = [root]
+    prefix_len = len(root.rstrip(os.sep)) + 1
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if not name.startswith(".") and name not in SKIPPED_DIRS:
+                        stack.append(entry.path)
+                elif name.lower().endswith(extensions) and "\n" not in name:
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue # Plik zniknął w trakcie skanowania
+                    relpath = entry.path[prefix_len:]
+                    if os.sep != "/":
+                        relpath = relpath.replace(os.sep, "/")
+                    found[relpath] = (st.st_size, st.st_mtime_ns)
+    return found
+
+
+
+class ManifestData:
+    """Zawartość manifestu w postaci kolumnowej: wczytanie dziesiątek tysięcy wpisów trwa milisekundy."""
+    __slots__ = ("root", "paths", "sizes", "mtimes", "digests", "problems", "index")
+
+    def __init__(self, root, paths=(), sizes=(), mtimes=(), digests=b"", problems=None):
+        self.root = root
+        self.paths = list(paths)
+        self.sizes = array("q", sizes)
+        self.mtimes = array("q", mtimes)
+        self.digests = digests # Skróty wszystkich plików sklejone w kolejności `paths`
+        self.problems = problems or {} # ścieżka -> opis uszkodzenia (tylko pliki z problemem)
+        self.index = {path: i for i, path in enumerate(self.paths)}
+
+    def digest(self, i):
+        return self.digests[i * HASH_DIGEST_SIZE:(i + 1) * HASH_DIGEST_SIZE]
+
+    def to_bytes(self):
+        meta = json.dumps({"root": self.root, "problems": self.problems}, separators=(",", ":"))
+        body = b"".join((self.sizes.tobytes(), self.mtimes.tobytes(), self.digests,
+                         "\n".join(self.paths).encode("utf-8", "surrogateescape"), b"\0", meta.encode("utf-8")))
+        return MANIFEST_HEADER.pack(MANIFEST_MAGIC, MANIFEST_VERSION, len(self.paths)) + zlib.compress(body, 6)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Odtwarza manifest z pliku. Rzuca ValueError przy nieznanym lub uszkodzonym formacie."""
+        try:
+            magic, version, count = MANIFEST_HEADER.unpack_from(data)
+            body = zlib.decompress(data[MANIFEST_HEADER.size:])
+        except (struct.error, zlib.error) as e:
+            raise ValueError(f"uszkodzony manifest: {e}")
+        if magic != MANIFEST_MAGIC or version != MANIFEST_VERSION:
+            raise ValueError("nieznany format manifestu")
+        columns = count * (8 + 8 + HASH_DIGEST_SIZE)
+        separator = body.find(b"\0", columns)
+        if separator < 0:
+            raise ValueError("uszkodzony manifest: brak metadanych")
+        manifest = cls.__new__(cls)
+        manifest.sizes = array("q")
+        manifest.sizes.frombytes(body[:count * 8])
+        manifest.mtimes = array("q")
+        manifest.mtimes.frombytes(body[count * 8:count * 16])
+        manifest.digests = body[count * 16:columns]
+        paths = body[columns:separator].decode("utf-8", "surrogateescape")
+        manifest.paths = paths.split("\n") if count else []
+        if len(manifest.paths) != count:
+            raise ValueError("uszkodzony manifest: niezgodna liczba ścieżek")
+        meta = json.loads(body[separator + 1:])
+        manifest.root = meta.get("root")
+        manifest.problems = meta.get("problems") or {}
+        manifest.index = dict(zip(manifest.paths, range(count)))
+        return manifest
+
+
+class AssetReport:
+    """Wynik weryfikacji zasobów względem poprzedniego manifestu."""
+    __slots__ = ("total", "hashed", "added", "modified", "missing", "corrupt", "elapsed", "pooled", "created")
+
+    def __init__(self):
+        self.total = 0
+        self.hashed = 0 # Pliki, dla których skrót był liczony od nowa (nowe lub o zmienionym rozmiarze albo mtime)
+        self.added = [] # Nowe pliki
+        self.modified = [] # Pliki o zmienionej zawartości (inny skrót)
+        self.missing = [] # Pliki z manifestu, których już nie ma
+        self.corrupt = [] # [(ścieżka, opis)] - także pliki niezmienione od poprzedniego sprawdzenia
+        self.elapsed = 0.0
+        self.pooled = False # Czy skróty liczyła pula procesów
+        self.created = False # Czy manifest powstał od zera (wtedy wszystkie pliki są w `added`)
+
+
+class AssetManifest:
+    """Manifest zasobów gry: ścieżka, rozmiar, mtime i skrót każdego pliku.
+
+    verify() liczy skróty tylko dla plików nowych lub o zmienionym rozmiarze albo mtime (duże
+    partie - w puli procesów), więc na niezmienionym drzewie sprowadza się do jednego stat() na
+    plik. Manifest jest zapisywany w zwartym formacie binarnym i tylko wtedy, gdy coś się zmieniło.
+    """
+    def __init__(self, root, path, extensions=ASSET_EXTENSIONS, workers=None):
+        self.root = os.path.abspath(root)
+        self.path = path
+        self.extensions = tuple(extensions)
+        self.workers = workers # None = liczba rdzeni CPU
+
+    def load(self):
+        """Zwraca ManifestData; pusty manifest przy braku pliku, innym katalogu głównym lub błędzie formatu."""
+        try:
+            with open(self.path, "rb") as f:
+                manifest = ManifestData.from_bytes(f.read())
+        except (OSError, ValueError):
+            return ManifestData(self.root)
+        return manifest if manifest.root == self.root else ManifestData(self.root)
+
+    def save(self, manifest):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(manifest.to_bytes())
+        os.replace(tmp_path, self.path)
+
+    def verify(self):
+        """Porównuje drzewo zasobów z manifestem, aktualizuje go i zwraca AssetReport."""
+        started = time.monotonic()
+        report = AssetReport()
+        previous = self.load()
+        current = scan_assets(self.root, self.extensions)
+        report.total = len(current)
+
+        index, sizes, mtimes = previous.index, previous.sizes, previous.mtimes
+        stale = []
+        for relpath, (size, mtime_ns) in current.items():
+            i = index.get(relpath)
+            if i is None or sizes[i] != size or mtimes[i] != mtime_ns:
+                stale.append(relpath)
+        report.missing = sorted(index.keys() - current.keys())
+        report.corrupt = [(relpath, problem) for relpath, problem in previous.problems.items()
+                          if relpath in current and relpath not in stale]
+        report.hashed = len(stale)
+
+        report.created = not os.path.exists(self.path)
+        if stale or report.missing or report.created:
+            hashed = {}
+            for relpath, digest, problem in self._hash(stale, current, report):
+                hashed[relpath] = (digest or bytes(HASH_DIGEST_SIZE), problem)
+                i = index.get(relpath)
+                if i is None:
+                    report.added.append(relpath)
+                elif previous.digest(i) != digest:
+                    report.modified.append(relpath)
+                if problem:
+                    report.corrupt.append((relpath, problem))
+            self.save(self._merge(previous, current, hashed))
+        report.corrupt.sort()
+        report.elapsed = time.monotonic() - started
+        return report
+
+    def _merge(self, previous, current, hashed):
+        paths = sorted(current)
+        digests = []
+        problems = {}
+        for relpath in paths:
+            if relpath in hashed:
+                digest, problem = hashed[relpath]
+            else:
+                i = previous.index[relpath]
+                digest, problem = previous.digest(i), previous.problems.get(relpath)
+            digests.append(digest)
+            if problem:
+                problems[relpath] = problem
+        return ManifestData(self.root, paths, (current[p][0] for p in paths), (current[p][1] for p in paths),
+                            b"".join(digests), problems)
+
+    def _hash(self, relpaths, current, report):
+        if not relpaths:
+            return []
+        total_bytes = sum(current[relpath][0] for relpath in relpaths)
+        if len(relpaths) < POOL_MIN_FILES or total_bytes < POOL_MIN_BYTES:
+            return _hash_batch(self.root, relpaths)
+        workers = self.workers or os.cpu_count() or 1
+        batch = max(1, min(POOL_BATCH_FILES, len(relpaths) // (workers * 4)))
+        batches = [relpaths[i:i + batch] for i in range(0, len(relpaths), batch)]
+        results = []
+        try:
+            # spawn: launcher ma działające wątki, a fork() procesu wielowątkowego nie jest bezpieczny
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+                for part in pool.map(_hash_batch, [self.root] * len(batches), batches):
+                    results.extend(part)
+            report.pooled = True
+            return results
+        except (OSError, BrokenProcessPool):
+            # Np. brak możliwości uruchomienia procesów - liczymy w bieżącym procesie
+            return _hash_batch(self.root, relpaths)
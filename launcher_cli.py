@@ -0,0 +1,261 @@
+"""Bezgłowy (bez tkintera) tryb launchera GeoGuessr do pracy jako usługa.
+
+Uruchomienie: python3 launcher_cli.py [--with-frontend] [--log-file PLIK] [--log-level POZIOM]
+              [--load-test WYNIK.json [--load-clients N] [--load-rate R] [--load-duration S]]
+              [--record-output SESJA.ggrec] [--replay SESJA.ggrec [--replay-speed N]]
+
+Z --load-test po osiągnięciu gotowości backend jest obciążany testem (launcher_loadtest), wyniki
+trafiają do pliku JSON, a launcher kończy pracę z kodem 0.
+
+Z --record-output surowe wyjście procesów jest nagrywane do pliku sesji. --replay nie uruchamia
+żadnych procesów: podaje nagraną sesję przez czytnik wyjścia i ścieżkę logów (--replay-speed 1 to
+czas rzeczywisty, N - N razy szybciej, 0 - bez przerw) i podsumowuje głębokość kolejki, opóźnienie
+linii i pominięte linie.
+
+Kody wyjścia:
+    0 - zatrzymano na żądanie (SIGINT/SIGTERM) lub po zamknięciu frontendu
+    1 - nieoczekiwany błąd
+    2 - błąd config.py
+    3 - port backendu zajęty
+    4 - nie udało się uruchomić procesu
+    5 - backend nie osiągnął gotowości w wyznaczonym czasie
+    6 - backend zakończył działanie (przed gotowością, w trakcie pracy bez nadzoru
+        lub w pętli awarii mimo automatycznych restartów)
+    7 - środowisko nie przeszło sprawdzenia (brak interpretera, brakujące pakiety, mało miejsca na dysku)
+"""
+import argparse
+import signal
+import sys
+import threading
+from queue import Empty
+
+from launcher_core import (LauncherCore, ConfigError, START_ERROR_PORT_BUSY, START_ERROR_SPAWN_FAILED,
+                           START_ERROR_BACKEND_EXITED, START_ERROR_BACKEND_TIMEOUT, START_ERROR_PREFLIGHT)
+from launcher_logs import LOG_LEVEL_PRIORITIES
+
+# --- Kody wyjścia trybu bezgłowego ---
+EXIT_OK = 0
+EXIT_ERROR = 1
+EXIT_CONFIG = 2
+EXIT_PORT_BUSY = 3
+EXIT_SPAWN_FAILED = 4
+EXIT_BACKEND_TIMEOUT = 5
+EXIT_BACKEND_EXITED = 6
+EXIT_PREFLIGHT = 7
+
+START_ERROR_EXIT_CODES = {
+    START_ERROR_PORT_BUSY: EXIT_PORT_BUSY,
+    START_ERROR_SPAWN_FAILED: EXIT_SPAWN_FAILED,
+    START_ERROR_BACKEND_TIMEOUT: EXIT_BACKEND_TIMEOUT,
+    START_ERROR_BACKEND_EXITED: EXIT_BACKEND_EXITED,
+    START_ERROR_PREFLIGHT: EXIT_PREFLIGHT,
+}
+
+LOG_FLUSH_INTERVAL = 0.1 # Odstęp między zapisami logów do strumienia (sekundy)
+LOAD_TEST_REPORT_INTERVAL = 1.0 # Odstęp między wpisami z bieżącymi wynikami testu obciążenia (sekundy)
+
+
+class HeadlessLauncher(LauncherCore):
+    """Launcher bez GUI: logi trafiają do strumienia, wynik do kodu wyjścia."""
+    def __init__(self, stream=None, launch_frontend=False, monitor=True, log_level=None, load_test=None,
+                 record_output=None, replay=None):
+        LauncherCore.__init__(self)
+        self.stream = stream or sys.stdout
+        self.log_level_override = log_level # Z wiersza poleceń; ma pierwszeństwo przed config.py
+        self.launch_frontend = launch_frontend
+        self.monitor = monitor
+        self.load_test = load_test # None albo słownik: output, clients, rate, duration
+        self.record_output = record_output # None albo ścieżka pliku sesji
+        self.replay = replay # None albo słownik: path, speed
+        self.exit_code = None
+        self._running = False
+        self._done = threading.Event()
+
+    def finish(self, code):
+        """Kończy pętlę główną z podanym kodem (liczy się pierwszy zgłoszony)."""
+        if self.exit_code is None:
+            self.exit_code = code
+        self._done.set()
+
+    # --- Punkty rozszerzeń LauncherCore ---
+
+    def on_startup_status(self, text):
+        self.log_message(text, level="INFO", component="STATUS")
+
+    def on_startup_failed(self, reason, message):
+        self.log_message(f"Błąd uruchamiania: {message}", level="ERROR", component="URUCHAMIANIE")
+        self.finish(START_ERROR_EXIT_CODES.get(reason, EXIT_ERROR))
+
+    def on_process_error(self, name, message):
+        self.log_message(message, level="CRITICAL", component="PROCESY")
+
+    def on_app_running(self):
+        self._running = True
+        self.log_message("GeoGuessr uruchomiony w trybie bezgłowym.", level="SUCCESS", component="STATUS")
+        if self.load_test is not None:
+            threading.Thread(target=self._run_load_test, daemon=True).start()
+
+    def _run_load_test(self):
+        options = self.load_test
+        try:
+            generator = self.create_load_test(clients=options["clients"], rate=options["rate"], duration=options["duration"])
+        except RuntimeError as e:
+            self.log_message(str(e), level="ERROR", component="TEST_OBCIĄŻENIA")
+            self.finish(EXIT_ERROR)
+            return
+        self.log_message("Test obciążenia: %d klientów, %s, %.0fs, trasy: %s", generator.clients,
+                         f"{generator.rate} żądań/s" if generator.rate else "zamknięta pętla", generator.duration,
+                         ", ".join(generator.routes), level="INFO", component="TEST_OBCIĄŻENIA")
+        generator.start()
+        while not generator.wait(LOAD_TEST_REPORT_INTERVAL):
+            if self._done.is_set():
+                generator.stop()
+            self.log_load_test_snapshot(generator.snapshot(), level="DEBUG")
+        self.log_load_test_snapshot(generator.snapshot(), level="SUCCESS")
+        try:
+            generator.export_json(options["output"])
+            self.log_message("Wyniki testu obciążenia zapisane w %s.", options["output"], level="INFO", component="TEST_OBCIĄŻENIA")
+        except OSError as e:
+            self.log_message(f"Nie udało się zapisać wyników: {e}", level="ERROR", component="TEST_OBCIĄŻENIA")
+            self.finish(EXIT_ERROR)
+        self.finish(EXIT_OK)
+
+    def on_frontend_exited(self):
+        self.finish(EXIT_OK)
+
+    def on_backend_gave_up(self, message):
+        self.finish(EXIT_BACKEND_EXITED)
+
+    # --- Pętla główna ---
+
+    def flush_logs(self):
+        """Zapisuje wszystkie oczekujące logi do strumienia jednym flush()."""
+        wrote = False
+        while True:
+            try:
+                item = self.log_queue.get_nowait()
+            except Empty:
+                break
+            for record in item if isinstance(item, list) else (item,):
+                self.stream.write(record.format() + "\n")
+            wrote = True
+        if wrote:
+            self.stream.flush()
+
+    def _handle_signal(self, signum, frame):
+        self.log_message(f"Otrzymano sygnał {signum}, zatrzymuję.", level="INFO", component="ZAMYKANIE")
+        self.finish(EXIT_OK)
+
+    def run(self):
+        """Uruchamia backend (i opcjonalnie frontend) i czeka na zakończenie. Zwraca kod wyjścia."""
+        try:
+            self.load_config()
+        except ConfigError as e:
+            self.log_message(e.args[1], level="CRITICAL", component="KONFIGURACJA")
+            self.flush_logs()
+            return EXIT_CONFIG
+        if self.log_level_override is not None:
+            self.set_log_level(self.log_level_override)
+
+        signal.signal(signal.SIGINT, self._handle_signal)
+        signal.signal(signal.SIGTERM, self._handle_signal)
+
+        if self.replay is not None:
+            return self._run_replay()
+        if self.record_output is not None:
+            self.start_output_recording(self.record_output)
+
+        if self.monitor:
+            self.start_health_monitor()
+        self.start_process_metrics()
+        self.start_zygote()
+        threading.Thread(target=self._run_start_logic, daemon=True).start()
+
+        while not self._done.wait(LOG_FLUSH_INTERVAL):
+            self.flush_logs()
+            # Z włączonym nadzorem o końcu decyduje nadzorca (on_backend_gave_up)
+            supervised = any(worker.supervisor is not None for worker in self.backend_workers)
+            if self._running and not supervised and not self.is_backend_running():
+                self.log_message("Żaden proces backendu gry już nie działa.", level="ERROR", component="MONITORING")
+                self.finish(EXIT_BACKEND_EXITED)
+
+        self._stop_app_logic()
+        if self.health_monitor is not None:
+            self.health_monitor.stop()
+        self.stop_process_metrics()
+        self.stop_zygote()
+        self.stop_config_watcher()
+        self.stop_output_recording()
+        self.flush_logs()
+        self.log_store.close()
+        return self.exit_code
+
+    def _run_replay(self):
+        """Odtwarza sesję w osobnym wątku, zapisując w tym czasie logi do strumienia."""
+        options = self.replay
+        self.log_message("Odtwarzam sesję %s (%s).", options["path"],
+                         f"{options['speed']}x" if options["speed"] else "bez przerw", level="INFO", component="ODTWARZANIE")
+        result = {}
+
+        def replay():
+            try:
+                result["summary"] = self.replay_output(options["path"], options["speed"], cancel_event=self._done)
+            except (OSError, ValueError, RuntimeError) as e:
+                self.log_message(f"Nie udało się odtworzyć sesji: {e}", level="ERROR", component="ODTWARZANIE")
+            finally:
+                self.finish(EXIT_OK if "summary" in result else EXIT_ERROR)
+
+        thread = threading.Thread(target=replay, daemon=True)
+        thread.start()
+        while not self._done.wait(LOG_FLUSH_INTERVAL):
+            self.flush_logs()
+        thread.join() # Po sygnale odtwarzanie kończy się przy najbliższej próbce
+        if "summary" in result:
+            self.log_replay_summary(result["summary"])
+        self.stop_config_watcher()
+        self.stop_output_recording()
+        self.flush_logs()
+        self.log_store.close()
+        return self.exit_code
+
+    def _run_start_logic(self):
+        try:
+            self._start_app_logic(launch_frontend=self.launch_frontend)
+        except Exception as e:
+            self.log_message(f"Nieoczekiwany błąd uruchamiania: {e}", level="CRITICAL", component="URUCHAMIANIE")
+            self.finish(EXIT_ERROR)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="GeoGuessr Launcher - tryb bezgłowy")
+    parser.add_argument("--with-frontend", action="store_true", help="uruchom także frontend gry (wymaga ekranu)")
+    parser.add_argument("--log-file", help="dopisuj logi do pliku zamiast na stdout")
+    parser.add_argument("--no-monitor", action="store_true", help="nie uruchamiaj monitora stanu backendu")
+    parser.add_argument("--log-level", choices=list(LOG_LEVEL_PRIORITIES), help="minimalny poziom logów (domyślnie z config.py)")
+    parser.add_argument("--load-test", metavar="WYNIK.json", help="po starcie obciąż backend i zapisz wyniki do pliku JSON")
+    parser.add_argument("--load-clients", type=int, help="liczba współbieżnych klientów (domyślnie LOAD_TEST_CLIENTS)")
+    parser.add_argument("--load-rate", type=float, help="stałe tempo żądań/s (domyślnie zamknięta pętla)")
+    parser.add_argument("--load-duration", type=float, help="czas trwania testu w sekundach")
+    parser.add_argument("--record-output", metavar="SESJA.ggrec", help="nagrywaj surowe wyjście procesów do pliku sesji")
+    parser.add_argument("--replay", metavar="SESJA.ggrec", help="odtwórz nagraną sesję przez ścieżkę logów zamiast uruchamiać grę")
+    parser.add_argument("--replay-speed", type=float, default=1.0, help="mnożnik tempa odtwarzania (0 - bez przerw, domyślnie 1)")
+    args = parser.parse_args(argv)
+    load_test = None
+    if args.load_test:
+        load_test = {"output": args.load_test, "clients": args.load_clients, "rate": args.load_rate,
+                     "duration": args.load_duration}
+    replay = {"path": args.replay, "speed": args.replay_speed} if args.replay else None
+
+    stream = open(args.log_file, "a", encoding="utf-8") if args.log_file else sys.stdout
+    try:
+        launcher = HeadlessLauncher(stream, launch_frontend=args.with_frontend, monitor=not args.no_monitor,
+                                    log_level=args.log_level, load_test=load_test,
+                                    record_output=args.record_output, replay=replay)
+        return launcher.run()
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,182 @@
+import ctypes
+import ctypes.util
+import json
+import os
+import select
+import signal
+import struct
+import threading
+
+CONFIG_POLL_INTERVAL = 1.0 # Odstęp sprawdzania mtime, gdy inotify jest niedostępne (sekundy)
+MISSING = None # Wartość w diff_config dla klucza, którego nie było (lub już nie ma)
+
+# --- Stałe inotify (linux/inotify.h) ---
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_CLOEXEC = 0o2000000
+IN_NONBLOCK = 0o4000
+INOTIFY_EVENT = struct.Struct("iIII") # wd, mask, cookie, len (potem nazwa pliku)
+
+
+def read_json_config(path):
+    """Wczytuje plik konfiguracji JSON. Rzuca OSError lub ValueError."""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if not isinstance(data, dict):
+        raise ValueError("Konfiguracja musi być obiektem JSON.")
+    return data
+
+
+def atomic_write_json(path, data):
+    """Zapisuje JSON do pliku tymczasowego w tym samym katalogu i podmienia go przez rename.
+
+    Czytelnik (także obserwator zmian) widzi zawsze starą albo nową, kompletną zawartość.
+    """
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
+        if os.path.exists(path):
+            os.chmod(tmp_path, os.stat(path).st_mode & 0o7777)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def diff_config(old, new):
+    """Zwraca {klucz: (stara, nowa)} dla kluczy dodanych, usuniętych lub zmienionych."""
+    return {key: (old.get(key, MISSING), new.get(key, MISSING))
+            for key in old.keys() | new.keys()
+            if (key in old) != (key in new) or old.get(key) != new.get(key)}
+
+
+def _file_signature(path):
+    try:
+        st = os.stat(path)
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+    except OSError:
+        return None
+
+
+def _load_inotify():
+    if not hasattr(os, "uname") or os.uname().sysname != "Linux":
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        return libc if hasattr(libc, "inotify_init1") else None
+    except OSError:
+        return None
+
+
+class ConfigWatcher:
+    """Obserwuje pliki konfiguracji (inotify na Linuksie, w przeciwnym razie sprawdzanie mtime).
+
+    on_change(path) jest wywoływane z wątku obserwatora tylko dla plików, których zawartość
+    (mtime, rozmiar, i-węzeł) faktycznie się zmieniła. Obserwowane są katalogi, więc zapis
+    przez plik tymczasowy i rename też jest wykrywany.
+    """
+    def __init__(self, paths, on_change, poll_interval=CONFIG_POLL_INTERVAL, log=None):
+        self.paths = [os.path.abspath(p) for p in paths]
+        self.on_change = on_change
+        self.poll_interval = poll_interval
+        self.log = log # log(komunikat, poziom, *argumenty_formatowania)
+        self.mode = None # "inotify" albo "polling" po uruchomieniu
+        self._signatures = {path: _file_signature(path) for path in self.paths}
+        self._stop = threading.Event()
+        self._thread = None
+        self._inotify_fd = None
+
+    def _log(self, message, level="DEBUG", *args):
+        if self.log:
+            self.log(message, level, *args)
+
+    def start(self):
+        self._inotify_fd = self._open_inotify()
+        self.mode = "inotify" if self._inotify_fd is not None else "polling"
+        self._thread = threading.Thread(target=self._run, name="ConfigWatcher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+        if self._inotify_fd is not None:
+            os.close(self._inotify_fd)
+            self._inotify_fd = None
+
+    def remember(self, path):
+        """Zapamiętuje bieżący stan pliku (np. po własnym zapisie), żeby nie zgłaszać go jako zmiany."""
+        path = os.path.abspath(path)
+        self._signatures[path] = _file_signature(path)
+
+    def _open_inotify(self):
+        libc = _load_inotify()
+        if libc is None:
+            return None
+        fd = libc.inotify_init1(IN_CLOEXEC | IN_NONBLOCK)
+        if fd < 0:
+            return None
+        mask = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+        for directory in {os.path.dirname(p) for p in self.paths}:
+            if libc.inotify_add_watch(fd, os.fsencode(directory), mask) < 0:
+                self._log("inotify: nie można obserwować %s (errno %d), używam sprawdzania mtime.", "DEBUG", directory, ctypes.get_errno())
+                os.close(fd)
+                return None
+        return fd
+
+    def _run(self):
+        while not self._stop.is_set():
+            if self._inotify_fd is None:
+                self._stop.wait(self.poll_interval)
+                candidates = self.paths
+            else:
+                # Krótki limit czasu, żeby stop() nie czekał; zdarzenia i tak budzą select od razu
+                readable, _, _ = select.select([self._inotify_fd], [], [], 0.5)
+                if not readable:
+                    continue
+                candidates = self._read_inotify_names()
+            for path in candidates:
+                self._check(path)
+
+    def _read_inotify_names(self):
+        try:
+            data = os.read(self._inotify_fd, 65536)
+        except BlockingIOError:
+            return []
+        names = set()
+        offset = 0
+        while offset + INOTIFY_EVENT.size <= len(data):
+            _wd, _mask, _cookie, length = INOTIFY_EVENT.unpack_from(data, offset)
+            name = data[offset + INOTIFY_EVENT.size:offset + INOTIFY_EVENT.size + length].rstrip(b"\0")
+            names.add(os.fsdecode(name))
+            offset += INOTIFY_EVENT.size + length
+        return [p for p in self.paths if os.path.basename(p) in names]
+
+    def _check(self, path):
+        signature = _file_signature(path)
+        if signature == self._signatures.get(path):
+            return
+        self._signatures[path] = signature
+        if signature is None:
+            self._log(f"Plik konfiguracji {path} zniknął - zachowuję poprzednie ustawienia.", "WARNING")
+            return
+        try:
+            self.on_change(path)
+        except Exception as e:
+            self._log(f"Błąd obsługi zmiany {path}: {e}", "ERROR")
+
+
+def install_reload_handler(callback, sig=None):
+    """Po stronie procesu potomnego: wywołuje callback() po otrzymaniu sygnału przeładowania (domyślnie SIGHUP).
+
+    Launcher wysyła ten sygnał do frontendu tylko przy FRONTEND_CONFIG_RELOAD_SIGNAL=true w config.py.
+    """
+    sig = sig if sig is not None else getattr(signal, "SIGHUP", None)
+    if sig is not None:
+        signal.signal(sig, lambda signum, frame: callback())
@@ -0,0 +1,1246 @@
+import json
+import os
+import signal
+import socket
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from datetime import datetime
+
+from launcher_config import ConfigWatcher, read_json_config, atomic_write_json, diff_config
+from launcher_activation import create_listen_socket, activation_env
+from launcher_assets import AssetManifest, scan_assets
+from launcher_readiness import ReadinessProbe, EXITED
+from launcher_logs import LogTagClassifier, LogQueue, LogRecord, OutputLogRecord, LOG_LEVEL_PRIORITIES, level_priority
+from launcher_loadtest import LoadGenerator
+from launcher_logstore import LogStore
+from launcher_metrics import ProcessSampler, MetricsServer
+from launcher_monitor import HealthMonitor
+from launcher_output import OutputMultiplexer
+from launcher_preflight import Preflight, check_disk
+from launcher_proxy import LoadBalancingProxy
+from launcher_replay import SessionRecorder, SessionReplayer, REPLAY_SAMPLE_INTERVAL, REPLAY_DRAIN_TIMEOUT
+from launcher_supervisor import BackendSupervisor, RestartPolicy
+from launcher_trace import (StartupTracer, PhaseHistory, PHASE_PREFLIGHT, PHASE_PORT_CHECK, PHASE_WARMUP, PHASE_BACKEND_SPAWN, PHASE_BACKEND_FIRST_OUTPUT,
+                            PHASE_BACKEND_READY, PHASE_FIRST_HEALTHY_PROBE, PHASE_FRONTEND_SPAWN, PHASE_FRONTEND_FIRST_OUTPUT, PHASE_TOTAL)
+from launcher_warmup import BackendWarmup
+from launcher_zygote import ZygoteClient, zygote_supported, ZYGOTE_START_TIMEOUT
+
+# --- Konfiguracja Ścieżek ---
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.join(BASE_DIR, 'geoguessr_backend')
+FRONTEND_SCRIPT_NAME = 'geoguessr_game.py'
+BACKEND_APP_SCRIPT_NAME = 'app.py'
+FRONTEND_CONFIG_PATH = os.path.join(BASE_DIR, 'config.py')
+
+# --- Konfiguracja Uruchamiania ---
+PYTHON_EXECUTABLE = 'python3' # Interpreter procesów potomnych (nazwa z PATH lub ścieżka), nadpisywany przez PYTHON_EXECUTABLE z config.py
+BACKEND_PORT = 5000 # Domyślny port, nadpisywany przez BACKEND_PORT z config.py
+BACKEND_STARTUP_TIMEOUT = 30 # Maksymalny czas oczekiwania na gotowość backendu gry (sekundy)
+BACKEND_HEALTH_PATH = "/" # Ścieżka HTTP sprawdzana po otwarciu portu backendu
+READINESS_INITIAL_INTERVAL = 0.05 # Pierwszy odstęp między próbami sondowania (sekundy)
+READINESS_MAX_INTERVAL = 1.0 # Maksymalny odstęp między próbami po backoffie (sekundy)
+READINESS_ACTIVATION_PROBE_TIMEOUT = 0.2 # Limit jednego GET, gdy port związał launcher - nikt jeszcze może nie przyjmować połączeń (sekundy)
+CONNECTION_CHECK_INTERVAL = 1000 # Interwał odświeżania statusu procesów (ms)
+SHUTDOWN_TIMEOUT = 5.0 # Wspólny limit czasu na łagodne zamknięcie wszystkich procesów, potem SIGKILL (sekundy)
+SHUTDOWN_POLL_INTERVAL = 0.02 # Odstęp między sprawdzeniami, czy procesy już się zakończyły (sekundy)
+# Liczba workerów backendu (None = liczba rdzeni CPU). Przy więcej niż jednym workery słuchają
+# na BACKEND_PORT+1..N, a proxy na BACKEND_PORT. Stan gry trzymany w pamięci procesu nie jest
+# współdzielony między workerami - dla takiego backendu ustaw BACKEND_WORKERS na 1 w config.py.
+BACKEND_WORKERS = None
+# Aktywacja gniazda: launcher sam wiąże port workera i przekazuje deskryptor backendowi (GEOGUESSR_BACKEND_FD).
+# Wymaga backendu, który korzysta z launcher_activation.inherited_socket().
+BACKEND_SOCKET_ACTIVATION = False
+
+# --- Konfiguracja Sprawdzenia Środowiska ---
+PREFLIGHT_ENABLED = True # Czy przed uruchomieniem sprawdzać interpreter, importy skryptów i dysk (nadpisywane przez PREFLIGHT_ENABLED)
+PREFLIGHT_CACHE_PATH = os.path.join(BASE_DIR, '.cache', 'preflight.json') # Wynik ostatniego udanego sprawdzenia
+# Pliki zależności wliczane do klucza pamięci podręcznej - ich zmiana wymusza ponowne sprawdzenie importów
+PREFLIGHT_MANIFESTS = [os.path.join(BACKEND_DIR, 'requirements.txt'), os.path.join(BASE_DIR, 'requirements.txt')]
+PREFLIGHT_MIN_FREE_MB = 50 # Minimalne wolne miejsce w katalogu logów (MB)
+
+# --- Konfiguracja Weryfikacji Zasobów ---
+ASSET_VERIFY_ENABLED = True # Czy przed uruchomieniem weryfikować obrazy gry w BACKEND_DIR (nadpisywane przez ASSET_VERIFY_ENABLED)
+ASSET_MANIFEST_PATH = os.path.join(BASE_DIR, '.cache', 'assets.manifest') # Ścieżki, rozmiary, mtime i skróty zasobów
+ASSET_VERIFY_STRICT = False # Czy uszkodzone zasoby blokują uruchomienie (domyślnie tylko ostrzeżenie w logach)
+ASSET_REPORT_LIMIT = 10 # Maks. liczba wymienianych z nazwy plików w jednym komunikacie
+
+# --- Konfiguracja Rozgrzewania Backendu ---
+# Ścieżki odpytywane na każdym workerze po gotowości backendu, przed uruchomieniem frontendu
+# (np. ["/api/location", "/static/img/loc_0001.jpg"]), nadpisywane przez WARMUP_ROUTES z config.py
+WARMUP_ROUTES = []
+WARMUP_CONCURRENCY = 4 # Maks. liczba równoległych żądań rozgrzewających
+WARMUP_TIMEOUT = 5.0 # Limit czasu jednego żądania rozgrzewającego (sekundy)
+WARMUP_PRELOAD_ASSETS = False # Czy wczytać obrazy z BACKEND_DIR do pamięci podręcznej stron (posix_fadvise)
+WARMUP_PRELOAD_MAX_MB = 256 # Górna granica wczytywanych zasobów (MB), żeby nie wypierać innych danych z pamięci
+
+# --- Konfiguracja Przeładowania Ustawień ---
+CONFIG_WATCH_ENABLED = True # Czy obserwować config.py i stosować zmiany bez restartu (nadpisywane przez CONFIG_WATCH_ENABLED)
+# Klucze wymagające ponownego uruchomienia procesów - zmiana jest tylko zgłaszana w logach
+RESTART_REQUIRED_KEYS = ("BACKEND_PORT", "BACKEND_WORKERS", "BACKEND_SOCKET_ACTIVATION", "ZYGOTE_ENABLED",
+                         "ZYGOTE_PRELOAD_MODULES", "METRICS_PORT", "LOG_STORE_ENABLED", "CONFIG_WATCH_ENABLED",
+                         "PYTHON_EXECUTABLE", "OUTPUT_RECORDING_ENABLED")
+# Klucze używane tylko przez launcher - odczytywane na bieżąco, nie są przekazywane procesom potomnym
+LAUNCHER_ONLY_KEYS = ("LOG_LEVEL", "LOG_TAG_RULES", "LOG_MAX_LINES", "BACKEND_HEALTH_PATH", "BACKEND_AUTO_RESTART",
+                      "STARTUP_TRACE_ENABLED", "UPDATE_CHECK_TTL", "CONFIG_RELOAD_PATH", "FRONTEND_CONFIG_RELOAD_SIGNAL",
+                      "PREFLIGHT_ENABLED", "PREFLIGHT_MIN_FREE_MB", "ASSET_VERIFY_ENABLED", "ASSET_VERIFY_STRICT",
+                      "WARMUP_ROUTES", "WARMUP_CONCURRENCY", "WARMUP_TIMEOUT", "WARMUP_PRELOAD_ASSETS", "WARMUP_PRELOAD_MAX_MB")
+# Ścieżka HTTP workera backendu, na którą launcher wysyła POST {"changed": {...}} z nowymi wartościami
+# pozostałych kluczy (None = wyłączone). Backend bez tej ścieżki odpowie 404, co jest ignorowane.
+CONFIG_RELOAD_PATH = "/__launcher/config"
+CONFIG_RELOAD_TIMEOUT = 2.0 # Limit czasu powiadomienia jednego workera (sekundy)
+# Czy po zmianie wysyłać frontendowi SIGHUP (frontend musi go obsłużyć, np. launcher_config.install_reload_handler)
+FRONTEND_CONFIG_RELOAD_SIGNAL = False
+
+# --- Konfiguracja Nadzoru Backendu ---
+BACKEND_AUTO_RESTART = True # Czy automatycznie restartować backend po awarii
+RESTART_INITIAL_BACKOFF = 1.0 # Opóźnienie pierwszego restartu (sekundy)
+RESTART_MAX_BACKOFF = 30.0 # Górna granica opóźnienia restartu (sekundy)
+CRASH_LOOP_WINDOW = 60 # Okno wykrywania pętli awarii (sekundy)
+CRASH_LOOP_MAX_RESTARTS = 5 # Maks. liczba restartów w oknie, potem nadzorca się poddaje
+
+# --- Konfiguracja Zygoty ---
+ZYGOTE_ENABLED = False # Czy uruchamiać procesy przez fork() z zygoty z wczytanymi modułami (tylko POSIX)
+ZYGOTE_PRELOAD_MODULES = ["flask", "requests"] # Moduły wczytywane przez zygotę, nadpisywane przez ZYGOTE_PRELOAD_MODULES z config.py
+
+# --- Konfiguracja Logów ---
+LOG_LEVEL = "INFO" # Minimalny poziom logów launchera (nadpisywany przez LOG_LEVEL z config.py i w trakcie działania)
+
+# --- Konfiguracja Magazynu Logów ---
+LOG_STORE_ENABLED = True # Czy zapisywać logi na dysk (nadpisywane przez LOG_STORE_ENABLED z config.py)
+LOG_STORE_DIR = os.path.join(BASE_DIR, 'logs') # Katalog segmentów logów i ich indeksu
+LOG_SEGMENT_MAX_BYTES = 5 * 1024 * 1024 # Rozmiar segmentu, po którym następuje rotacja i kompresja
+LOG_MAX_SEGMENTS = 20 # Liczba przechowywanych segmentów (najstarsze są usuwane)
+
+# --- Konfiguracja Śladu Uruchamiania ---
+STARTUP_TRACE_ENABLED = True # Czy zapisywać ślad faz uruchamiania (nadpisywane przez STARTUP_TRACE_ENABLED z config.py)
+TRACE_DIR = os.path.join(LOG_STORE_DIR, 'traces') # Pliki Chrome trace JSON (chrome://tracing, Perfetto) i podsumowanie faz
+TRACE_KEEP_FILES = 20 # Liczba przechowywanych plików śladu (najstarsze są usuwane)
+TRACE_HISTORY_SIZE = 50 # Liczba ostatnich uruchomień, z których liczone są p50/p95 faz
+TRACE_FIRST_OUTPUT_TIMEOUT = 5.0 # Jak długo czekać na pierwsze wyjście frontendu przed zapisem śladu (sekundy)
+
+# --- Konfiguracja Nagrywania Wyjścia Procesów ---
+OUTPUT_RECORDING_ENABLED = False # Czy zapisywać surowe wyjście procesów do pliku sesji (nadpisywane przez OUTPUT_RECORDING_ENABLED z config.py)
+RECORDINGS_DIR = os.path.join(LOG_STORE_DIR, 'sessions') # Pliki sesji do odtworzenia (launcher_cli.py --replay)
+RECORDINGS_KEEP_FILES = 10 # Liczba przechowywanych plików sesji (najstarsze są usuwane)
+
+# --- Konfiguracja Testu Obciążenia ---
+LOAD_TEST_ROUTES = ["/"] # Ścieżki backendu odpytywane po kolei (nadpisywane przez LOAD_TEST_ROUTES z config.py)
+LOAD_TEST_CLIENTS = 10 # Liczba współbieżnych klientów keep-alive
+LOAD_TEST_RATE = None # Stałe tempo żądań/s dla wszystkich klientów razem (None = zamknięta pętla)
+LOAD_TEST_DURATION = 10.0 # Czas trwania testu (sekundy)
+LOAD_TEST_TIMEOUT = 5.0 # Limit czasu pojedynczego żądania (sekundy)
+
+# --- Konfiguracja Metryk Procesów ---
+METRICS_SAMPLE_INTERVAL = 1.0 # Odstęp między pomiarami CPU/RSS/wątków/deskryptorów z /proc (sekundy)
+METRICS_HISTORY_SIZE = 60 # Liczba przechowywanych pomiarów na proces
+METRICS_PORT = None # Port endpointu /metrics w formacie Prometheusa (None = wyłączony), nadpisywany przez METRICS_PORT z config.py
+
+# --- Przyczyny nieudanego uruchomienia (czytelne maszynowo) ---
+START_ERROR_PORT_BUSY = "port_busy"
+START_ERROR_SPAWN_FAILED = "spawn_failed"
+START_ERROR_BACKEND_EXITED = "backend_exited"
+START_ERROR_BACKEND_TIMEOUT = "backend_timeout"
+START_ERROR_PREFLIGHT = "preflight_failed"
+
+
+class ConfigError(Exception):
+    """Błąd wczytywania config.py. Pierwszy argument to tytuł, drugi - treść komunikatu."""
+
+
+class BackendWorker:
+    """Jeden proces backendu gry w puli workerów."""
+    def __init__(self, index, port, name):
+        self.index = index
+        self.port = port
+        self.name = name
+        self.process = None
+        self.supervisor = None
+        self.listen_socket = None # Gniazdo nasłuchu trzymane przez launcher przy aktywacji gniazd
+        self.output_baseline = 0 # Bajty wyjścia workera przed ostatnim uruchomieniem (liczniki sumują się po restartach)
+
+    def is_alive(self):
+        return self.process is not None and self.process.poll() is None
+
+
+class LauncherCore:
+    """Logika launchera niezależna od GUI: konfiguracja, procesy, gotowość, monitoring, logi i zamykanie.
+
+    Interfejsy (okno Tk, tryb bezgłowy) dziedziczą po tej klasie i nadpisują metody on_*.
+    Metody on_* mogą być wywoływane z wątków roboczych.
+    """
+    def __init__(self):
+        # Procesy
+        self.backend_workers = [] # BackendWorker dla każdego procesu backendu gry
+        self.backend_proxy = None # LoadBalancingProxy, gdy workerów jest więcej niż jeden
+        self.frontend_game_process = None
+        self.log_queue = LogQueue() # Wpisy LogRecord (lub ich listy z wyjścia procesów) do wyświetlenia
+        self.store_process_output = True # Czy zapisywać wyjście procesów w magazynie logów (wyłączane na czas odtwarzania)
+        self.log_level = LOG_LEVEL
+        self._min_log_priority = level_priority(LOG_LEVEL)
+        self.output_reader = OutputMultiplexer(self._handle_process_output, self._on_process_output_closed,
+                                               self._on_process_output_error)
+        self.log_store = LogStore(LOG_STORE_DIR, max_segment_bytes=LOG_SEGMENT_MAX_BYTES, max_segments=LOG_MAX_SEGMENTS)
+        self.last_backend_ready_time = None # Czas do gotowości backendu w ostatnim uruchomieniu (sekundy)
+        self.backend_ready_times = [] # Historia czasów do gotowości z kolejnych uruchomień
+
+        self.frontend_config = {}
+        self.config_watcher = None
+        self.backend_port = BACKEND_PORT
+        self.python_executable = PYTHON_EXECUTABLE # Po sprawdzeniu środowiska: bezwzględna ścieżka interpretera
+        self.log_tag_classifier = LogTagClassifier()
+        self.health_monitor = None
+        self.process_sampler = None
+        self.metrics_server = None
+        self.zygote = None
+        self._zygote_starting = threading.Event() # Ustawione, gdy trwa wczytywanie modułów przez zygotę
+        self.spawn_timings = {"cold": [], "warm": []} # Czasy do gotowości backendu według sposobu uruchomienia
+        self.startup_tracer = None # StartupTracer bieżącego uruchomienia (None poza uruchamianiem)
+
+    # --- Punkty rozszerzeń dla interfejsów ---
+
+    def on_startup_status(self, text):
+        """Nowy etap uruchamiania (tekst dla użytkownika)."""
+
+    def on_startup_progress(self, percent):
+        """Postęp oczekiwania na backend (0-100)."""
+
+    def on_startup_failed(self, reason, message):
+        """Uruchamianie nie powiodło się; reason to jedna ze stałych START_ERROR_*."""
+
+    def on_app_running(self):
+        """Backend i (opcjonalnie) frontend zostały uruchomione."""
+
+    def on_frontend_exited(self):
+        """Proces frontendu zakończył działanie."""
+
+    def on_config_reloaded(self, changes):
+        """Config.py zmienił się w trakcie działania; changes to {klucz: (stara, nowa)}."""
+
+    def on_app_stopped(self):
+        """Wszystkie procesy zostały zamknięte."""
+
+    def on_backend_state(self, previous, sample):
+        """Monitor wykrył zmianę stanu backendu (wywoływane z wątku monitora)."""
+
+    def on_process_error(self, name, message):
+        """Nie udało się uruchomić procesu potomnego."""
+
+    def on_backend_restarting(self, attempt, delay):
+        """Nadzorca zaplanował restart backendu po awarii."""
+
+    def on_backend_restored(self, result):
+        """Backend po restarcie przeszedł bramkę gotowości."""
+
+    def on_backend_gave_up(self, message):
+        """Nadzorca wykrył pętlę awarii i przestał restartować backend."""
+
+    # --- Konfiguracja ---
+
+    def _load_frontend_config(self):
+        """Wczytuje konfigurację frontendu z pliku JSON. Rzuca ConfigError przy błędzie."""
+        self.log_message(f"Próbuję wczytać konfigurację frontendu z: {FRONTEND_CONFIG_PATH}", level="INFO", component="KONFIGURACJA")
+        if not os.path.exists(FRONTEND_CONFIG_PATH):
+            self.log_message(f"BŁĄD KRYTYCZNY: Brak pliku konfiguracyjnego frontendu: {FRONTEND_CONFIG_PATH}. Aplikacja zostanie zamknięta.", level="CRITICAL", component="KONFIGURACJA")
+            raise ConfigError("Błąd Konfiguracji", f"Brak pliku konfiguracyjnego frontendu: {FRONTEND_CONFIG_PATH}\n"
+                                                   "Upewnij się, że plik config.py istnieje i jest w formacie JSON.")
+        try:
+            with open(FRONTEND_CONFIG_PATH, 'r') as f:
+                config_data = json.load(f)
+            self.log_message("Konfiguracja frontendu wczytana pomyślnie.", level="SUCCESS", component="KONFIGURACJA")
+            return config_data
+        except json.JSONDecodeError as e:
+            self.log_message(f"BŁĄD KRYTYCZNY: Błąd parsowania JSON w config.py: {e}. Aplikacja zostanie zamknięta.", level="CRITICAL", component="KONFIGURACJA")
+            raise ConfigError("Błąd Konfiguracji", f"Błąd w pliku konfiguracyjnym frontendu (Błąd składni JSON):\n{e}\n"
+                                                   "Sprawdź format JSON w config.py.")
+        except Exception as e:
+            self.log_message(f"BŁĄD KRYTYCZNY: Nie udało się wczytać config.py: {e}. Aplikacja zostanie zamknięta.", level="CRITICAL", component="KONFIGURACJA")
+            raise ConfigError("Błąd Konfiguracji", f"Nie udało się wczytać pliku konfiguracyjnego frontendu:\n{e}")
+
+    def _save_frontend_config(self):
+        """Zapisuje bieżącą konfigurację frontendu do pliku JSON."""
+        self.log_message(f"Próbuję zapisać konfigurację frontendu do: {FRONTEND_CONFIG_PATH}", level="INFO", component="KONFIGURACJA")
+        try:
+            atomic_write_json(FRONTEND_CONFIG_PATH, self.frontend_config) # Plik tymczasowy + rename
+            if self.config_watcher is not None:
+                self.config_watcher.remember(FRONTEND_CONFIG_PATH) # Własny zapis nie jest zmianą z zewnątrz
+            self.log_message("Konfiguracja frontendu zapisana pomyślnie.", level="SUCCESS", component="KONFIGURACJA")
+            return True
+        except Exception as e:
+            self.log_message(f"BŁĄD: Nie udało się zapisać config.py: {e}", level="ERROR", component="KONFIGURACJA")
+            return False
+
+    def load_config(self):
+        """Wczytuje config.py i stosuje ustawienia zależne od niego (port, reguły tagów)."""
+        self.frontend_config = self._load_frontend_config()
+        self.log_tag_classifier = LogTagClassifier(self.frontend_config.get("LOG_TAG_RULES"))
+        self.backend_port = self.frontend_config.get("BACKEND_PORT", BACKEND_PORT)
+        self.python_executable = self.frontend_config.get("PYTHON_EXECUTABLE", PYTHON_EXECUTABLE)
+        self.set_log_level(self.frontend_config.get("LOG_LEVEL", LOG_LEVEL))
+        self.start_log_store()
+        self.start_config_watcher()
+        if self.frontend_config.get("OUTPUT_RECORDING_ENABLED", OUTPUT_RECORDING_ENABLED):
+            self.start_output_recording()
+
+    def start_config_watcher(self):
+        """Obserwuje config.py i przeładowuje zmienione ustawienia w trakcie działania."""
+        if self.config_watcher is not None or not self.frontend_config.get("CONFIG_WATCH_ENABLED", CONFIG_WATCH_ENABLED):
+            return
+        self.config_watcher = ConfigWatcher(
+            [FRONTEND_CONFIG_PATH], lambda path: self.reload_config(),
+            log=lambda message, level, *args: self.log_message(message, *args, level=level, component="KONFIGURACJA"),
+        )
+        self.config_watcher.start()
+        self.log_message("Obserwuję zmiany config.py (%s).", self.config_watcher.mode, level="DEBUG", component="KONFIGURACJA")
+
+    def stop_config_watcher(self):
+        if self.config_watcher is not None:
+            self.config_watcher.stop()
+            self.config_watcher = None
+
+    def reload_config(self):
+        """Wczytuje config.py ponownie, stosuje zmiany w launcherze i przekazuje je procesom potomnym.
+
+        Zwraca słownik zmian {klucz: (stara, nowa)}; przy błędzie składni zachowuje poprzednią konfigurację.
+        """
+        try:
+            new_config = read_json_config(FRONTEND_CONFIG_PATH)
+        except (OSError, ValueError) as e:
+            self.log_message(f"Nie przeładowano config.py: {e}. Zachowuję poprzednie ustawienia.", level="ERROR", component="KONFIGURACJA")
+            return {}
+        changes = diff_config(self.frontend_config, new_config)
+        if not changes:
+            return changes
+        self.frontend_config = new_config # Ustawienia czytane przez .get() działają od razu
+        self.log_message("Zmienione ustawienia: %s", ", ".join(sorted(changes)), level="INFO", component="KONFIGURACJA")
+
+        if "LOG_TAG_RULES" in changes:
+            self.log_tag_classifier = LogTagClassifier(new_config.get("LOG_TAG_RULES"))
+        if "LOG_LEVEL" in changes:
+            self.set_log_level(new_config.get("LOG_LEVEL", LOG_LEVEL))
+        pending = sorted(key for key in changes if key in RESTART_REQUIRED_KEYS)
+        if pending:
+            self.log_message("Zmiana %s zadziała po ponownym uruchomieniu.", ", ".join(pending), level="WARNING", component="KONFIGURACJA")
+        child_changes = {key: new for key, (_old, new) in changes.items()
+                         if key not in RESTART_REQUIRED_KEYS and key not in LAUNCHER_ONLY_KEYS}
+        if child_changes:
+            threading.Thread(target=self._push_config_to_children, args=(child_changes,), daemon=True).start()
+        self.on_config_reloaded(changes)
+        return changes
+
+    def _push_config_to_children(self, changed):
+        """Przekazuje zmienione klucze działającym workerom (HTTP) i frontendowi (sygnał), bez restartu."""
+        import http.client # Import leniwy - potrzebny tylko przy przeładowaniu
+        path = self.frontend_config.get("CONFIG_RELOAD_PATH", CONFIG_RELOAD_PATH)
+        body = json.dumps({"changed": changed})
+        for worker in list(self.backend_workers):
+            if not path or not worker.is_alive():
+                continue
+            conn = http.client.HTTPConnection("127.0.0.1", worker.port, timeout=CONFIG_RELOAD_TIMEOUT)
+            try:
+                conn.request("POST", path, body=body, headers={"Content-Type": "application/json"})
+                status = conn.getresponse().status
+            except (OSError, http.client.HTTPException) as e:
+                status = e
+            finally:
+                conn.close()
+            # Backend bez obsługi przeładowania (404/405/501) po prostu użyje nowych wartości po restarcie
+            quiet = isinstance(status, int) and (200 <= status < 300 or status in (404, 405, 501))
+            self.log_message("Powiadomienie %s o zmianie konfiguracji: %s", worker.name, status,
+                             level="DEBUG" if quiet else "WARNING", component="KONFIGURACJA")
+        frontend = self.frontend_game_process
+        if (self.frontend_config.get("FRONTEND_CONFIG_RELOAD_SIGNAL", FRONTEND_CONFIG_RELOAD_SIGNAL)
+                and hasattr(signal, "SIGHUP") and frontend is not None and frontend.poll() is None):
+            frontend.send_signal(signal.SIGHUP)
+            self.log_message("Wysłano SIGHUP do frontendu gry (przeładowanie konfiguracji).", level="DEBUG", component="KONFIGURACJA")
+
+    # --- Logi ---
+
+    def log_message(self, message, *args, level="INFO", component="LAUNCHER"):
+        """Ujednolicona funkcja do logowania wiadomości z poziomu launchera.
+
+        Wpisy poniżej minimalnego poziomu są odrzucane przed formatowaniem. Argumenty `args`
+        są wstawiane do `message` operatorem % dopiero przy wyświetleniu lub zapisie.
+        """
+        if level_priority(level) < self._min_log_priority:
+            return
+        record = LogRecord(level, component, message, args)
+        self.log_queue.put(record) # Dodaj do kolejki logów
+        self.log_store.append(record)
+
+    def set_log_level(self, level):
+        """Zmienia minimalny poziom logów w trakcie działania. Zwraca False dla nieznanego poziomu."""
+        level = str(level).upper()
+        if level not in LOG_LEVEL_PRIORITIES:
+            self.log_message("Nieznany poziom logów: %s", level, level="WARNING", component="LOGI")
+            return False
+        self.log_level = level
+        self._min_log_priority = LOG_LEVEL_PRIORITIES[level]
+        return True
+
+    def start_log_store(self):
+        """Uruchamia zapis logów na dysk (linie zalogowane wcześniej również trafią do magazynu)."""
+        if not self.frontend_config.get("LOG_STORE_ENABLED", LOG_STORE_ENABLED):
+            self.log_store.disable()
+            return
+        try:
+            self.log_store.start()
+        except OSError as e:
+            self.log_store.disable()
+            self.log_message(f"Nie udało się otworzyć magazynu logów {LOG_STORE_DIR}: {e}", level="WARNING", component="LOGI")
+
+    def _get_log_tag(self, line):
+        """Pomocnicza funkcja do określania tagu na podstawie zawartości linii logu."""
+        return self.log_tag_classifier.classify(line)
+
+    # --- Nagrywanie i odtwarzanie wyjścia procesów ---
+
+    def start_output_recording(self, path=None):
+        """Zapisuje surowe wyjście procesów potomnych ze znacznikami czasu do pliku sesji (domyślnie w RECORDINGS_DIR)."""
+        if self.output_reader.recorder is not None:
+            return
+        try:
+            if path is None:
+                os.makedirs(RECORDINGS_DIR, exist_ok=True)
+                path = os.path.join(RECORDINGS_DIR, datetime.now().strftime("session-%Y%m%d-%H%M%S.ggrec"))
+                self.output_reader.recorder = SessionRecorder(path)
+                self._prune_recordings()
+            else:
+                self.output_reader.recorder = SessionRecorder(path)
+        except OSError as e:
+            self.log_message(f"Nie udało się rozpocząć nagrywania wyjścia procesów: {e}", level="WARNING", component="NAGRYWANIE")
+            return
+        self.log_message("Nagrywam wyjście procesów do %s.", path, level="INFO", component="NAGRYWANIE")
+
+    def stop_output_recording(self):
+        recorder = self.output_reader.recorder
+        if recorder is None:
+            return
+        self.output_reader.recorder = None
+        recorder.close()
+        self.log_message("Zapisano sesję wyjścia procesów %s (%d bajtów wyjścia).", recorder.path, recorder.bytes,
+                         level="INFO", component="NAGRYWANIE")
+
+    def _prune_recordings(self):
+        sessions = sorted(name for name in os.listdir(RECORDINGS_DIR) if name.startswith("session-") and name.endswith(".ggrec"))
+        for name in sessions[:-RECORDINGS_KEEP_FILES]:
+            os.remove(os.path.join(RECORDINGS_DIR, name))
+
+    def log_sink_stats(self):
+        """Liczniki ujścia logów interfejsu (GUI: LogSink.stats()); tryb bezgłowy niczego nie pomija."""
+        return {}
+
+    def replay_output(self, path, speed=1.0, cancel_event=None):
+        """Odtwarza nagraną sesję przez czytnik wyjścia i całą ścieżkę logów, bez uruchamiania procesów.
+
+        speed: 1 - czas rzeczywisty, N - N razy szybciej, None lub 0 - bez przerw. Zwraca podsumowanie
+        z ReplayStats.summary(). Rzuca RuntimeError, gdy gra działa, a OSError/ValueError przy złym pliku.
+        """
+        if self.is_backend_running() or self.frontend_game_process is not None:
+            raise RuntimeError("Odtwarzanie sesji wymaga zatrzymanej gry.")
+        replayer = SessionReplayer(path, self.output_reader, speed)
+        stats = replayer.stats
+        dropped_before = self.log_sink_stats().get("dropped", 0)
+        bytes_before = sum(c["bytes"] for c in self.output_reader.stats().values())
+        errors = []
+
+        def feed():
+            try:
+                replayer.feed()
+            except (OSError, ValueError) as e:
+                errors.append(e)
+
+        recorder, self.output_reader.recorder = self.output_reader.recorder, None # Nie nagrywamy odtwarzanej sesji
+        # Linie sesji dostałyby bieżący czas - nie mogą trafić do historii logów jako dzisiejsze
+        self.store_process_output = False
+        self.log_queue.observer = stats
+        started = time.monotonic()
+        feeder = threading.Thread(target=feed, name="SessionReplayer", daemon=True)
+        feeder.start()
+        try:
+            while feeder.is_alive():
+                if cancel_event is not None and cancel_event.is_set():
+                    replayer.stop()
+                stats.sample_depth()
+                feeder.join(REPLAY_SAMPLE_INTERVAL)
+            # Koniec, gdy czytnik przetworzył wszystkie podane bajty, a ujście opróżniło kolejkę (dwie próbki z rzędu)
+            deadline = time.monotonic() + REPLAY_DRAIN_TIMEOUT
+            settled = 0
+            while settled < 2 and time.monotonic() < deadline and not (cancel_event is not None and cancel_event.is_set()):
+                read = sum(c["bytes"] for c in self.output_reader.stats().values()) - bytes_before
+                settled = settled + 1 if read >= stats.fed_bytes and stats.depth <= 0 else 0
+                stats.sample_depth()
+                time.sleep(REPLAY_SAMPLE_INTERVAL)
+            stats.elapsed = time.monotonic() - started
+        finally:
+            self.log_queue.observer = None
+            self.output_reader.recorder = recorder
+            self.store_process_output = True
+        if errors:
+            raise errors[0]
+        return stats.summary(self.log_sink_stats().get("dropped", 0) - dropped_before)
+
+    def log_replay_summary(self, summary, level="SUCCESS"):
+        latency, depth = summary["latency_ms"], summary["queue_depth"]
+        self.log_message("Odtworzono %d linii w %.3fs (%.0f linii/s). Kolejka: maks. %d, p95 %d linii. "
+                         "Opóźnienie linii: p50 %s ms, p95 %s ms, p99 %s ms, maks. %s ms. Pominięte przez ujście: %d, "
+                         "odfiltrowane: %d, maks. spóźnienie podawania: %.3fs.",
+                         summary["lines"], summary["elapsed"], summary["throughput"], depth["max"], depth["p95"],
+                         latency["p50"], latency["p95"], latency["p99"], latency["max"], summary["dropped"],
+                         summary["filtered"], summary["max_feed_lag"], level=level, component="ODTWARZANIE")
+
+    # --- Test obciążenia ---
+
+    def create_load_test(self, routes=None, clients=None, rate=None, duration=None):
+        """Tworzy (bez uruchamiania) generator obciążenia lokalnego backendu; brakujące parametry z config.py.
+
+        Rzuca RuntimeError, gdy backend gry nie działa.
+        """
+        if not self.is_backend_running():
+            raise RuntimeError("Backend gry nie działa - uruchom go przed testem obciążenia.")
+        config = self.frontend_config
+        return LoadGenerator(
+            self.backend_port,
+            routes=routes or config.get("LOAD_TEST_ROUTES", LOAD_TEST_ROUTES),
+            clients=clients or config.get("LOAD_TEST_CLIENTS", LOAD_TEST_CLIENTS),
+            rate=rate if rate is not None else config.get("LOAD_TEST_RATE", LOAD_TEST_RATE),
+            duration=duration or config.get("LOAD_TEST_DURATION", LOAD_TEST_DURATION),
+            timeout=LOAD_TEST_TIMEOUT,
+        )
+
+    def log_load_test_snapshot(self, snapshot, level="INFO"):
+        latency = snapshot["latency_ms"]
+        self.log_message("%d żądań (%.1f/s), błędy: %d, p50 %s ms, p95 %s ms, p99 %s ms, max %s ms.",
+                         snapshot["requests"], snapshot["throughput"], snapshot["errors"],
+                         latency["p50"], latency["p95"], latency["p99"], latency["max"],
+                         level=level, component="TEST_OBCIĄŻENIA")
+
+    # --- Monitoring ---
+
+    def start_health_monitor(self):
+        """Uruchamia monitor backendu w tle; zmiany stanu trafiają do on_backend_state."""
+        self.health_monitor = HealthMonitor(
+            self.backend_port, self.is_backend_running,
+            interval=CONNECTION_CHECK_INTERVAL / 1000,
+            health_path=self.frontend_config.get("BACKEND_HEALTH_PATH", BACKEND_HEALTH_PATH),
+            on_transition=self.on_backend_state,
+            log=lambda message, level, *args: self.log_message(message, *args, level=level, component="MONITORING"),
+        )
+        self.health_monitor.start()
+
+    def _metrics_targets(self):
+        """Procesy próbkowane przez ProcessSampler: launcher, działające workery i frontend."""
+        targets = {"launcher": os.getpid()}
+        for worker in self.backend_workers:
+            if worker.is_alive():
+                targets[worker.name] = worker.process.pid
+        frontend = self.frontend_game_process
+        if frontend is not None and frontend.poll() is None:
+            targets["frontend gry"] = frontend.pid
+        if self.zygote is not None and self.zygote.alive:
+            targets["zygota"] = self.zygote.process.pid
+        return targets
+
+    def start_process_metrics(self):
+        """Uruchamia próbkowanie procesów z /proc i, jeśli ustawiono METRICS_PORT, endpoint /metrics."""
+        self.process_sampler = ProcessSampler(self._metrics_targets, interval=METRICS_SAMPLE_INTERVAL,
+                                              history_size=METRICS_HISTORY_SIZE)
+        self.process_sampler.start()
+        port = self.frontend_config.get("METRICS_PORT", METRICS_PORT)
+        if port is None:
+            return
+        self.metrics_server = MetricsServer(self.process_sampler, int(port))
+        try:
+            self.metrics_server.start()
+            self.log_message(f"Metryki procesów dostępne pod http://127.0.0.1:{port}/metrics", level="INFO", component="MONITORING")
+        except OSError as e:
+            self.metrics_server = None
+            self.log_message(f"Nie udało się uruchomić endpointu metryk na porcie {port}: {e}", level="WARNING", component="MONITORING")
+
+    def stop_process_metrics(self):
+        if self.metrics_server is not None:
+            self.metrics_server.stop()
+            self.metrics_server = None
+        if self.process_sampler is not None:
+            self.process_sampler.stop()
+
+    # --- Zygota ---
+
+    def start_zygote(self):
+        """Uruchamia zygotę w tle, jeśli włączono ją w config.py; do czasu gotowości procesy startują na zimno."""
+        if not self.frontend_config.get("ZYGOTE_ENABLED", ZYGOTE_ENABLED):
+            return
+        if not zygote_supported():
+            self.log_message("Zygota niedostępna w tym systemie - procesy będą uruchamiane na zimno.", level="WARNING", component="ZYGOTA")
+            return
+        self._zygote_starting.set()
+        threading.Thread(target=self._run_zygote, daemon=True).start()
+
+    def _run_zygote(self):
+        zygote = ZygoteClient(
+            self.python_executable, self.frontend_config.get("ZYGOTE_PRELOAD_MODULES", ZYGOTE_PRELOAD_MODULES),
+            log=lambda message, level: self.log_message(message, level=level, component="ZYGOTA"),
+        )
+        try:
+            zygote.start(stdout=subprocess.PIPE)
+            self.output_reader.add("zygota", zygote.process.stdout)
+            self.zygote = zygote
+            self.log_message(f"Zygota gotowa po {zygote.preload_time:.3f}s (moduły: {', '.join(zygote.loaded_modules) or 'brak'}).",
+                             level="SUCCESS", component="ZYGOTA")
+        except (OSError, RuntimeError) as e:
+            self.log_message(f"Nie udało się uruchomić zygoty: {e}", level="WARNING", component="ZYGOTA")
+        finally:
+            self._zygote_starting.clear()
+
+    def stop_zygote(self):
+        if self.zygote is not None:
+            self.zygote.stop()
+            self.zygote = None
+
+    def _wait_for_zygote(self):
+        """Przy pierwszym uruchomieniu czeka, aż zygota wczyta moduły, aby backend wystartował już na ciepło."""
+        deadline = time.monotonic() + ZYGOTE_START_TIMEOUT
+        while self._zygote_starting.is_set() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    # --- Pula workerów backendu ---
+
+    @property
+    def backend_game_process(self):
+        """Proces pierwszego workera backendu (jedyny, gdy pula ma jeden worker)."""
+        return self.backend_workers[0].process if self.backend_workers else None
+
+    def is_backend_running(self):
+        """Czy działa przynajmniej jeden worker backendu gry."""
+        return any(worker.is_alive() for worker in self.backend_workers)
+
+    def _backend_worker_count(self):
+        """Liczba workerów z BACKEND_WORKERS w config.py (domyślnie liczba rdzeni CPU)."""
+        count = self.frontend_config.get("BACKEND_WORKERS", BACKEND_WORKERS)
+        if count is None:
+            count = os.cpu_count() or 1
+        return max(1, int(count))
+
+    def _create_backend_workers(self):
+        """Tworzy opis workerów. Jeden worker słucha wprost na porcie gry, kilka - na kolejnych portach za proxy."""
+        count = self._backend_worker_count()
+        if count == 1:
+            return [BackendWorker(0, self.backend_port, "backend gry")]
+        return [BackendWorker(i, self.backend_port + 1 + i, f"backend gry {i + 1}") for i in range(count)]
+
+    def _spawn_worker(self, worker):
+        """Uruchamia proces workera backendu gry na jego porcie (lub z przekazanym gniazdem nasłuchu)."""
+        env = {"FLASK_APP": BACKEND_APP_SCRIPT_NAME, "FLASK_RUN_PORT": str(worker.port)}
+        pass_fds = ()
+        if worker.listen_socket is not None:
+            env.update(activation_env(worker.listen_socket))
+            pass_fds = (worker.listen_socket.fileno(),)
+        worker.output_baseline = self.output_reader.stats().get(worker.name, {}).get("bytes", 0)
+        worker.process = self._launch_process(
+            worker.name,
+            os.path.join(BACKEND_DIR, BACKEND_APP_SCRIPT_NAME),
+            cwd=BACKEND_DIR,
+            env=env,
+            pass_fds=pass_fds,
+        )
+        return worker.process
+
+    def _socket_activation_enabled(self):
+        return bool(self.frontend_config.get("BACKEND_SOCKET_ACTIVATION", BACKEND_SOCKET_ACTIVATION))
+
+    def _bind_worker_sockets(self, workers):
+        """Wiąże porty workerów w launcherze. Połączenia czekają w kolejce jądra, zanim backend je przyjmie."""
+        for worker in workers:
+            try:
+                worker.listen_socket = create_listen_socket(worker.port)
+            except OSError as e:
+                self.log_message(f"Błąd: Nie udało się związać portu {worker.port}: {e}", level="ERROR", component="URUCHAMIANIE")
+                self._close_worker_sockets(workers)
+                return False
+        self.log_message("Aktywacja gniazd: porty %s związane przez launcher.", ", ".join(str(w.port) for w in workers),
+                         level="DEBUG", component="URUCHAMIANIE")
+        return True
+
+    def _close_worker_sockets(self, workers):
+        for worker in workers:
+            if worker.listen_socket is not None:
+                worker.listen_socket.close()
+                worker.listen_socket = None
+
+    def _start_backend_pool(self):
+        """Sprawdza porty, uruchamia workery i czeka na ich gotowość. Zwraca True przy sukcesie."""
+        workers = self._create_backend_workers()
+        ports = [self.backend_port] + [w.port for w in workers if w.port != self.backend_port]
+
+        # --- Sprawdzenie portów gry ---
+        self.on_startup_status(f"Sprawdzam dostępność portu gry ({self.backend_port})...")
+        with self._trace_span(PHASE_PORT_CHECK, ports=len(ports)):
+            activation = self._socket_activation_enabled()
+            if activation and not self._bind_worker_sockets(workers):
+                self.on_startup_failed(START_ERROR_PORT_BUSY, f"Nie udało się związać portów {', '.join(str(w.port) for w in workers)}. Zmień port w config.py i uruchom ponownie.")
+                return False
+            bound = {w.port for w in workers if w.listen_socket is not None}
+            for port in ports:
+                if port in bound:
+                    continue # Port workera jest już związany przez launcher
+                if not self.is_port_available(port):
+                    self._close_worker_sockets(workers)
+                    self.log_message(f"Błąd: Port {port} zajęty.", level="ERROR", component="URUCHAMIANIE")
+                    self.on_startup_failed(START_ERROR_PORT_BUSY, f"Port {port} jest już używany. Zmień port w config.py i uruchom ponownie.")
+                    return False
+        self.log_message("Porty %s dostępne.", ", ".join(map(str, ports)), level="DEBUG", component="URUCHAMIANIE")
+
+        # --- Uruchomienie Backendu Gry ---
+        self.on_startup_status("Uruchamiam backend gry..." if len(workers) == 1 else f"Uruchamiam {len(workers)} workerów backendu gry...")
+        self.backend_workers = workers
+        tracer = self.startup_tracer
+        with self._trace_span(PHASE_BACKEND_SPAWN, workers=len(workers)):
+            for worker in workers:
+                if tracer:
+                    tracer.mark("backend_spawn")
+                    tracer.process_spawned(worker.name, PHASE_BACKEND_FIRST_OUTPUT, time.monotonic())
+                with self._trace_span(f"uruchomienie: {worker.name}", phase=False):
+                    process = self._spawn_worker(worker)
+                if process is None: # Sprawdzenie, czy proces w ogóle wystartował
+                    self.on_startup_failed(START_ERROR_SPAWN_FAILED, f"Proces {worker.name} nie uruchomił się, proces zwrócił None.")
+                    return False
+
+        self.log_message(f"Czekam maks. {BACKEND_STARTUP_TIMEOUT}s na gotowość backendu gry...", level="INFO", component="URUCHAMIANIE")
+        self.on_startup_status("Czekam na gotowość backendu gry...")
+        start = time.monotonic()
+        deadline = start + BACKEND_STARTUP_TIMEOUT # Jeden limit dla całej puli, nie dla każdego workera osobno
+        for worker in workers: # Workery startują równolegle, więc łączny czas to czas najwolniejszego
+            with self._trace_span(f"gotowość: {worker.name}", phase=False, port=worker.port):
+                result = self._wait_for_backend_ready(worker.process, port=worker.port, worker=worker,
+                                                      timeout=max(0.0, deadline - time.monotonic()),
+                                                      on_attempt=self._trace_probe_attempt(worker) if tracer else None)
+            if not result.ready:
+                if result.status == EXITED:
+                    self.on_startup_failed(START_ERROR_BACKEND_EXITED, f"Proces {worker.name} zakończył działanie przed gotowością (kod wyjścia: {result.exit_code}). Sprawdź jego logi.")
+                else:
+                    self.on_startup_failed(START_ERROR_BACKEND_TIMEOUT, f"Proces {worker.name} nie był gotowy na porcie {worker.port} w ciągu {BACKEND_STARTUP_TIMEOUT}s. {result.detail}")
+                return False
+        elapsed = time.monotonic() - start
+        if tracer:
+            tracer.add_span(PHASE_BACKEND_READY, start, start + elapsed, workers=len(workers))
+
+        if len(workers) > 1:
+            self.backend_proxy = LoadBalancingProxy(
+                self.backend_port, [w.port for w in workers],
+                log=lambda message, level: self.log_message(message, level=level, component="PROXY"),
+            )
+            try:
+                self.backend_proxy.start()
+            except OSError as e:
+                self.backend_proxy = None
+                self.on_startup_failed(START_ERROR_PORT_BUSY, f"Nie udało się uruchomić proxy na porcie {self.backend_port}: {e}")
+                return False
+            self.log_message(f"Proxy na porcie {self.backend_port} rozdziela ruch między {len(workers)} workerów.", level="INFO", component="URUCHAMIANIE")
+
+        self.last_backend_ready_time = elapsed
+        self.backend_ready_times.append(elapsed)
+        warm = all(getattr(w.process, "from_zygote", False) for w in workers)
+        self.spawn_timings["warm" if warm else "cold"].append(elapsed)
+        self.log_message(f"Backend gry gotowy na porcie {self.backend_port} po {elapsed:.3f}s (start {'ciepły, z zygoty' if warm else 'zimny'}).", level="SUCCESS", component="URUCHAMIANIE")
+        return True
+
+    # --- Uruchamianie ---
+
+    def _start_app_logic(self, launch_frontend=True):
+        """Logika uruchamiania backendu i frontendu. Zwraca True, jeśli wszystko wystartowało."""
+        self.log_message("Rozpoczynam logikę uruchamiania...", level="DEBUG", component="URUCHAMIANIE")
+
+        if self.frontend_config.get("STARTUP_TRACE_ENABLED", STARTUP_TRACE_ENABLED):
+            self.startup_tracer = StartupTracer()
+
+        if not self._run_preflight(launch_frontend):
+            self._finish_startup_trace(False)
+            return False
+        self._wait_for_zygote()
+        if not self._start_backend_pool():
+            self._finish_startup_trace(False)
+            return False
+        self.start_backend_supervisor()
+        self._warm_up_backend()
+
+        if not launch_frontend:
+            self.on_app_running()
+            self._finish_startup_trace(True)
+            return True
+
+        # --- Uruchomienie Frontendu Gry ---
+        self.on_startup_status("Uruchamiam frontend gry...")
+        if self.startup_tracer:
+            self.startup_tracer.process_spawned("frontend gry", PHASE_FRONTEND_FIRST_OUTPUT, time.monotonic())
+        with self._trace_span(PHASE_FRONTEND_SPAWN):
+            self.frontend_game_process = self._launch_process(
+                "frontend gry",
+                os.path.join(BASE_DIR, FRONTEND_SCRIPT_NAME),
+                cwd=BASE_DIR
+            )
+        if self.frontend_game_process is None: # Sprawdzenie, czy proces w ogóle wystartował
+            self.on_startup_failed(START_ERROR_SPAWN_FAILED, "Frontend gry nie uruchomił się, proces zwrócił None.")
+            self._finish_startup_trace(False)
+            return False
+        self.log_message("Frontend gry uruchomiony. Zamknij okno gry, aby zakończyć działanie backendów.", level="INFO", component="URUCHAMIANIE")
+        self.on_app_running()
+        if self.startup_tracer:
+            # Faza pierwszego wyjścia frontendu kończy się w wątku czytnika - czekamy na nią przed zapisem śladu
+            self.startup_tracer.wait_for_phase(PHASE_FRONTEND_FIRST_OUTPUT, TRACE_FIRST_OUTPUT_TIMEOUT)
+            self._finish_startup_trace(True)
+
+        # Czekaj na zamknięcie frontendu i następnie zatrzymaj wszystko
+        self.log_message("Oczekiwanie na zamknięcie okna gry...", level="DEBUG", component="URUCHAMIANIE")
+        self.frontend_game_process.wait()
+        self.log_message("Frontend został zamknięty.", level="INFO", component="URUCHAMIANIE")
+        self.on_frontend_exited()
+        return True
+
+    # --- Rozgrzewanie backendu ---
+
+    def _warm_up_backend(self):
+        """Odpytuje ścieżki z WARMUP_ROUTES i wczytuje zasoby do pamięci podręcznej stron przed wpuszczeniem graczy.
+
+        Błędy rozgrzewania nie przerywają uruchamiania - są tylko zgłaszane w logach.
+        """
+        routes = self.frontend_config.get("WARMUP_ROUTES", WARMUP_ROUTES) or []
+        preload = self.frontend_config.get("WARMUP_PRELOAD_ASSETS", WARMUP_PRELOAD_ASSETS) and os.path.isdir(BACKEND_DIR)
+        if not routes and not preload:
+            return
+        self.on_startup_status("Rozgrzewam backend gry...")
+        paths = [os.path.join(BACKEND_DIR, relpath) for relpath in sorted(scan_assets(BACKEND_DIR))] if preload else []
+        warmup = BackendWarmup(
+            [w.port for w in self.backend_workers], routes,
+            concurrency=self.frontend_config.get("WARMUP_CONCURRENCY", WARMUP_CONCURRENCY),
+            timeout=self.frontend_config.get("WARMUP_TIMEOUT", WARMUP_TIMEOUT),
+            preload_paths=paths,
+            preload_max_bytes=self.frontend_config.get("WARMUP_PRELOAD_MAX_MB", WARMUP_PRELOAD_MAX_MB) * 1024 * 1024,
+        )
+        with self._trace_span(PHASE_WARMUP, routes=len(routes), files=len(paths)):
+            result = warmup.run()
+
+        summary = result.latency_summary()
+        if summary["cold"] and summary["warm"]:
+            (cold_p50, cold_max), (warm_p50, warm_max) = summary["cold"], summary["warm"]
+            self.log_message("Pierwsze żądanie przed rozgrzaniem: p50 %.1f ms, maks. %.1f ms; po rozgrzaniu: p50 %.1f ms, maks. %.1f ms.",
+                             cold_p50 * 1000, cold_max * 1000, warm_p50 * 1000, warm_max * 1000,
+                             level="INFO", component="ROZGRZEWANIE")
+        for timing in sorted((t for t in result.timings if t.cold is not None and t.warm is not None),
+                             key=lambda t: t.cold, reverse=True):
+            self.log_message("%s (port %s): %s, %.1f ms -> %.1f ms", timing.route, timing.port, timing.status,
+                             timing.cold * 1000, timing.warm * 1000, level="DEBUG", component="ROZGRZEWANIE")
+        for timing in result.failed():
+            self.log_message(f"Rozgrzewanie {timing.route} na porcie {timing.port} nie powiodło się: {timing.status}",
+                             level="WARNING", component="ROZGRZEWANIE")
+        if result.preloaded_files:
+            self.log_message("Wczytano %d plików zasobów (%.1f MB, %s) do pamięci podręcznej stron.", result.preloaded_files,
+                             result.preloaded_bytes / (1024 * 1024), result.preload_mode, level="DEBUG", component="ROZGRZEWANIE")
+        self.log_message("Rozgrzewanie backendu zakończone w %.3fs.", result.elapsed, level="SUCCESS", component="ROZGRZEWANIE")
+
+    # --- Sprawdzenie środowiska ---
+
+    def _run_preflight(self, launch_frontend=True):
+        """Sprawdza interpreter, importy skryptów, miejsce na dysku i zasoby gry. Zwraca True przy sukcesie.
+
+        Importy sprawdzane są równolegle w procesach docelowego interpretera, a udany wynik trafia do
+        pamięci podręcznej, więc kolejne uruchomienia bez zmian go pomijają. Zasoby weryfikowane są
+        w tym samym czasie w osobnym wątku. Porty sprawdzane są zawsze od nowa, tuż przed
+        uruchomieniem backendu.
+        """
+        check_environment = self.frontend_config.get("PREFLIGHT_ENABLED", PREFLIGHT_ENABLED)
+        check_assets = self.frontend_config.get("ASSET_VERIFY_ENABLED", ASSET_VERIFY_ENABLED) and os.path.isdir(BACKEND_DIR)
+        if not check_environment and not check_assets:
+            return True
+        self.on_startup_status("Sprawdzam środowisko...")
+        problems = []
+        with self._trace_span(PHASE_PREFLIGHT), ThreadPoolExecutor(max_workers=1) as pool:
+            assets = pool.submit(self._verify_assets) if check_assets else None
+            if check_environment:
+                problems.extend(self._check_environment(launch_frontend))
+            if assets is not None:
+                problems.extend(assets.result())
+        if problems:
+            for problem in problems:
+                self.log_message(problem, level="ERROR", component="URUCHAMIANIE")
+            self.on_startup_failed(START_ERROR_PREFLIGHT, "Środowisko nie jest gotowe do uruchomienia gry:\n" + "\n".join(problems))
+            return False
+        return True
+
+    def _check_environment(self, launch_frontend):
+        """Interpreter, importy skryptów i dysk. Zwraca listę problemów."""
+        scripts = {"backend gry": os.path.join(BACKEND_DIR, BACKEND_APP_SCRIPT_NAME)}
+        if launch_frontend:
+            scripts["frontend gry"] = os.path.join(BASE_DIR, FRONTEND_SCRIPT_NAME)
+        preflight = Preflight(self.frontend_config.get("PYTHON_EXECUTABLE", PYTHON_EXECUTABLE), scripts,
+                              PREFLIGHT_CACHE_PATH, manifests=PREFLIGHT_MANIFESTS)
+        result = preflight.run()
+        problems = list(result.problems)
+        disk_problem = check_disk(os.path.dirname(LOG_STORE_DIR),
+                                  self.frontend_config.get("PREFLIGHT_MIN_FREE_MB", PREFLIGHT_MIN_FREE_MB) * 1024 * 1024)
+        if disk_problem:
+            problems.append(disk_problem)
+        if result.ok:
+            self.python_executable = result.interpreter
+            self.log_message("Środowisko sprawdzone w %.3fs%s: %s (Python %s).", result.elapsed,
+                             " (z pamięci podręcznej)" if result.cached else "", result.interpreter, result.python_version,
+                             level="DEBUG", component="URUCHAMIANIE")
+        return problems
+
+    def _verify_assets(self):
+        """Aktualizuje manifest zasobów gry i zgłasza zmiany. Zwraca listę problemów (tylko w trybie ścisłym)."""
+        try:
+            report = AssetManifest(BACKEND_DIR, ASSET_MANIFEST_PATH).verify()
+        except OSError as e:
+            self.log_message(f"Nie udało się zweryfikować zasobów gry: {e}", level="WARNING", component="ZASOBY")
+            return []
+        self.log_message("Zasoby gry: %d plików, przeliczono %d%s w %.3fs.", report.total, report.hashed,
+                         " (pula procesów)" if report.pooled else "", report.elapsed, level="DEBUG", component="ZASOBY")
+        if report.created:
+            self.log_message("Utworzono manifest zasobów gry (%d plików).", report.total, level="INFO", component="ZASOBY")
+        elif report.added or report.modified:
+            self.log_message("Zasoby gry: %d nowych, %d zmienionych plików.", len(report.added), len(report.modified),
+                             level="INFO", component="ZASOBY")
+        if report.missing:
+            self.log_message(f"Brakuje {len(report.missing)} plików zasobów gry: {self._format_asset_list(report.missing)}",
+                             level="WARNING", component="ZASOBY")
+        if not report.corrupt:
+            return []
+        message = f"Uszkodzone pliki zasobów gry ({len(report.corrupt)}): " + \
+            self._format_asset_list([f"{path} ({problem})" for path, problem in report.corrupt])
+        if self.frontend_config.get("ASSET_VERIFY_STRICT", ASSET_VERIFY_STRICT):
+            return [message]
+        self.log_message(message, level="WARNING", component="ZASOBY")
+        return []
+
+    @staticmethod
+    def _format_asset_list(items):
+        shown = ", ".join(items[:ASSET_REPORT_LIMIT])
+        return shown if len(items) <= ASSET_REPORT_LIMIT else f"{shown} i {len(items) - ASSET_REPORT_LIMIT} innych"
+
+    # --- Ślad uruchamiania ---
+
+    def _trace_span(self, name, phase=True, **args):
+        tracer = self.startup_tracer
+        return tracer.span(name, phase=phase, **args) if tracer else nullcontext()
+
+    def _trace_probe_attempt(self, worker):
+        """Callback on_attempt sondy gotowości: każda próba jako zdarzenie szczegółowe śladu."""
+        tracer = self.startup_tracer
+
+        def on_attempt(start, end, port_open, status):
+            tracer.add_span("próba sondy", start, end, phase=False, worker=worker.name, port_open=port_open, status=status)
+            if status == 200:
+                tracer.since_mark(PHASE_FIRST_HEALTHY_PROBE, "backend_spawn")
+        return on_attempt
+
+    def _finish_startup_trace(self, success):
+        """Zapisuje ślad uruchomienia i (po udanym starcie) loguje p50/p95 faz z ostatnich uruchomień."""
+        tracer, self.startup_tracer = self.startup_tracer, None
+        if tracer is None:
+            return
+        if success:
+            tracer.add_span(PHASE_TOTAL, tracer.origin, time.monotonic())
+        else:
+            tracer.instant("uruchomienie nieudane")
+        try:
+            os.makedirs(TRACE_DIR, exist_ok=True)
+            path = os.path.join(TRACE_DIR, datetime.fromtimestamp(tracer.started_at).strftime("launch-%Y%m%d-%H%M%S.json"))
+            tracer.write(path)
+            self._prune_trace_files()
+            if not success:
+                self.log_message("Ślad nieudanego uruchomienia zapisany w %s.", path, level="DEBUG", component="URUCHAMIANIE")
+                return
+            history = PhaseHistory(os.path.join(TRACE_DIR, "summary.json"), size=TRACE_HISTORY_SIZE)
+            history.add(tracer.phases)
+            history.save()
+        except OSError as e:
+            self.log_message(f"Nie udało się zapisać śladu uruchamiania: {e}", level="WARNING", component="URUCHAMIANIE")
+            return
+        self.log_message("Ślad uruchamiania zapisany w %s.", path, level="INFO", component="URUCHAMIANIE")
+        summary = history.summary()
+        for phase, (p50, p95, count) in summary.items():
+            current = tracer.phases.get(phase)
+            self.log_message("Faza '%s': teraz %s, p50 %.3fs, p95 %.3fs (z %d uruchomień).", phase,
+                             "-" if current is None else f"{current:.3f}s", p50, p95, count,
+                             level="INFO", component="URUCHAMIANIE")
+
+    def _prune_trace_files(self):
+        traces = sorted(name for name in os.listdir(TRACE_DIR) if name.startswith("launch-") and name.endswith(".json"))
+        for name in traces[:-TRACE_KEEP_FILES]:
+            os.remove(os.path.join(TRACE_DIR, name))
+
+    def start_backend_supervisor(self):
+        """Włącza nadzór każdego workera (restart po awarii), jeśli nie wyłączono go w config.py."""
+        if not self.frontend_config.get("BACKEND_AUTO_RESTART", BACKEND_AUTO_RESTART):
+            return
+        policy = RestartPolicy(
+            initial_backoff=RESTART_INITIAL_BACKOFF,
+            max_backoff=RESTART_MAX_BACKOFF,
+            crash_loop_window=CRASH_LOOP_WINDOW,
+            crash_loop_max_restarts=CRASH_LOOP_MAX_RESTARTS,
+        )
+        for worker in self.backend_workers:
+            worker.supervisor = BackendSupervisor(
+                lambda worker=worker: worker.process,
+                spawn=lambda worker=worker: self._spawn_worker(worker),
+                wait_ready=lambda process, cancel_event, worker=worker: self._wait_for_backend_ready(
+                    process, port=worker.port, worker=worker, report_progress=False, cancel_event=cancel_event),
+                terminate=lambda process, worker=worker: self.terminate_process(process, worker.name),
+                policy=policy,
+                on_crash=lambda exit_code, worker=worker: self._on_worker_crash(worker),
+                on_restarting=self.on_backend_restarting,
+                on_restored=lambda result, worker=worker: self._on_worker_restored(worker, result),
+                on_gave_up=lambda message, worker=worker: self._on_worker_gave_up(worker, message),
+                log=lambda message, level, worker=worker: self.log_message(f"[{worker.name}] {message}", level=level, component="NADZÓR"),
+            )
+            worker.supervisor.start()
+
+    def stop_backend_supervisor(self):
+        for worker in self.backend_workers:
+            if worker.supervisor is not None:
+                worker.supervisor.stop()
+
+    def _on_worker_crash(self, worker):
+        if self.backend_proxy is not None:
+            self.backend_proxy.set_alive(worker.port, False)
+
+    def _on_worker_restored(self, worker, result):
+        if self.backend_proxy is not None:
+            self.backend_proxy.set_alive(worker.port, True) # Do rotacji wraca dopiero po bramce gotowości
+        self.on_backend_restored(result)
+
+    def _on_worker_gave_up(self, worker, message):
+        # Reszta puli nadal obsługuje ruch; poddajemy się dopiero, gdy nie działa żaden worker
+        if not self.is_backend_running():
+            self.on_backend_gave_up(message)
+
+    def backend_restart_count(self):
+        """Łączna liczba restartów wszystkich workerów."""
+        return sum(w.supervisor.restarts for w in self.backend_workers if w.supervisor is not None)
+
+    def time_since_last_backend_restart(self):
+        """Sekundy od ostatniego restartu dowolnego workera lub None."""
+        times = [w.supervisor.time_since_last_restart() for w in self.backend_workers if w.supervisor is not None]
+        times = [t for t in times if t is not None]
+        return min(times) if times else None
+
+    def _wait_for_backend_ready(self, process, port=None, worker=None, timeout=BACKEND_STARTUP_TIMEOUT, report_progress=True,
+                                cancel_event=None, on_attempt=None):
+        """Sonduje port i ścieżkę zdrowia backendu, raportując postęp przez on_startup_progress.
+
+        `timeout` to czas pozostały z limitu BACKEND_STARTUP_TIMEOUT - postęp liczony jest względem całego limitu.
+
+        Port związany przez launcher (aktywacja gniazd) przyjmuje połączenia od razu, więc zamiast
+        sprawdzenia portu czekamy na pierwsze wyjście workera, a GET ma krótki limit czasu.
+        """
+        options = {}
+        if worker is not None and worker.listen_socket is not None:
+            options["port_check"] = lambda: self.output_reader.stats().get(worker.name, {}).get("bytes", 0) > worker.output_baseline
+            options["probe_timeout"] = READINESS_ACTIVATION_PROBE_TIMEOUT
+        probe = ReadinessProbe(
+            port or self.backend_port,
+            health_path=self.frontend_config.get("BACKEND_HEALTH_PATH", BACKEND_HEALTH_PATH),
+            deadline=timeout,
+            initial_interval=READINESS_INITIAL_INTERVAL,
+            max_interval=READINESS_MAX_INTERVAL,
+            **options,
+        )
+
+        def on_progress(elapsed, deadline):
+            spent = BACKEND_STARTUP_TIMEOUT - deadline + elapsed # Łącznie z czasem poprzednich workerów
+            self.on_startup_progress(min(100, spent * 100 / BACKEND_STARTUP_TIMEOUT))
+
+        def log(message, level, *args):
+            self.log_message(message, *args, level=level, component="URUCHAMIANIE")
+
+        return probe.wait(process=process, on_progress=on_progress if report_progress else None,
+                          log=log, cancel_event=cancel_event, on_attempt=on_attempt)
+
+    def _launch_process(self, name, script_path, cwd=None, env=None, pass_fds=()):
+        """Pomocnicza funkcja do uruchamiania pojedynczego procesu."""
+        full_env = os.environ.copy()
+        if env:
+            full_env.update(env)
+
+        started = time.perf_counter()
+        try:
+            process = self._spawn_from_zygote(name, script_path, cwd, full_env, pass_fds)
+            if process is None:
+                process = subprocess.Popen(
+                    [self.python_executable, script_path],
+                    cwd=cwd,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    env=full_env,
+                    pass_fds=pass_fds,
+                    # Własna grupa procesów: sygnał zamknięcia dociera też do wnuków (np. reloadera Flaska)
+                    start_new_session=os.name != "nt",
+                    creationflags=subprocess.CREATE_NEW_PROCESS_GROUP if os.name == "nt" else 0,
+                )
+            mode = "ciepły, z zygoty" if getattr(process, "from_zygote", False) else "zimny"
+            self.log_message(f"Pomyślnie uruchomiono proces {name} (PID: {process.pid}, start {mode} w {(time.perf_counter() - started) * 1000:.1f} ms).", level="INFO", component="PROCESY")
+            self.output_reader.add(name, process.stdout) # Surowe bajty czytane przez wspólny czytnik
+            return process
+        except FileNotFoundError:
+            self.log_message(f"Błąd: Interpreter '{self.python_executable}' nie znaleziony dla {name}.", level="CRITICAL", component="PROCESY")
+            self.on_process_error(name, f"Interpreter '{self.python_executable}' nie znaleziony dla {name}.")
+            return None
+        except Exception as e:
+            self.log_message(f"Błąd: Nie udało się uruchomić {name}: {e}", level="CRITICAL", component="PROCESY")
+            self.on_process_error(name, f"Nie udało się uruchomić {name}: {e}")
+            return None
+
+    def _spawn_from_zygote(self, name, script_path, cwd, env, pass_fds):
+        """Uruchamia proces przez fork() z zygoty. Zwraca None, gdy zygota nie działa (start na zimno)."""
+        if self.zygote is None or not self.zygote.alive:
+            return None
+        try:
+            return self.zygote.spawn(script_path, cwd=cwd, env=env, pass_fds=pass_fds)
+        except OSError as e:
+            self.log_message(f"Zygota nie uruchomiła procesu {name}: {e}. Uruchamiam na zimno.", level="WARNING", component="ZYGOTA")
+            return None
+
+    def _handle_process_output(self, name, lines):
+        """Zamienia partię linii wyjścia procesu na wpisy logu (wywoływane z wątku czytnika)."""
+        tracer = self.startup_tracer
+        if tracer:
+            tracer.process_output(name)
+        component = name.upper().replace(' ', '_')
+        records = []
+        for line in lines:
+            tag = self._get_log_tag(line)
+            if level_priority(tag) < self._min_log_priority:
+                continue
+            records.append(OutputLogRecord(tag or "OUTPUT", component, line.strip(), tag=tag))
+        if records:
+            self.log_queue.put(records) # Cała partia jedną operacją na kolejce
+            if self.store_process_output:
+                self.log_store.append_many(records)
+
+    def _on_process_output_closed(self, name, counters):
+        self.log_message("Wyjście procesu %s zamknięte (łącznie %d linii, %d bajtów).", name, counters.lines, counters.bytes,
+                         level="DEBUG", component="PROCESY")
+
+    def _on_process_output_error(self, name, error):
+        self.log_message("Błąd obsługi wyjścia procesu %s: %r", name, error, level="ERROR", component="PROCESY")
+
+    def process_output_stats(self):
+        """Liczniki bajtów i linii wyjścia każdego procesu potomnego: {nazwa: {"bytes", "lines"}}."""
+        return self.output_reader.stats()
+
+    # --- Zamykanie ---
+
+    def _stop_app_logic(self):
+        """Logika zamykania backendu i frontendu. Wszystkie procesy są zamykane równolegle."""
+        self.log_message("Rozpoczynam logikę zamykania...", level="DEBUG", component="ZAMYKANIE")
+        start = time.monotonic()
+
+        self.stop_backend_supervisor() # Zamykanie celowe - bez restartów
+        if self.backend_proxy is not None:
+            self.backend_proxy.stop()
+            self.backend_proxy = None
+        processes = [(self.frontend_game_process, "frontend gry")]
+        processes += [(worker.process, worker.name) for worker in self.backend_workers]
+        self.terminate_processes(processes)
+        self._close_worker_sockets(self.backend_workers)
+
+        self.log_message(f"Wszystkie procesy zostały zamknięte w {time.monotonic() - start:.3f}s.", level="INFO", component="ZAMYKANIE")
+        self.backend_workers = []
+        self.frontend_game_process = None
+        self.on_app_stopped()
+
+    def terminate_process(self, process, name):
+        """Pomocnicza funkcja do eleganckiego zamykania procesu potomnego."""
+        self.terminate_processes([(process, name)])
+
+    def terminate_processes(self, processes, timeout=SHUTDOWN_TIMEOUT):
+        """Zamyka grupy procesów równolegle: sygnał do wszystkich naraz, jeden wspólny termin, potem SIGKILL.
+
+        `processes` to lista par (proces, nazwa); pozycje z procesem None są pomijane.
+        """
+        running = []
+        for process, name in processes:
+            if process is None or not self._group_alive(process):
+                continue
+            self.log_message(f"Próba zakończenia procesu {name} (PID: {process.pid})...", level="INFO", component="ZAMYKANIE")
+            try:
+                self._signal_group(process)
+                running.append((process, name))
+            except Exception as e:
+                self.log_message(f"Błąd podczas zamykania {name}: {e}", level="ERROR", component="ZAMYKANIE")
+
+        signaled = list(running)
+        deadline = time.monotonic() + timeout
+        while running and time.monotonic() < deadline:
+            running = [(process, name) for process, name in running if process.poll() is None]
+            if running:
+                time.sleep(SHUTDOWN_POLL_INTERVAL)
+
+        for process, name in running:
+            self.log_message(f"Proces {name} nie zamknął się czysto w {timeout:.0f}s, zabijam jego grupę (PID: {process.pid}).", level="WARNING", component="ZAMYKANIE")
+            try:
+                self._signal_group(process, force=True)
+                process.wait()
+            except Exception as e:
+                self.log_message(f"Błąd podczas zabijania {name}: {e}", level="ERROR", component="ZAMYKANIE")
+        # Wnuki, które przeżyły swojego rodzica (dostały SIGTERM razem z nim), nie mogą blokować portu
+        for process, name in signaled:
+            if self._group_alive(process):
+                self.log_message("Zabijam pozostałe procesy z grupy %s (PGID: %d).", name, process.pid, level="DEBUG", component="ZAMYKANIE")
+                self._signal_group(process, force=True)
+
+    def _signal_group(self, process, force=False):
+        """Wysyła SIGTERM (lub SIGKILL przy force) do całej grupy procesu; na Windows - tylko do procesu."""
+        if os.name == "nt":
+            if force:
+                process.kill()
+            else:
+                process.terminate()
+            return
+        try:
+            os.killpg(process.pid, signal.SIGKILL if force else signal.SIGTERM)
+        except ProcessLookupError:
+            pass # Grupa już nie istnieje
+
+    def _group_alive(self, process):
+        """Czy proces lub któryś z procesów w jego grupie (np. wnuk) jeszcze działa."""
+        if process.poll() is None:
+            return True
+        if os.name == "nt":
+            return False
+        try:
+            os.killpg(process.pid, 0)
+            return True
+        except (ProcessLookupError, PermissionError):
+            return False
+
+    # --- Sieć ---
+
+    def is_port_available(self, port):
+        """Sprawdza, czy dany port jest wolny."""
+        self.log_message("Sprawdzam dostępność portu: %s", port, level="DEBUG", component="SIEĆ")
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            if os.name != "nt":
+                # Jak serwery (np. Flask): gniazda w TIME_WAIT po poprzednim uruchomieniu nie blokują portu
+                s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            try:
+                s.bind(("127.0.0.1", port))
+                self.log_message("Port %s jest wolny.", port, level="DEBUG", component="SIEĆ")
+                return True
+            except socket.error as e:
+                self.log_message(f"Port {port} jest zajęty: {e}", level="WARNING", component="SIEĆ")
+                return False
+
+    def is_backend_listening(self, port):
+        """Sprawdza, czy serwer nasłuchuje na swoim porcie poprzez zapytanie HTTP."""
+        status = ReadinessProbe(port, health_path=self.frontend_config.get("BACKEND_HEALTH_PATH", BACKEND_HEALTH_PATH)).check_health()
+        if status == 200:
+            self.log_message("Serwer nasłuchuje na porcie %s (status 200).", port, level="DEBUG", component="SIEĆ")
+            return True
+        if status is None:
+            self.log_message(f"Błąd połączenia z serwerem na porcie {port}.", level="WARNING", component="SIEĆ")
+        else:
+            self.log_message(f"Serwer nasłuchuje na porcie {port}, ale zwrócił status {status}.", level="WARNING", component="SIEĆ")
+        return False
@@ -1,38 +1,53 @@
-import subprocess
+import datetime
+import math
 import threading
-import time
 import sys
 import os
-import datetime
-from queue import Queue
-import socket 
-import requests
-import json
-import shutil 
 import tkinter as tk 
-from tkinter import messagebox, Menu, ttk 
+from queue import Queue
+from tkinter import messagebox, Menu, ttk, filedialog, simpledialog
+
+from launcher_core import LauncherCore, ConfigError, LOAD_TEST_ROUTES, LOAD_TEST_CLIENTS, LOAD_TEST_DURATION, RECORDINGS_DIR
+from launcher_logs import LogSink, LogRecord
+from launcher_ui import UiDispatcher
+from launcher_updates import (UpdateChecker, HttpVersionFetcher, UpdateCheckError, UPDATE_CHECK_TTL,
+                              UpdateDownloader, UpdateDownloadError, UpdateFile, parse_manifest, fetch_json, fetch_sha256)
+from launcher_monitor import (STATE_ACTIVE, STATE_NOT_LISTENING,
+                              STATE_STOPPED_PORT_FREE, STATE_STOPPED_PORT_BUSY)
 
 # --- Konfiguracja Wersji Aplikacji ---
 APP_VERSION = "1.2.0" 
 
 # --- Konfiguracja Ścieżek ---
 BASE_DIR = os.path.dirname(os.path.abspath(__file__)) 
-BACKEND_DIR = os.path.join(BASE_DIR, 'geoguessr_backend')
-# WWW_DIR jest teraz nieużywane, ponieważ panel admina został usunięty
-FRONTEND_SCRIPT_NAME = 'geoguessr_game.py'
-BACKEND_APP_SCRIPT_NAME = 'app.py' 
-FRONTEND_CONFIG_PATH = os.path.join(BASE_DIR, 'config.py') 
 LAUNCHER_SCRIPT_PATH = os.path.join(BASE_DIR, os.path.basename(__file__))
 
 # --- Konfiguracja Aktualizatora ---
 UPDATE_CHECK_URL = "https://raw.githubusercontent.com/ktopytal/GeoGuessr/main/latest_launcher_version.txt" 
 UPDATE_DOWNLOAD_URL = "https://raw.githubusercontent.com/ktopytal/GeoGuessr/main/start_launcher.py" 
-
-# --- Konfiguracja Uruchamiania ---
-PYTHON_EXECUTABLE = 'python3' 
-BACKEND_PORT = 5000 
-BACKEND_STARTUP_DELAY = 7 # Czas oczekiwania na uruchomienie backendu gry (sekundy)
-CONNECTION_CHECK_INTERVAL = 1000 # Interwał odświeżania statusu procesów (ms)
+# Manifest wieloplikowej aktualizacji: {"version", "files": [{"path", "url", "sha256", "size"}]}, ścieżki względem BASE_DIR.
+# Bez manifestu pobierany jest tylko launcher, a jego skrót z UPDATE_DOWNLOAD_URL + ".sha256".
+UPDATE_MANIFEST_URL = "https://raw.githubusercontent.com/ktopytal/GeoGuessr/main/latest_launcher_manifest.json"
+UPDATE_CACHE_PATH = os.path.join(BASE_DIR, '.cache', 'update_check.json') # Wynik ostatniego sprawdzenia (wersja, ETag, Last-Modified)
+UPDATE_CHECK_DELAY = 10000 # Automatyczne sprawdzenie dopiero po tym czasie od startu, gdy launcher jest bezczynny (ms)
+
+# --- Konfiguracja Interfejsu ---
+MONITOR_EVENTS_POLL_INTERVAL = 100 # Jak często GUI odbiera zmiany stanu od monitora (ms)
+UI_FRAME_INTERVAL = 33 # Odstęp między klatkami stosowania zmian widżetów z wątków roboczych (ms, ok. 30 kl./s)
+METRICS_VIEW_INTERVAL = 1000 # Jak często odświeżane są wykresy CPU/RSS procesów (ms)
+SPARKLINE_WIDTH = 60 # Szerokość wykresu procesu (piksele)
+SPARKLINE_HEIGHT = 16 # Wysokość wykresu procesu (piksele)
+METRICS_PER_ROW = 4 # Liczba procesów w jednym wierszu sekcji metryk
+
+# --- Konfiguracja Logów ---
+LOG_MAX_LINES = 5000 # Maksymalna liczba linii w polu logów (starsze są usuwane)
+LOG_DRAIN_INTERVAL = 50 # Odstęp między partiami logów wstawianymi do GUI (ms)
+LOG_SEARCH_LIMIT = 2000 # Maks. liczba wyników wyszukiwania pokazywanych w oknie (najnowsze)
+LOAD_TEST_VIEW_INTERVAL = 500 # Jak często okno testu obciążenia odświeża wyniki (ms)
+HISTOGRAM_WIDTH = 560 # Szerokość wykresu histogramu opóźnień (piksele)
+HISTOGRAM_HEIGHT = 140 # Wysokość wykresu histogramu opóźnień (piksele)
+HISTOGRAM_COLUMNS = 56 # Liczba słupków (przedziały logarytmiczne)
+LOG_LEVELS = ("DEBUG", "INFO", "SUCCESS", "WARNING", "ERROR", "CRITICAL") # Od najmniej ważnego
 
 class AppStyles:
     """Klasa do konfiguracji stylów ttk."""
@@ -71,12 +86,199 @@ class AppStyles:
         self.style.configure("red.Horizontal.TProgressbar", troughcolor="#E0E0E0", background="#EF5350")
         self.style.configure("yellow.Horizontal.TProgressbar", troughcolor="#E0E0E0", background="#FFCA28") 
 
-class AppLauncher(tk.Tk): 
+class LogSearchWindow(tk.Toplevel):
+    """Okno wyszukiwania w zapisanych logach. Przeszukuje magazyn strumieniowo w wątku tła."""
+    def __init__(self, master, log_store):
+        super().__init__(master)
+        self.log_store = log_store
+        self.title("Szukaj w logach")
+        self.geometry("800x500")
+        self.config(bg="#ECEFF1")
+
+        filters = ttk.Frame(self, padding=10)
+        filters.pack(fill="x")
+        ttk.Label(filters, text="Tekst:").pack(side="left")
+        self.text_entry = ttk.Entry(filters, width=30)
+        self.text_entry.pack(side="left", padx=(5, 10))
+        self.text_entry.bind("<Return>", lambda event: self.start_search())
+        ttk.Label(filters, text="Poziom od:").pack(side="left")
+        self.level_combo = ttk.Combobox(filters, values=("Wszystkie",) + LOG_LEVELS, state="readonly", width=10)
+        self.level_combo.current(0)
+        self.level_combo.pack(side="left", padx=(5, 10))
+        ttk.Label(filters, text="Komponent:").pack(side="left")
+        self.component_combo = ttk.Combobox(filters, values=["Wszystkie"] + log_store.components(), state="readonly", width=18)
+        self.component_combo.current(0)
+        self.component_combo.pack(side="left", padx=(5, 10))
+        self.search_button = ttk.Button(filters, text="Szukaj", command=self.start_search)
+        self.search_button.pack(side="left")
+
+        self.result_label = ttk.Label(self, text="", font=("Arial", 8))
+        self.result_label.pack(anchor="w", padx=10)
+        self.result_text = tk.Text(self, state="disabled", wrap="none", bg="black", fg="white", font=("Courier New", 9))
+        self.result_text.pack(fill="both", expand=True, padx=10, pady=(0, 10))
+
+    def start_search(self):
+        level = self.level_combo.get()
+        component = self.component_combo.get()
+        levels = LOG_LEVELS[LOG_LEVELS.index(level):] if level in LOG_LEVELS else None
+        self.search_button.config(state=tk.DISABLED)
+        self.result_label.config(text="Szukam...")
+        threading.Thread(target=self._search, daemon=True, args=(
+            self.text_entry.get() or None, levels, None if component == "Wszystkie" else component)).start()
+
+    def _search(self, text, levels, component):
+        started = datetime.datetime.now()
+        matches, records = self.log_store.search(text=text, levels=levels, component=component, limit=LOG_SEARCH_LIMIT)
+        elapsed = (datetime.datetime.now() - started).total_seconds()
+        self.master.ui.call(None, self._show_results, matches, records, elapsed)
+
+    def _show_results(self, matches, records, elapsed):
+        if not self.winfo_exists():
+            return # Okno zamknięte w trakcie wyszukiwania
+        lines = []
+        for record in records:
+            timestamp = datetime.datetime.fromtimestamp(record.timestamp).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+            lines.append(f"[{timestamp}] [{record.level}] [{record.component}] {record.message}\n")
+        self.result_text.config(state="normal")
+        self.result_text.delete("1.0", "end")
+        self.result_text.insert("end", "".join(lines))
+        self.result_text.config(state="disabled")
+        self.result_text.see("end")
+        self.result_label.config(text=f"Znaleziono: {matches} (pokazano ostatnie {len(records)}) w {elapsed:.2f}s")
+        self.search_button.config(state=tk.NORMAL)
+
+class LoadTestWindow(tk.Toplevel):
+    """Okno testu obciążenia lokalnego backendu: parametry, bieżące percentyle i histogram opóźnień."""
+    def __init__(self, master, launcher):
+        super().__init__(master)
+        self.launcher = launcher
+        self.generator = None
+        self.title("Test obciążenia backendu")
+        self.geometry("600x420")
+        self.config(bg="#ECEFF1")
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+
+        config = launcher.frontend_config
+        params = ttk.Frame(self, padding=10)
+        params.pack(fill="x")
+        self.routes_entry = self._field(params, "Trasy:", ", ".join(config.get("LOAD_TEST_ROUTES", LOAD_TEST_ROUTES)), 24)
+        self.clients_entry = self._field(params, "Klienci:", config.get("LOAD_TEST_CLIENTS", LOAD_TEST_CLIENTS), 5)
+        self.rate_entry = self._field(params, "Żądań/s:", config.get("LOAD_TEST_RATE") or "", 6)
+        self.duration_entry = self._field(params, "Czas (s):", config.get("LOAD_TEST_DURATION", LOAD_TEST_DURATION), 5)
+
+        buttons = ttk.Frame(self, padding=(10, 0))
+        buttons.pack(fill="x")
+        self.start_button = ttk.Button(buttons, text="Start", command=self.start_test, style="Accent.TButton")
+        self.start_button.pack(side="left")
+        self.stop_button = ttk.Button(buttons, text="Stop", command=self.stop_test, state=tk.DISABLED)
+        self.stop_button.pack(side="left", padx=5)
+        self.export_button = ttk.Button(buttons, text="Eksport JSON...", command=self.export_results, state=tk.DISABLED)
+        self.export_button.pack(side="left")
+        ttk.Label(buttons, text="Puste tempo = zamknięta pętla", font=("Arial", 8)).pack(side="right")
+
+        self.summary_label = ttk.Label(self, text="Brak wyników.", font=("Courier New", 9), justify="left")
+        self.summary_label.pack(anchor="w", padx=10, pady=10)
+        self.histogram_canvas = tk.Canvas(self, width=HISTOGRAM_WIDTH, height=HISTOGRAM_HEIGHT, bg="white", highlightthickness=0)
+        self.histogram_canvas.pack(padx=10)
+        self.range_label = ttk.Label(self, text="", font=("Arial", 8))
+        self.range_label.pack(anchor="w", padx=10)
+
+    def _field(self, parent, label, value, width):
+        ttk.Label(parent, text=label).pack(side="left")
+        entry = ttk.Entry(parent, width=width)
+        entry.insert(0, str(value))
+        entry.pack(side="left", padx=(5, 10))
+        return entry
+
+    def start_test(self):
+        try:
+            routes = [r.strip() for r in self.routes_entry.get().split(",") if r.strip()]
+            clients = int(self.clients_entry.get())
+            rate = float(self.rate_entry.get()) if self.rate_entry.get().strip() else 0
+            duration = float(self.duration_entry.get())
+            self.generator = self.launcher.create_load_test(routes=routes, clients=clients, rate=rate, duration=duration)
+        except ValueError:
+            messagebox.showerror("Test obciążenia", "Niepoprawne parametry testu.", parent=self)
+            return
+        except RuntimeError as e:
+            messagebox.showerror("Test obciążenia", str(e), parent=self)
+            return
+        self.generator.start()
+        self.launcher.log_message("Test obciążenia rozpoczęty (%d klientów).", self.generator.clients, level="INFO", component="TEST_OBCIĄŻENIA")
+        self.start_button.config(state=tk.DISABLED)
+        self.stop_button.config(state=tk.NORMAL)
+        self.export_button.config(state=tk.DISABLED)
+        self.after(LOAD_TEST_VIEW_INTERVAL, self._refresh)
+
+    def stop_test(self):
+        if self.generator is not None:
+            self.generator.stop()
+
+    def on_close(self):
+        self.stop_test()
+        self.destroy()
+
+    def _refresh(self):
+        """Odświeża wyniki w wątku Tk; snapshot() jest bezpieczny względem wątku generatora."""
+        if not self.winfo_exists() or self.generator is None:
+            return
+        snapshot = self.generator.snapshot()
+        latency = snapshot["latency_ms"]
+        statuses = ", ".join(f"{code}: {count}" for code, count in sorted(snapshot["statuses"].items()))
+        self.summary_label.config(text=(
+            f"Czas: {snapshot['elapsed']:.1f}s   Żądania: {snapshot['requests']}   Przepustowość: {snapshot['throughput']:.1f}/s\n"
+            f"p50: {latency['p50']} ms   p95: {latency['p95']} ms   p99: {latency['p99']} ms   max: {latency['max']} ms\n"
+            f"Błędy: {snapshot['errors']}   Kody: {statuses or '-'}"))
+        self._draw_histogram(self.generator.histogram_buckets())
+        if self.generator.running:
+            self.after(LOAD_TEST_VIEW_INTERVAL, self._refresh)
+            return
+        self.launcher.log_load_test_snapshot(snapshot, level="SUCCESS")
+        self.start_button.config(state=tk.NORMAL)
+        self.stop_button.config(state=tk.DISABLED)
+        self.export_button.config(state=tk.NORMAL)
+
+    def _draw_histogram(self, buckets):
+        """Rysuje liczności w przedziałach logarytmicznych między najmniejszym a największym opóźnieniem."""
+        canvas = self.histogram_canvas
+        canvas.delete("all")
+        if not buckets:
+            return
+        low = max(1, buckets[0][0])
+        high = max(low + 1, buckets[-1][1])
+        span = math.log(high / low) or 1.0
+        columns = [0] * HISTOGRAM_COLUMNS
+        for start, _end, count in buckets:
+            column = int(math.log(max(start, low) / low) / span * (HISTOGRAM_COLUMNS - 1))
+            columns[column] += count
+        peak = max(columns)
+        width = HISTOGRAM_WIDTH / HISTOGRAM_COLUMNS
+        for i, count in enumerate(columns):
+            if count:
+                height = (HISTOGRAM_HEIGHT - 4) * count / peak
+                canvas.create_rectangle(i * width + 1, HISTOGRAM_HEIGHT - height, (i + 1) * width - 1, HISTOGRAM_HEIGHT,
+                                        fill="#42A5F5", outline="")
+        self.range_label.config(text=f"Opóźnienie (skala log.): {low / 1000:.3f} ms - {high / 1000:.3f} ms")
+
+    def export_results(self):
+        path = filedialog.asksaveasfilename(parent=self, defaultextension=".json", filetypes=[("JSON", "*.json")],
+                                            initialfile="loadtest.json")
+        if not path:
+            return
+        try:
+            self.generator.export_json(path)
+        except OSError as e:
+            messagebox.showerror("Test obciążenia", f"Nie udało się zapisać wyników: {e}", parent=self)
+            return
+        self.launcher.log_message("Wyniki testu obciążenia zapisane w %s.", path, level="INFO", component="TEST_OBCIĄŻENIA")
+
+class AppLauncher(LauncherCore, tk.Tk): 
     def __init__(self):
-        super().__init__()
+        tk.Tk.__init__(self)
+        LauncherCore.__init__(self)
         self.log_message("Inicjalizacja launchera...", level="INFO", component="LAUNCHER_INIT")
         self.title(f"GeoGuessr Launcher v{APP_VERSION}")
-        self.geometry("700x550") 
+        self.geometry("700x620") 
         self.resizable(False, False)
         self.protocol("WM_DELETE_WINDOW", self.on_closing) 
         self.config(bg="#ECEFF1") 
@@ -84,68 +286,59 @@ class AppLauncher(tk.Tk):
         # Inicjalizacja stylów
         self.styles = AppStyles(self)
 
-        # Procesy
-        self.backend_game_process = None
-        self.frontend_game_process = None
-        self.log_queue = Queue() 
+        self.monitor_events = Queue() # Zmiany stanu backendu zgłaszane przez monitor w tle
+        self.shutdown_complete = threading.Event() # Ustawiane, gdy zamykanie procesów się zakończy
+        self._closing = False # Użytkownik zamyka okno - zniszcz je po zakończeniu zamykania
+        self._app_starting = False # Trwa uruchamianie backendu/frontendu - automatyczne sprawdzenie aktualizacji czeka
+        self._replay_running = False # Trwa odtwarzanie nagranej sesji wyjścia procesów
 
-        # Wczytaj konfigurację frontendu
-        self.frontend_config = self._load_frontend_config() 
-        
-        # Ustaw globalny port backendu gry
-        global BACKEND_PORT 
-        BACKEND_PORT = self.frontend_config.get("BACKEND_PORT", 5000) 
+        # Wczytaj konfigurację frontendu (ustawia też port backendu gry)
+        try:
+            self.load_config()
+        except ConfigError as e:
+            messagebox.showerror(*e.args)
+            sys.exit(1)
 
         self.create_widgets()
         self.create_menu()
         
-        # Uruchom wątek do przetwarzania logów
-        self.process_logs_thread = threading.Thread(target=self.process_logs, daemon=True)
-        self.process_logs_thread.start()
+        # Uruchom opróżnianie kolejki logów w wątku Tk
+        self.log_sink = LogSink(
+            self.log_text, self.log_queue,
+            max_lines=self.frontend_config.get("LOG_MAX_LINES", LOG_MAX_LINES),
+            interval=LOG_DRAIN_INTERVAL,
+            on_stats=self._update_log_stats_label,
+        )
+        self.log_sink.start()
+
+        # Zmiany widżetów z wątków roboczych stosowane w wątku Tk, scalane per widżet
+        self.ui = UiDispatcher(self, interval=UI_FRAME_INTERVAL, on_stats=self._update_ui_stats_label)
+        self.ui.start()
 
-        # Rozpocznij cykliczne sprawdzanie statusu backendu
+        # Rozpocznij monitorowanie backendu w tle i odbieranie zmian stanu w GUI
+        self.start_health_monitor()
         self.check_backend_status_periodically()
-        # Sprawdź aktualizacje przy starcie launchera
-        self.check_for_updates()
+        # Próbkowanie zużycia zasobów przez procesy i wykresy w sekcji statusu
+        self.start_process_metrics()
+        self.update_metrics_view_periodically()
+        # Zygota wczytuje moduły w tle, zanim użytkownik kliknie "Uruchom"
+        self.start_zygote()
+        # Sprawdź aktualizacje, gdy launcher będzie bezczynny (poza ścieżką startu)
+        self.update_checker = UpdateChecker(
+            HttpVersionFetcher(UPDATE_CHECK_URL), UPDATE_CACHE_PATH,
+            ttl=self.frontend_config.get("UPDATE_CHECK_TTL", UPDATE_CHECK_TTL),
+        )
+        self.after(UPDATE_CHECK_DELAY, self._check_for_updates_when_idle)
         self.log_message("Launcher zainicjowany pomyślnie.", level="INFO", component="LAUNCHER_INIT")
 
     # --- Metody obsługujące zdarzenia i logikę ---
 
-    def _load_frontend_config(self):
-        """Wczytuje konfigurację frontendu z pliku JSON."""
-        self.log_message(f"Próbuję wczytać konfigurację frontendu z: {FRONTEND_CONFIG_PATH}", level="INFO", component="KONFIGURACJA")
-        if not os.path.exists(FRONTEND_CONFIG_PATH):
-            self.log_message(f"BŁĄD KRYTYCZNY: Brak pliku konfiguracyjnego frontendu: {FRONTEND_CONFIG_PATH}. Aplikacja zostanie zamknięta.", level="CRITICAL", component="KONFIGURACJA")
-            messagebox.showerror("Błąd Konfiguracji", f"Brak pliku konfiguracyjnego frontendu: {FRONTEND_CONFIG_PATH}\n"
-                                                      "Upewnij się, że plik config.py istnieje i jest w formacie JSON.")
-            sys.exit(1)
-        try:
-            with open(FRONTEND_CONFIG_PATH, 'r') as f:
-                config_data = json.load(f)
-            self.log_message("Konfiguracja frontendu wczytana pomyślnie.", level="SUCCESS", component="KONFIGURACJA")
-            return config_data
-        except json.JSONDecodeError as e:
-            self.log_message(f"BŁĄD KRYTYCZNY: Błąd parsowania JSON w config.py: {e}. Aplikacja zostanie zamknięta.", level="CRITICAL", component="KONFIGURACJA")
-            messagebox.showerror("Błąd Konfiguracji", f"Błąd w pliku konfiguracyjnym frontendu (Błąd składni JSON):\n{e}\n"
-                                                      "Sprawdź format JSON w config.py.")
-            sys.exit(1)
-        except Exception as e:
-            self.log_message(f"BŁĄD KRYTYCZNY: Nie udało się wczytać config.py: {e}. Aplikacja zostanie zamknięta.", level="CRITICAL", component="KONFIGURACJA")
-            messagebox.showerror("Błąd Konfiguracji", f"Nie udało się wczytać pliku konfiguracyjnego frontendu:\n{e}")
-            sys.exit(1)
-
     def _save_frontend_config(self):
         """Zapisuje bieżącą konfigurację frontendu do pliku JSON."""
-        self.log_message(f"Próbuję zapisać konfigurację frontendu do: {FRONTEND_CONFIG_PATH}", level="INFO", component="KONFIGURACJA")
-        try:
-            with open(FRONTEND_CONFIG_PATH, 'w') as f:
-                json.dump(self.frontend_config, f, indent=4) 
-            self.log_message("Konfiguracja frontendu zapisana pomyślnie.", level="SUCCESS", component="KONFIGURACJA")
+        if LauncherCore._save_frontend_config(self):
             return True
-        except Exception as e:
-            messagebox.showerror("Błąd Zapisu", f"Nie udało się zapisać pliku konfiguracyjnego frontendu:\n{e}")
-            self.log_message(f"BŁĄD: Nie udało się zapisać config.py: {e}", level="ERROR", component="KONFIGURACJA")
-            return False
+        messagebox.showerror("Błąd Zapisu", "Nie udało się zapisać pliku konfiguracyjnego frontendu.\nSprawdź logi aplikacji.")
+        return False
 
     def create_menu(self):
         """Tworzy pasek menu aplikacji."""
@@ -158,8 +351,76 @@ class AppLauncher(tk.Tk):
         settings_menu.add_command(label="Sprawdź aktualizacje", command=self.check_for_updates_manual)
         settings_menu.add_separator()
         settings_menu.add_command(label="O programie", command=self.show_about_dialog)
+
+        logs_menu = Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="Logi", menu=logs_menu)
+        logs_menu.add_command(label="Szukaj w logach...", command=self.open_log_search)
+        logs_menu.add_separator()
+        self.log_level_var = tk.StringVar(value=self.log_level)
+        level_menu = Menu(logs_menu, tearoff=0)
+        logs_menu.add_cascade(label="Minimalny poziom", menu=level_menu)
+        for level in LOG_LEVELS:
+            level_menu.add_radiobutton(label=level, value=level, variable=self.log_level_var,
+                                       command=lambda: self.set_log_level(self.log_level_var.get()))
+
+        tools_menu = Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="Narzędzia", menu=tools_menu)
+        tools_menu.add_command(label="Test obciążenia backendu...", command=self.open_load_test)
+        tools_menu.add_separator()
+        self.recording_var = tk.BooleanVar(value=self.output_reader.recorder is not None)
+        tools_menu.add_checkbutton(label="Nagrywaj wyjście procesów", variable=self.recording_var, command=self.toggle_output_recording)
+        tools_menu.add_command(label="Odtwórz sesję wyjścia...", command=self.open_replay)
         self.log_message("Menu aplikacji utworzone.", level="INFO", component="GUI_INIT")
 
+    def open_log_search(self):
+        """Otwiera okno wyszukiwania w logach zapisanych na dysku."""
+        if not self.log_store.enabled:
+            messagebox.showinfo("Szukaj w logach", "Zapis logów na dysk jest wyłączony (LOG_STORE_ENABLED w config.py).")
+            return
+        LogSearchWindow(self, self.log_store)
+
+    def open_load_test(self):
+        """Otwiera okno testu obciążenia (działa w pełni lokalnie, wobec uruchomionego backendu)."""
+        if not self.is_backend_running():
+            messagebox.showinfo("Test obciążenia", "Najpierw uruchom grę - test obciąża lokalny backend.")
+            return
+        LoadTestWindow(self, self)
+
+    def toggle_output_recording(self):
+        if self.recording_var.get():
+            self.start_output_recording()
+        else:
+            self.stop_output_recording()
+        self.recording_var.set(self.output_reader.recorder is not None)
+
+    def open_replay(self):
+        """Odtwarza nagraną sesję przez okno logów w wątku tła; podsumowanie trafia do logów."""
+        if self._replay_running:
+            return
+        if self.is_backend_running() or self.frontend_game_process is not None:
+            messagebox.showinfo("Odtwarzanie sesji", "Najpierw zatrzymaj grę - odtwarzanie korzysta z tej samej ścieżki logów.")
+            return
+        path = filedialog.askopenfilename(parent=self, initialdir=RECORDINGS_DIR, filetypes=[("Sesja wyjścia", "*.ggrec")])
+        if not path:
+            return
+        speed = simpledialog.askfloat("Odtwarzanie sesji", "Mnożnik tempa (0 - bez przerw):", parent=self, initialvalue=1.0, minvalue=0.0)
+        if speed is None:
+            return
+        self._replay_running = True
+        threading.Thread(target=self._replay_session, args=(path, speed), daemon=True).start()
+
+    def _replay_session(self, path, speed):
+        try:
+            self.log_replay_summary(self.replay_output(path, speed))
+        except (OSError, ValueError, RuntimeError) as e:
+            self.log_message(f"Nie udało się odtworzyć sesji: {e}", level="ERROR", component="ODTWARZANIE")
+            self.ui.dialog(messagebox.showerror, "Odtwarzanie sesji", str(e))
+        finally:
+            self._replay_running = False
+
+    def log_sink_stats(self):
+        return self.log_sink.stats()
+
     def show_about_dialog(self):
         """Wyświetla okno 'O programie'."""
         self.log_message("Wyświetlanie okna 'O programie'.", level="INFO", component="GUI_EVENT")
@@ -189,8 +450,20 @@ class AppLauncher(tk.Tk):
         ttk.Label(status_info_frame, text="Gry:", font=("Arial", 11, "bold")).pack(side="left", padx=(0,5))
         self.backend_game_status_label = ttk.Label(status_info_frame, text="Nie uruchomiony", style="Yellow.TLabel") 
         self.backend_game_status_label.pack(side="left", padx=(0,10))
-        self.game_port_status_label = ttk.Label(status_info_frame, text=f"Port: {BACKEND_PORT}", style="Yellow.TLabel")
+        self.game_port_status_label = ttk.Label(status_info_frame, text=f"Port: {self.backend_port}", style="Yellow.TLabel")
         self.game_port_status_label.pack(side="left", padx=(0,10))
+        self.supervisor_status_label = ttk.Label(status_info_frame, text="Restarty: 0", style="Gray.TLabel")
+        self.supervisor_status_label.pack(side="left", padx=(0,10))
+
+        # Stan poszczególnych workerów backendu (wypełniany po uruchomieniu puli)
+        self.worker_status_frame = ttk.Frame(status_frame)
+        self.worker_status_frame.pack(fill="x", padx=10)
+        self.worker_status_labels = {}
+
+        # Zużycie zasobów procesów: wykres CPU (niebieski) i RSS (pomarańczowy) z ostatniej minuty
+        self.metrics_frame = ttk.Frame(status_frame)
+        self.metrics_frame.pack(fill="x", padx=10, pady=(5, 0))
+        self.metrics_widgets = {} # nazwa procesu -> (ramka, wykres, linia CPU, linia RSS, etykieta)
 
         # Sekcja Postępu Uruchamiania
         progress_frame = ttk.LabelFrame(self, text="Status Uruchamiania", padding=15)
@@ -216,6 +489,13 @@ class AppLauncher(tk.Tk):
         log_frame.pack(padx=20, pady=10, fill="both", expand=True)
         ttk.Label(log_frame, text="Logi Aplikacji", font=("Arial", 12, "bold")).pack(anchor="w", padx=10, pady=5)
 
+        stats_frame = ttk.Frame(log_frame)
+        stats_frame.pack(side="bottom", fill="x")
+        self.log_stats_label = ttk.Label(stats_frame, text="Kolejka: 0 | Pominięte: 0", font=("Arial", 8))
+        self.log_stats_label.pack(side="right", padx=10)
+        self.ui_stats_label = ttk.Label(stats_frame, text="UI: 0 zmian | Scalone: 0", font=("Arial", 8))
+        self.ui_stats_label.pack(side="left", padx=10)
+
         self.log_text = tk.Text(log_frame, state="disabled", wrap="word", bg="black", fg="white", font=("Courier New", 9)) 
         self.log_text.pack(fill="both", expand=True)
 
@@ -234,314 +514,256 @@ class AppLauncher(tk.Tk):
 
 
     def append_log(self, message, tag=None):
-        """Dodaje wiadomość do pola logów GUI i automatycznie przewija."""
-        self.log_text.config(state="normal") 
-        self.log_text.insert(tk.END, message + "\n", tag)
-        self.log_text.see(tk.END) 
-        self.log_text.config(state="disabled")
-
-    def log_message(self, message, level="INFO", component="LAUNCHER"):
-        """Ujednolicona funkcja do logowania wiadomości z poziomu launchera."""
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3] # ms
-        full_message = f"[{timestamp}] [{level}] [{component}] {message}"
-        self.log_queue.put((full_message, level)) # Dodaj do kolejki logów
-
-
-    def process_logs(self):
-        """Pobiera logi z kolejki i wyświetla je w polu tekstowym."""
-        self.log_message("Wątek przetwarzania logów uruchomiony.", level="DEBUG", component="LAUNCHER_THREAD")
-        while True:
-            try:
-                message, tag = self.log_queue.get(timeout=0.1)
-                self.append_log(message, tag)
-            except Exception:
-                pass 
-            time.sleep(0.01)
-
-    def _get_log_tag(self, line):
-        """Pomocnicza funkcja do określania tagu na podstawie zawartości linii logu."""
-        if "[FRONTEND_INFO]" in line: return "FRONTEND"
-        elif "[FRONTEND_BŁĄD]" in line or "[FRONTEND_ERROR]" in line: return "ERROR"
-        elif "[FRONTEND_SUKCES]" in line or "[FRONTEND_SUCCESS]" in line: return "SUCCESS"
-        elif "[FRONTEND_LICENCJA]" in line: return "LICENCJA"
-        elif "[FRONTEND_KRYTYCZNY]" in line or "[FRONTEND_CRITICAL]" in line: return "CRITICAL"
-        
-        elif "[BACKEND_INFO]" in line: return "BACKEND"
-        elif "[BACKEND_DEBUG]" in line: return "DEBUG"
-        elif "[BACKEND_SUKCES]" in line or "[BACKEND_SUCCESS]" in line: return "SUCCESS"
-        elif "[BACKEND_BŁĄD]" in line or "[BACKEND_ERROR]" in line: return "ERROR"
-        elif "[BACKEND_LICENCJA]" in line: return "LICENCJA"
-        elif "[BACKEND_KRYTYCZNY]" in line or "[BACKEND_CRITICAL]" in line: return "CRITICAL"
-        
-        elif "[PANEL_ADMINA_FLASK_OUTPUT]" in line: return "BACKEND" # Nadal używamy tego taga dla logów z admina
-        elif "[BACKEND_GRY_OUTPUT]" in line: return "BACKEND" 
+        """Dodaje wiadomość do pola logów GUI i automatycznie przewija (tylko z wątku Tk)."""
+        self.log_sink.write([LogRecord(tag or "INFO", "GUI", message, tag=tag)])
 
-        elif "[LAUNCHER]" in line: return "LAUNCHER"
-        elif "[LAUNCHER_ERROR]" in line: return "ERROR"
-        elif "[LAUNCHER_WARNING]" in line: return "WARNING"
-        
-        elif "[INFO]" in line: return "INFO" 
-        elif "[WARNING]" in line: return "WARNING"
-        elif "[ERROR]" in line: return "ERROR"
-        elif "[CRITICAL]" in line: return "CRITICAL"
-        
-        return None 
+    def _update_log_stats_label(self, queued, dropped):
+        """Pokazuje liczbę linii czekających w kolejce i pominiętych przez ujście logów."""
+        self.log_stats_label.config(text=f"Kolejka: {queued} | Pominięte: {dropped}")
+
+    def _update_ui_stats_label(self, applied, coalesced):
+        """Pokazuje liczbę zastosowanych zmian widżetów i zmian scalonych przez dispatcher."""
+        self.ui_stats_label.config(text=f"UI: {applied} zmian | Scalone: {coalesced}")
 
     def start_app_thread(self):
         """Uruchamia procesy w osobnym wątku."""
         self.log_message("Próba uruchomienia aplikacji.", level="INFO", component="URUCHAMIANIE")
-        self.start_button.config(state=tk.DISABLED, style="TButton") 
-        self.stop_button.config(state=tk.DISABLED, style="TButton") 
+        self.ui.config(self.start_button, state=tk.DISABLED, style="TButton")
+        self.ui.config(self.stop_button, state=tk.DISABLED, style="TButton")
         # Przycisk admina nie istnieje, więc go nie konfigurujemy
 
-        self.startup_progress_label.config(text="Rozpoczynam uruchamianie...", foreground="blue")
-        self.startup_progressbar.config(mode="indeterminate", style="blue.Horizontal.TProgressbar") 
-        self.startup_progressbar.start() 
-        self.backend_game_status_label.config(text="Uruchamiam...", foreground="orange")
-        self.game_port_status_label.config(text=f"Port: {BACKEND_PORT} (Uruchamiam...)", foreground="orange")
-        
+        self.ui.config(self.startup_progress_label, text="Rozpoczynam uruchamianie...", foreground="blue")
+        self._show_progress("indeterminate", style="blue.Horizontal.TProgressbar")
+        self.ui.config(self.backend_game_status_label, text="Uruchamiam...", foreground="orange")
+        self.ui.config(self.game_port_status_label, text=f"Port: {self.backend_port} (Uruchamiam...)", foreground="orange")
+
+        self._app_starting = True
         threading.Thread(target=self._start_app_logic, daemon=True).start()
         self.log_message("Wątek uruchamiania aplikacji rozpoczęty.", level="DEBUG", component="URUCHAMIANIE")
 
-    def _start_app_logic(self):
-        """Logika uruchamiania backendu i frontendu."""
-        self.log_message("Rozpoczynam logikę uruchamiania...", level="DEBUG", component="URUCHAMIANIE")
-        
-        # --- Sprawdzenie portu gry ---
-        self.startup_progress_label.config(text=f"Sprawdzam dostępność portu gry ({BACKEND_PORT})...", foreground="blue")
-        if not self.is_port_available(BACKEND_PORT):
-            self.show_startup_error(f"Port {BACKEND_PORT} jest już używany. Zmień port w config.py i uruchom ponownie.")
-            self.log_message(f"Błąd: Port {BACKEND_PORT} zajęty.", level="ERROR", component="URUCHAMIANIE")
-            return
-        self.log_message(f"Port {BACKEND_PORT} dostępny.", level="DEBUG", component="URUCHAMIANIE")
-
-        # --- Usunięto sprawdzanie portu admina ---
-        # self.startup_progress_label.config(text=f"Sprawdzam dostępność portu admina ({ADMIN_PANEL_PORT})...", foreground="blue")
-        # if not self.is_port_available(ADMIN_PANEL_PORT):
-        #    self.show_startup_error(f"Port {ADMIN_PANEL_PORT} jest już używany. Zmień port w config.py i uruchom ponownie.")
-        #    return
-        # self.log_message(f"Port {ADMIN_PANEL_PORT} dostępny.", level="DEBUG", component="URUCHAMIANIE")
-        
-        # --- Uruchomienie Backendu Gry ---
-        self.startup_progress_label.config(text="Uruchamiam backend gry...", foreground="blue")
-        self.backend_game_process = self._launch_process(
-            "backend gry", 
-            os.path.join(BACKEND_DIR, BACKEND_APP_SCRIPT_NAME), 
-            cwd=BACKEND_DIR,
-            env={"FLASK_APP": BACKEND_APP_SCRIPT_NAME, "FLASK_RUN_PORT": str(BACKEND_PORT)} 
-        )
-        if self.backend_game_process is None: # Sprawdzenie, czy proces w ogóle wystartował
-            self.show_startup_error("Backend gry nie uruchomił się, proces zwrócił None.")
-            return
+    def _show_progress(self, mode, value=0, style="blue.Horizontal.TProgressbar"):
+        """Ustawia pasek postępu przez dispatcher; animacja działa tylko w trybie nieokreślonym."""
+        bar = self.startup_progressbar
+        self.ui.config(bar, mode=mode, value=value, style=style)
+        self.ui.call("startup_progressbar.animation", bar.start if mode == "indeterminate" else bar.stop)
 
-        self.log_message(f"Czekam {BACKEND_STARTUP_DELAY} sekund na uruchomienie backendu gry...", level="INFO", component="URUCHAMIANIE")
-        self.startup_progress_label.config(text=f"Czekam {BACKEND_STARTUP_DELAY}s na backend gry...", foreground="blue")
-        self.startup_progressbar.config(mode="determinate", style="blue.Horizontal.TProgressbar") 
-        for i in range(BACKEND_STARTUP_DELAY * 10): 
-            self.startup_progressbar.step(100 / (BACKEND_STARTUP_DELAY * 10)) 
-            time.sleep(0.1)
-        
-        self.startup_progress_label.config(text="Sprawdzam, czy backend gry nasłuchuje...", foreground="blue")
-        if not self.is_backend_listening(BACKEND_PORT):
-            self.show_startup_error(f"Backend gry nie nasłuchuje na porcie {BACKEND_PORT}. Sprawdź jego logi.")
-            return
-        self.log_message(f"Backend gry uruchomiony i nasłuchuje na porcie {BACKEND_PORT}.", level="SUCCESS", component="URUCHAMIANIE")
+    # --- Punkty rozszerzeń LauncherCore (wywoływane z wątków roboczych) ---
+    # Widżety zmieniane są wyłącznie przez self.ui (UiDispatcher), który stosuje je w wątku Tk.
 
+    def on_startup_status(self, text):
+        self.ui.config(self.startup_progress_label, text=text, foreground="blue")
 
-        # --- Usunięto uruchamianie Panelu Admina ---
-        # self.admin_panel_process = self._launch_process(...)
-        # self.log_message("Panel admina uruchomiony...", ...)
+    def on_startup_progress(self, percent):
+        self._show_progress("determinate", value=percent)
 
-        # --- Uruchomienie Frontendu Gry ---
-        self.startup_progress_label.config(text="Uruchamiam frontend gry...", foreground="blue")
-        self.frontend_game_process = self._launch_process(
-            "frontend gry", 
-            os.path.join(BASE_DIR, FRONTEND_SCRIPT_NAME), 
-            cwd=BASE_DIR 
-        )
-        if self.frontend_game_process is None: # Sprawdzenie, czy proces w ogóle wystartował
-            self.show_startup_error("Frontend gry nie uruchomił się, proces zwrócił None.")
-            return
-        self.log_message("Frontend gry uruchomiony. Zamknij okno gry, aby zakończyć działanie backendów.", level="INFO", component="URUCHAMIANIE")
+    def on_startup_failed(self, reason, message):
+        self._app_starting = False
+        self.ui.dialog(self.show_startup_error, message)
 
-        self.stop_button.config(state=tk.NORMAL, style="Danger.TButton") 
-        self.start_button.config(state=tk.DISABLED, style="TButton") 
-        # Przycisk admina nie istnieje
-        # self.admin_panel_button.config(state=tk.NORMAL, style="Purple.TButton") 
-        self.startup_progress_label.config(text="GeoGuessr uruchomiony! ✅", foreground="green")
-        self.startup_progressbar.stop()
-        self.startup_progressbar.config(value=100, style="green.Horizontal.TProgressbar") 
+    def on_process_error(self, name, message):
+        self.ui.dialog(messagebox.showerror, "Błąd Uruchamiania", message)
+
+    def on_app_running(self):
+        self._app_starting = False
+        self.ui.config(self.stop_button, state=tk.NORMAL, style="Danger.TButton")
+        self.ui.config(self.start_button, state=tk.DISABLED, style="TButton")
+        self.ui.config(self.startup_progress_label, text="GeoGuessr uruchomiony! ✅", foreground="green")
+        self._show_progress("determinate", value=100, style="green.Horizontal.TProgressbar")
 
-        # Czekaj na zamknięcie frontendu i następnie zatrzymaj wszystko
-        self.log_message("Oczekiwanie na zamknięcie okna gry...", level="DEBUG", component="URUCHAMIANIE")
-        self.frontend_game_process.wait() 
-        self.log_message("Frontend został zamknięty.", level="INFO", component="URUCHAMIANIE")
-        self.stop_app_thread() 
+    def on_frontend_exited(self):
+        self.ui.call(None, self.stop_app_thread)
+
+    def on_config_reloaded(self, changes):
+        if "LOG_MAX_LINES" in changes:
+            self.log_sink.max_lines = max(1, int(self.frontend_config.get("LOG_MAX_LINES", LOG_MAX_LINES)))
+        if "LOG_LEVEL" in changes:
+            self.ui.call("log_level_var", self.log_level_var.set, self.log_level) # Zaznaczenie w menu Logi
+
+    def on_app_stopped(self):
+        self.shutdown_complete.set()
+        # Resetuj UI po zamknięciu
+        self.ui.config(self.start_button, state=tk.NORMAL, style="Accent.TButton")
+        self.ui.config(self.stop_button, state=tk.DISABLED, style="Danger.TButton")
+        self.ui.config(self.backend_game_status_label, text="Nie uruchomiony ❌", foreground="orange")
+        self.ui.config(self.game_port_status_label, text=f"Port: {self.backend_port} (Wolny)", foreground="green")
+        self.ui.config(self.startup_progress_label, text="Gotowy do uruchomienia", foreground="blue")
+        self._show_progress("determinate", value=0)
+        self.log_message("UI zresetowane po zamknięciu procesów.", level="DEBUG", component="ZAMYKANIE")
+
+    def on_backend_state(self, previous, sample):
+        self.monitor_events.put(sample)
+
+    def on_backend_restarting(self, attempt, delay):
+        self.ui.config(self.backend_game_status_label, text=f"Awaria - restart za {delay:.0f}s 🔄", foreground="orange")
+
+    def on_backend_restored(self, result):
+        self.ui.config(self.backend_game_status_label, text="Aktywny ✅", foreground="green")
+
+    def on_backend_gave_up(self, message):
+        self.ui.config(self.backend_game_status_label, text="Pętla awarii ❌", foreground="red")
+        self.ui.dialog(messagebox.showerror, "Awaria Backendu", message + "\nSprawdź logi aplikacji.")
 
     def show_startup_error(self, message):
-        """Wyświetla błąd uruchamiania i resetuje UI."""
+        """Wyświetla błąd uruchamiania i resetuje UI (w wątku Tk)."""
         self.log_message(f"Błąd uruchamiania: {message}", level="ERROR", component="URUCHAMIANIE")
         messagebox.showerror("Błąd Uruchamiania", message + "\nSprawdź logi aplikacji.")
-        
+
         # Natychmiast zatrzymaj wszystko po błędzie, aby nie pozostawić procesów
-        self.stop_app_thread() 
-        
+        self.stop_app_thread()
+
         # Resetuj UI po błędzie
-        self.start_button.config(state=tk.NORMAL, style="Accent.TButton")
-        self.stop_button.config(state=tk.DISABLED, style="Danger.TButton")
+        self.ui.config(self.start_button, state=tk.NORMAL, style="Accent.TButton")
+        self.ui.config(self.stop_button, state=tk.DISABLED, style="Danger.TButton")
         # Przycisk admina nie istnieje
-        # self.admin_panel_button.config(state=tk.DISABLED, style="Purple.TButton") 
-        self.startup_progress_label.config(text="Błąd uruchamiania ❌", foreground="red")
-        self.startup_progressbar.stop()
-        self.startup_progressbar.config(value=0, style="red.Horizontal.TProgressbar") 
-
-
-    def _launch_process(self, name, script_path, cwd=None, env=None):
-        """Pomocnicza funkcja do uruchamiania pojedynczego procesu."""
-        full_env = os.environ.copy()
-        if env:
-            full_env.update(env)
-
-        try:
-            process = subprocess.Popen(
-                [PYTHON_EXECUTABLE, script_path], 
-                cwd=cwd, 
-                stdout=subprocess.PIPE, 
-                stderr=subprocess.STDOUT, 
-                universal_newlines=True, 
-                bufsize=1,
-                env=full_env 
-            )
-            self.log_message(f"Pomyślnie uruchomiono proces {name} (PID: {process.pid}).", level="INFO", component="PROCESY")
-            threading.Thread(target=self._read_process_output, args=(process, name), daemon=True).start()
-            return process
-        except FileNotFoundError:
-            self.log_message(f"Błąd: Interpreter '{PYTHON_EXECUTABLE}' nie znaleziony dla {name}. Aplikacja zostanie zamknięta.", level="CRITICAL", component="PROCESY")
-            messagebox.showerror("Błąd Uruchamiania", f"Interpreter '{PYTHON_EXECUTABLE}' nie znaleziony dla {name}.")
-            sys.exit(1) # Zakończ aplikację, jeśli nie ma interpretera
-            return None # Na wszelki wypadek
-        except Exception as e:
-            self.log_message(f"Błąd: Nie udało się uruchomić {name}: {e}", level="CRITICAL", component="PROCESY")
-            messagebox.showerror("Błąd Uruchamiania", f"Nie udało się uruchomić {name}: {e}")
-            return None
+        # self.admin_panel_button.config(state=tk.DISABLED, style="Purple.TButton")
+        self.ui.config(self.startup_progress_label, text="Błąd uruchamiania ❌", foreground="red")
+        self._show_progress("determinate", value=0, style="red.Horizontal.TProgressbar")
 
-    def _read_process_output(self, process, name):
-        """Czyta wyjście procesu i umieszcza je w kolejce logów."""
-        for line in process.stdout:
-            tag = self._get_log_tag(line) 
-            self.log_queue.put((f"[{name.upper().replace(' ', '_')}_OUTPUT] {line.strip()}", tag)) 
 
     def stop_app_thread(self):
         """Zatrzymuje procesy w osobnym wątku."""
         self.log_message("Rozpoczynam zamykanie aplikacji.", level="INFO", component="ZAMYKANIE")
-        self.start_button.config(state=tk.DISABLED, style="TButton")
-        self.stop_button.config(state=tk.DISABLED, style="TButton")
+        self.ui.config(self.start_button, state=tk.DISABLED, style="TButton")
+        self.ui.config(self.stop_button, state=tk.DISABLED, style="TButton")
         # Przycisk admina nie istnieje, więc go nie konfigurujemy
-        
-        self.startup_progress_label.config(text="Zatrzymuję procesy...", foreground="orange")
-        self.startup_progressbar.config(mode="indeterminate", style="Yellow.Horizontal.TProgressbar")
-        self.startup_progressbar.start()
-        self.backend_game_status_label.config(text="Zatrzymuję...", foreground="orange")
-        self.game_port_status_label.config(text=f"Port: {BACKEND_PORT} (Zatrzymuję...)", foreground="orange")
 
+        self.ui.config(self.startup_progress_label, text="Zatrzymuję procesy...", foreground="orange")
+        self._show_progress("indeterminate", style="Yellow.Horizontal.TProgressbar")
+        self.ui.config(self.backend_game_status_label, text="Zatrzymuję...", foreground="orange")
+        self.ui.config(self.game_port_status_label, text=f"Port: {self.backend_port} (Zatrzymuję...)", foreground="orange")
+
+        self.shutdown_complete.clear()
         threading.Thread(target=self._stop_app_logic, daemon=True).start()
         self.log_message("Wątek zamykania aplikacji rozpoczęty.", level="DEBUG", component="ZAMYKANIE")
 
-    def _stop_app_logic(self):
-        """Logika zamykania backendu i frontendu."""
-        self.log_message("Rozpoczynam logikę zamykania...", level="DEBUG", component="ZAMYKANIE")
-        
-        self.terminate_process(self.frontend_game_process, "frontend gry")
-        # Usunięto zamykanie panelu admina
-        self.terminate_process(self.backend_game_process, "backend gry") 
-        
-        self.log_message("Wszystkie procesy zostały zamknięte.", level="INFO", component="ZAMYKANIE")
-        self.backend_game_process = None
-        self.frontend_game_process = None
-
-        # Resetuj UI po zamknięciu
-        self.start_button.config(state=tk.NORMAL, style="Accent.TButton")
-        self.stop_button.config(state=tk.DISABLED, style="Danger.TButton")
-        # Przycisk admina nie istnieje
-        # self.admin_panel_button.config(state=tk.DISABLED, style="Purple.TButton") 
-        self.backend_game_status_label.config(text="Nie uruchomiony ❌", foreground="orange")
-        self.game_port_status_label.config(text=f"Port: {BACKEND_PORT} (Wolny)", foreground="green")
-        self.startup_progress_label.config(text="Gotowy do uruchomienia", foreground="blue")
-        self.startup_progressbar.stop()
-        self.startup_progressbar.config(value=0, style="blue.Horizontal.TProgressbar")
-        self.log_message("UI zresetowane po zamknięciu procesów.", level="DEBUG", component="ZAMYKANIE")
-
-
-    def terminate_process(self, process, name):
-        """Pomocnicza funkcja do eleganckiego zamykania procesu potomnego."""
-        if process and process.poll() is None: 
-            self.log_message(f"Próba zakończenia procesu {name} (PID: {process.pid})...", level="INFO", component="ZAMYKANIE")
-            try:
-                process.terminate() 
-                process.wait(timeout=5) 
-                if process.poll() is None: 
-                    self.log_message(f"Proces {name} nie zamknął się czysto, zabijam go (PID: {process.pid}).", level="WARNING", component="ZAMYKANIE")
-                    process.kill() 
-            except Exception as e:
-                self.log_message(f"Błąd podczas zamykania {name}: {e}", level="ERROR", component="ZAMYKANIE")
-
     def on_closing(self):
         """Obsługuje zdarzenie zamknięcia okna launchera."""
         self.log_message("Użytkownik próbuje zamknąć launcher.", level="INFO", component="GUI_EVENT")
         if messagebox.askokcancel("Zamknij Launcher", "Czy na pewno chcesz zamknąć GeoGuessr Launcher i wszystkie uruchomione procesy?"):
             self.log_message("Zamykanie launchera potwierdzone przez użytkownika.", level="INFO", component="GUI_EVENT")
+            # Okno zostanie zniszczone w wątku Tk dopiero po faktycznym zamknięciu procesów (on_app_stopped)
+            self._closing = True
             self.stop_app_thread() 
-            # Daj czas na zakończenie wątku stop_app_thread, zanim zniszczymy okno
-            self.after(2000, self.destroy) # destroy musi być w głównym wątku Tkinter
-
-    def is_port_available(self, port):
-        """Sprawdza, czy dany port jest wolny."""
-        self.log_message(f"Sprawdzam dostępność portu: {port}", level="DEBUG", component="SIEĆ")
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            try:
-                s.bind(("127.0.0.1", port))
-                self.log_message(f"Port {port} jest wolny.", level="DEBUG", component="SIEĆ")
-                return True
-            except socket.error as e: 
-                self.log_message(f"Port {port} jest zajęty: {e}", level="WARNING", component="SIEĆ")
-                return False
-
-    def is_backend_listening(self, port):
-        """Sprawdza, czy serwer nasłuchuje na swoim porcie poprzez zapytanie HTTP."""
-        try:
-            response = requests.get(f"http://127.0.0.1:{port}/", timeout=1) 
-            if response.status_code == 200:
-                self.log_message(f"Serwer nasłuchuje na porcie {port} (status 200).", level="DEBUG", component="SIEĆ")
-                return True
-            else:
-                self.log_message(f"Serwer nasłuchuje na porcie {port}, ale zwrócił status {response.status_code}.", level="WARNING", component="SIEĆ")
-                return False
-        except requests.exceptions.RequestException as e: 
-            self.log_message(f"Błąd połączenia z serwerem na porcie {port}: {e}", level="WARNING", component="SIEĆ")
-            return False
+
+    def destroy(self):
+        """Zamyka okno po zatrzymaniu próbkowania procesów i zapisaniu zaległych logów na dysk."""
+        self.ui.stop()
+        self.stop_process_metrics()
+        self.stop_zygote()
+        self.stop_config_watcher()
+        self.stop_output_recording()
+        self.log_store.close()
+        tk.Tk.destroy(self)
 
     def check_backend_status_periodically(self):
-        """Sprawdza status backendu gry i aktualizuje etykiety co 1 sekundę."""
-        self.log_message("Cykliczne sprawdzanie statusu backendu gry.", level="DEBUG", component="MONITORING")
-        # Sprawdź status backendu gry
-        if self.backend_game_process and self.backend_game_process.poll() is None: 
-            if self.is_backend_listening(BACKEND_PORT):
-                self.backend_game_status_label.config(text="Aktywny ✅", foreground="green") 
-                self.game_port_status_label.config(text=f"Port: {BACKEND_PORT} (Nasłuchuje)", foreground="green")
-            else:
-                self.backend_game_status_label.config(text="Uruchomiony, ale nie nasłuchuje ⚠️", foreground="orange") 
-                self.game_port_status_label.config(text=f"Port: {BACKEND_PORT} (Problem)", foreground="red")
-        else: # Proces nie uruchomiony lub zakończył się
+        """Stosuje w GUI zmiany stanu backendu zgłoszone przez monitor (tylko przejścia, bez I/O sieciowego)."""
+        if self._closing and self.shutdown_complete.is_set():
+            self.destroy() # Zamykanie zakończone - niszczymy okno w wątku Tk
+            return
+        sample = None
+        while not self.monitor_events.empty():
+            sample = self.monitor_events.get_nowait() # Liczy się tylko najnowszy stan
+        if sample is not None:
+            self._apply_backend_state(sample)
+        self._update_supervisor_label()
+        self._update_worker_labels()
+        self.after(MONITOR_EVENTS_POLL_INTERVAL, self.check_backend_status_periodically) 
+
+    def _apply_backend_state(self, sample):
+        """Aktualizuje etykiety statusu backendu gry zgodnie z nowym stanem."""
+        if sample.state == STATE_ACTIVE:
+            self.backend_game_status_label.config(text="Aktywny ✅", foreground="green") 
+            self.game_port_status_label.config(text=f"Port: {self.backend_port} (Nasłuchuje)", foreground="green")
+        elif sample.state == STATE_NOT_LISTENING:
+            self.backend_game_status_label.config(text="Uruchomiony, ale nie nasłuchuje ⚠️", foreground="orange") 
+            self.game_port_status_label.config(text=f"Port: {self.backend_port} (Problem)", foreground="red")
+        elif sample.state == STATE_STOPPED_PORT_FREE:
             self.backend_game_status_label.config(text="Nie uruchomiony ❌", foreground="orange") 
-            if self.is_port_available(BACKEND_PORT): 
-                self.game_port_status_label.config(text=f"Port: {BACKEND_PORT} (Wolny)", foreground="green") 
-            else:
-                self.game_port_status_label.config(text=f"Port: {BACKEND_PORT} (Zajęty)", foreground="red")
-        
-        # Brak panelu admina, więc usunięto jego sprawdzanie
-        
-        self.after(CONNECTION_CHECK_INTERVAL, self.check_backend_status_periodically) 
+            self.game_port_status_label.config(text=f"Port: {self.backend_port} (Wolny)", foreground="green") 
+        elif sample.state == STATE_STOPPED_PORT_BUSY:
+            self.backend_game_status_label.config(text="Nie uruchomiony ❌", foreground="orange") 
+            self.game_port_status_label.config(text=f"Port: {self.backend_port} (Zajęty)", foreground="red")
         
+    def _update_supervisor_label(self):
+        """Pokazuje liczbę restartów backendu i czas od ostatniego (tylko przy zmianie tekstu)."""
+        since = self.time_since_last_backend_restart()
+        text = f"Restarty: {self.backend_restart_count()}"
+        if since is not None:
+            text += f" (ostatni {since:.0f}s temu)"
+        if text != self.supervisor_status_label.cget("text"):
+            self.supervisor_status_label.config(text=text)
+
+    def _update_worker_labels(self):
+        """Pokazuje stan każdego workera puli (proces i obecność w rotacji proxy) bez I/O sieciowego."""
+        workers = self.backend_workers if len(self.backend_workers) > 1 else []
+        if set(self.worker_status_labels) != {w.port for w in workers}:
+            for label in self.worker_status_labels.values():
+                label.destroy()
+            self.worker_status_labels = {}
+            for worker in workers:
+                label = ttk.Label(self.worker_status_frame, style="Gray.TLabel", font=("Arial", 8))
+                label.pack(side="left", padx=(0, 4), pady=(5, 0))
+                self.worker_status_labels[worker.port] = label
+
+        proxy_stats = {b["port"]: b for b in self.backend_proxy.stats()} if self.backend_proxy else {}
+        for worker in workers:
+            stats = proxy_stats.get(worker.port)
+            if not worker.is_alive():
+                text, style = f"W{worker.index + 1}:{worker.port} ❌", "Red.TLabel"
+            elif stats is not None and not stats["available"]:
+                text, style = f"W{worker.index + 1}:{worker.port} ⚠️", "Yellow.TLabel"
+            else:
+                active = stats["active"] if stats else 0
+                text, style = f"W{worker.index + 1}:{worker.port} ✅ {active}", "Green.TLabel"
+            label = self.worker_status_labels[worker.port]
+            if label.cget("text") != text:
+                label.config(text=text, style=style)
+
+    def update_metrics_view_periodically(self):
+        """Rysuje wykresy zużycia CPU i pamięci procesów na podstawie historii z ProcessSampler."""
+        snapshot = self.process_sampler.snapshot() if self.process_sampler else {}
+        if set(self.metrics_widgets) != set(snapshot):
+            for widgets in self.metrics_widgets.values():
+                widgets[0].destroy()
+            self.metrics_widgets = {}
+            for i, name in enumerate(sorted(snapshot)):
+                frame = ttk.Frame(self.metrics_frame)
+                frame.grid(row=i // METRICS_PER_ROW, column=i % METRICS_PER_ROW, sticky="w", padx=(0, 8))
+                ttk.Label(frame, text=name, font=("Arial", 8)).pack(anchor="w")
+                canvas = tk.Canvas(frame, width=SPARKLINE_WIDTH, height=SPARKLINE_HEIGHT, bg="#FFFFFF", highlightthickness=0)
+                canvas.pack(side="left")
+                cpu_line = canvas.create_line(0, 0, 0, 0, fill="#1565C0")
+                rss_line = canvas.create_line(0, 0, 0, 0, fill="#FF8F00")
+                label = ttk.Label(frame, font=("Arial", 8))
+                label.pack(side="left", padx=(4, 0))
+                self.metrics_widgets[name] = (frame, canvas, cpu_line, rss_line, label)
+
+        for name, (pid, samples) in snapshot.items():
+            if not samples:
+                continue
+            _frame, canvas, cpu_line, rss_line, label = self.metrics_widgets[name]
+            cpu = [s.cpu_percent for s in samples]
+            rss = [s.rss_bytes for s in samples]
+            canvas.coords(cpu_line, *self._sparkline_points(cpu, max(100.0, max(cpu))))
+            canvas.coords(rss_line, *self._sparkline_points(rss, max(rss)))
+            last = samples[-1]
+            text = f"{last.cpu_percent:.0f}% {last.rss_bytes / 1048576:.0f}MB"
+            if label.cget("text") != text:
+                label.config(text=text)
+        self.after(METRICS_VIEW_INTERVAL, self.update_metrics_view_periodically)
+
+    def _sparkline_points(self, values, peak):
+        """Współrzędne linii wykresu dla wartości przeskalowanych do `peak` (najnowsze po prawej)."""
+        if len(values) < 2:
+            values = values * 2
+        step = (SPARKLINE_WIDTH - 1) / (self.process_sampler.history_size - 1)
+        offset = SPARKLINE_WIDTH - 1 - step * (len(values) - 1)
+        points = []
+        for i, value in enumerate(values):
+            points.append(offset + i * step)
+            points.append(SPARKLINE_HEIGHT - 1 - (SPARKLINE_HEIGHT - 2) * value / (peak or 1))
+        return points
+
     def open_admin_panel(self): # Funkcja nadal istnieje, ale przycisk jest usunięty z GUI
         """Otwiera panel admina w domyślnej przeglądarce."""
         self.log_message("Użytkownik próbował otworzyć panel admina, ale funkcja jest niedostępna.", level="WARNING", component="GUI_EVENT")
@@ -553,8 +775,20 @@ class AppLauncher(tk.Tk):
         self.log_message("Ręczne sprawdzanie aktualizacji...", level="INFO", component="AKTUALIZACJE")
         threading.Thread(target=self._perform_update_check, args=(True,), daemon=True).start()
 
+    def _check_for_updates_when_idle(self):
+        """Odkłada automatyczne sprawdzenie, dopóki trwa uruchamianie gry lub zamykanie."""
+        if self._closing:
+            return
+        if self._app_starting:
+            self.after(UPDATE_CHECK_DELAY, self._check_for_updates_when_idle)
+            return
+        self.after_idle(self.check_for_updates)
+
     def check_for_updates(self):
-        """Automatyczne sprawdzanie aktualizacji przy starcie launchera."""
+        """Automatyczne sprawdzanie aktualizacji (wynik z pamięci podręcznej, jeśli jest aktualny)."""
+        if not self.update_checker.should_check() and self.update_checker.state.get("version") is None:
+            self.log_message("Pomijam sprawdzanie aktualizacji - poprzednia próba niedawno się nie powiodła.", level="DEBUG", component="AKTUALIZACJE")
+            return
         self.log_message(f"Automatyczne sprawdzanie aktualizacji (bieżąca wersja: {APP_VERSION})...", level="INFO", component="AKTUALIZACJE")
         threading.Thread(target=self._perform_update_check, args=(False,), daemon=True).start()
 
@@ -562,38 +796,47 @@ class AppLauncher(tk.Tk):
         """Logika sprawdzania aktualizacji."""
         self.log_message("Rozpoczynam logikę sprawdzania aktualizacji.", level="DEBUG", component="AKTUALIZACJE")
         try:
-            response = requests.get(UPDATE_CHECK_URL, timeout=5)
-            response.raise_for_status()
-            latest_version = response.text.strip()
-            
-            self.log_message(f"Znaleziono najnowszą wersję online: {latest_version}", level="INFO", component="AKTUALIZACJE")
+            result = self.update_checker.check(force=manual_check)
+            latest_version = result.version
+
+            if result.source == "network":
+                self.log_message(f"Znaleziono najnowszą wersję online: {latest_version}", level="INFO", component="AKTUALIZACJE")
+            elif result.source == "not_modified":
+                self.log_message(f"Wersja online bez zmian (304): {latest_version}", level="INFO", component="AKTUALIZACJE")
+            else:
+                self.log_message(f"Najnowsza wersja z pamięci podręcznej (sprzed {result.age / 60:.0f} min): {latest_version}", level="INFO", component="AKTUALIZACJE")
 
             if self._compare_versions(APP_VERSION, latest_version):
                 self.log_message(f"Nowsza wersja ({latest_version}) dostępna. Bieżąca: {APP_VERSION}.", level="INFO", component="AKTUALIZACJE")
-                if messagebox.askyesno("Dostępna Aktualizacja", 
-                                       f"Dostępna jest nowsza wersja launchera: {latest_version}.\n"
-                                       f"Twoja wersja: {APP_VERSION}.\n\n"
-                                       "Czy chcesz pobrać i zainstalować aktualizację teraz?\n"
-                                       "(Wymagany restart launchera)"):
-                    self.log_message("Użytkownik zaakceptował aktualizację.", level="INFO", component="AKTUALIZACJE")
-                    self._download_and_install_update(latest_version)
-                else:
-                    self.log_message("Aktualizacja odrzucona przez użytkownika.", level="INFO", component="AKTUALIZACJE")
+                self.ui.dialog(self._offer_update, latest_version) # Pytanie zadaje wątek Tk
             else:
                 self.log_message(f"Używasz już najnowszej wersji: {APP_VERSION}", level="INFO", component="AKTUALIZACJE")
                 if manual_check:
-                    messagebox.showinfo("Aktualizacja", f"Używasz najnowszej wersji ({APP_VERSION}).")
+                    self.ui.dialog(messagebox.showinfo, "Aktualizacja", f"Używasz najnowszej wersji ({APP_VERSION}).")
 
-        except requests.exceptions.RequestException as e:
+        except UpdateCheckError as e:
             error_msg = f"Błąd połączenia podczas sprawdzania aktualizacji: {e}"
-            self.log_message(error_msg, level="ERROR", component="AKTUALIZACJE")
+            # Bez sieci automatyczne sprawdzenie to tylko ostrzeżenie; kolejna próba po UPDATE_FAILURE_RETRY
+            self.log_message(error_msg, level="ERROR" if manual_check else "WARNING", component="AKTUALIZACJE")
             if manual_check:
-                messagebox.showerror("Błąd Aktualizacji", error_msg + "\nSprawdź połączenie z internetem.")
+                self.ui.dialog(messagebox.showerror, "Błąd Aktualizacji", error_msg + "\nSprawdź połączenie z internetem.")
         except Exception as e:
             error_msg = f"Nieoczekiwany błąd podczas sprawdzania aktualizacji: {e}"
             self.log_message(error_msg, level="CRITICAL", component="AKTUALIZACJE")
             if manual_check:
-                messagebox.showerror("Błąd Aktualizacji", error_msg)
+                self.ui.dialog(messagebox.showerror, "Błąd Aktualizacji", error_msg)
+
+    def _offer_update(self, latest_version):
+        """Pyta o instalację nowej wersji (w wątku Tk) i po zgodzie pobiera ją w tle."""
+        if messagebox.askyesno("Dostępna Aktualizacja",
+                               f"Dostępna jest nowsza wersja launchera: {latest_version}.\n"
+                               f"Twoja wersja: {APP_VERSION}.\n\n"
+                               "Czy chcesz pobrać i zainstalować aktualizację teraz?\n"
+                               "(Wymagany restart launchera)"):
+            self.log_message("Użytkownik zaakceptował aktualizację.", level="INFO", component="AKTUALIZACJE")
+            threading.Thread(target=self._download_and_install_update, args=(latest_version,), daemon=True).start()
+        else:
+            self.log_message("Aktualizacja odrzucona przez użytkownika.", level="INFO", component="AKTUALIZACJE")
 
     def _compare_versions(self, current_v, latest_v):
         """Porównuje numery wersji (np. '1.0.0' vs '1.1.0')."""
@@ -603,47 +846,63 @@ class AppLauncher(tk.Tk):
         max_len = max(len(current_parts), len(latest_parts))
         current_parts += [0] * (max_len - len(current_parts))
         latest_parts += [0] * (max_len - len(latest_parts))
-        self.log_message(f"Porównywanie wersji: bieżąca {current_v} vs najnowsza {latest_v}", level="DEBUG", component="AKTUALIZACJE")
+        self.log_message("Porównywanie wersji: bieżąca %s vs najnowsza %s", current_v, latest_v, level="DEBUG", component="AKTUALIZACJE")
         return latest_parts > current_parts 
 
     def _download_and_install_update(self, latest_version):
         """Pobiera i instaluje nową wersję launchera."""
         self.log_message("Rozpoczynam pobieranie i instalację aktualizacji.", level="INFO", component="AKTUALIZACJE")
+        self.ui.config(self.startup_progress_label, text="Pobieram aktualizację...", foreground="blue")
+        self._show_progress("determinate", value=0)
         try:
-            response = requests.get(UPDATE_DOWNLOAD_URL, timeout=10)
-            response.raise_for_status()
-            new_launcher_code = response.text
-
-            temp_launcher_path = LAUNCHER_SCRIPT_PATH + ".new"
-            with open(temp_launcher_path, 'w') as f:
-                f.write(new_launcher_code)
-            self.log_message(f"Nowy launcher zapisany tymczasowo: {temp_launcher_path}", level="DEBUG", component="AKTUALIZACJE")
-            
-            backup_launcher_path = LAUNCHER_SCRIPT_PATH + ".bak"
-            shutil.copy2(LAUNCHER_SCRIPT_PATH, backup_launcher_path)
-            self.log_message(f"Utworzono kopię zapasową launchera: {backup_launcher_path}", level="DEBUG", component="AKTUALIZACJE")
-
-            os.replace(temp_launcher_path, LAUNCHER_SCRIPT_PATH)
-            self.log_message(f"Zastąpiono stary launcher nowym: {LAUNCHER_SCRIPT_PATH}", level="DEBUG", component="AKTUALIZACJE")
-            
+            manifest = fetch_json(UPDATE_MANIFEST_URL)
+            if manifest is not None:
+                files = parse_manifest(manifest, BASE_DIR)
+            else:
+                files = [UpdateFile(UPDATE_DOWNLOAD_URL, LAUNCHER_SCRIPT_PATH, fetch_sha256(UPDATE_DOWNLOAD_URL + ".sha256"))]
+            self.log_message("Pliki do aktualizacji: %s", ", ".join(os.path.relpath(f.path, BASE_DIR) for f in files), level="DEBUG", component="AKTUALIZACJE")
+
+            downloader = UpdateDownloader(
+                on_progress=self._on_update_download_progress,
+                log=lambda message, level, *args: self.log_message(message, *args, level=level, component="AKTUALIZACJE"),
+            )
+            downloader.install(files) # Pobranie i weryfikacja SHA-256 wszystkich plików, potem podmiana z kopiami .bak
+            self._show_progress("determinate", value=100, style="green.Horizontal.TProgressbar")
+            self.ui.config(self.startup_progress_label, text="Aktualizacja zainstalowana ✅", foreground="green")
+
             self.log_message(f"Launcher zaktualizowany do wersji {latest_version}!", level="SUCCESS", component="AKTUALIZACJE")
             self.log_message("Proszę ZAMKNĄĆ i PONOWNIE URUCHOMIĆ ten launcher, aby zastosować aktualizację.", level="INFO", component="AKTUALIZACJE")
-            messagebox.showinfo("Aktualizacja", f"Launcher został pomyślnie zaktualizowany do wersji {latest_version}!\n"
-                                              "Proszę ZAMKNĄĆ i PONOWNIE URUCHOMIĆ ten program, aby zastosować zmiany.")
-            
-            self.start_button.config(state=tk.DISABLED, style="TButton") 
-            self.stop_button.config(state=tk.DISABLED, style="TButton")
+            self.ui.dialog(messagebox.showinfo, "Aktualizacja", f"Launcher został pomyślnie zaktualizowany do wersji {latest_version}!\n"
+                                                                "Proszę ZAMKNĄĆ i PONOWNIE URUCHOMIĆ ten program, aby zastosować zmiany.")
+
+            self.ui.config(self.start_button, state=tk.DISABLED, style="TButton")
+            self.ui.config(self.stop_button, state=tk.DISABLED, style="TButton")
             # Przycisk admina nie istnieje
             # self.admin_panel_button.config(state=tk.DISABLED, style="TButton") 
 
-        except requests.exceptions.RequestException as e:
+        except UpdateDownloadError as e:
             error_msg = f"Błąd pobierania aktualizacji: {e}"
             self.log_message(error_msg, level="ERROR", component="AKTUALIZACJE")
-            messagebox.showerror("Błąd Aktualizacji", error_msg + "\nSprawdź połączenie z internetem.")
+            self._reset_update_progress()
+            self.ui.dialog(messagebox.showerror, "Błąd Aktualizacji", error_msg + "\nSprawdź połączenie z internetem. Kolejna próba wznowi pobieranie.")
         except Exception as e:
             error_msg = f"Błąd instalacji aktualizacji: {e}"
             self.log_message(error_msg, level="CRITICAL", component="AKTUALIZACJE")
-            messagebox.showerror("Błąd Aktualizacji", error_msg + "\nSpróbuj ponownie lub przywróć plik .bak.")
+            self._reset_update_progress()
+            self.ui.dialog(messagebox.showerror, "Błąd Aktualizacji", error_msg + "\nSpróbuj ponownie lub przywróć plik .bak.")
+
+    def _on_update_download_progress(self, done, total):
+        """Postęp pobierania aktualizacji na pasku uruchamiania (wywoływane z wątku pobierania)."""
+        if not total:
+            return
+        percent = min(100, done * 100 // total)
+        # Wywoływane dla każdego fragmentu; dispatcher zastosuje tylko ostatnią wartość w klatce
+        self.ui.config(self.startup_progressbar, value=percent)
+        self.ui.config(self.startup_progress_label, text=f"Pobieram aktualizację... {percent}% ({done / 1024:.0f} KiB)")
+
+    def _reset_update_progress(self):
+        self._show_progress("determinate", value=0)
+        self.ui.config(self.startup_progress_label, text="Aktualizacja nieudana ❌", foreground="red")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,264 @@
+import asyncio
+import itertools
+import json
+import socket
+import threading
+import time
+
+SUB_BUCKET_BITS = 8 # 256 kubełków na rząd wielkości - ok. 2 cyfry znaczące (jak HdrHistogram)
+ERROR_BACKOFF = 0.05 # Przerwa klienta po błędzie połączenia w trybie zamkniętej pętli (sekundy)
+MAX_HEADER_LINES = 100 # Ochrona przed nieskończonymi nagłówkami odpowiedzi
+
+
+class LatencyHistogram:
+    """Histogram opóźnień (mikrosekundy) z kubełkami log-liniowymi, jak HdrHistogram.
+
+    Względny błąd wartości percentyla nie przekracza ok. 1%, a pamięć rośnie logarytmicznie
+    z zakresem wartości, nie z liczbą pomiarów.
+    """
+    def __init__(self):
+        self.counts = {} # indeks kubełka -> liczba pomiarów
+        self.total = 0
+        self.min = None
+        self.max = 0
+        self.sum = 0
+
+    @staticmethod
+    def _index(value):
+        if value < (1 << SUB_BUCKET_BITS):
+            return value
+        shift = value.bit_length() - SUB_BUCKET_BITS
+        return (shift << (SUB_BUCKET_BITS - 1)) + (value >> shift)
+
+    @staticmethod
+    def _bucket_range(index):
+        """Zwraca (najmniejsza, największa) wartość należącą do kubełka."""
+        if index < (1 << SUB_BUCKET_BITS):
+            return index, index
+        shift = (index >> (SUB_BUCKET_BITS - 1)) - 1
+        low = (index - (shift << (SUB_BUCKET_BITS - 1))) << shift
+        return low, low + (1 << shift) - 1
+
+    def record(self, value_us):
+        value = max(0, int(value_us))
+        index = self._index(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.total += 1
+        self.sum += value
+        self.max = max(self.max, value)
+        self.min = value if self.min is None else min(self.min, value)
+
+    def merge(self, other):
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.total += other.total
+        self.sum += other.sum
+        self.max = max(self.max, other.max)
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+
+    def percentile(self, fraction):
+        """Wartość (µs), poniżej której leży `fraction` pomiarów; None dla pustego histogramu."""
+        if not self.total:
+            return None
+        target = max(1, round(fraction * self.total))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                return min(self._bucket_range(index)[1], self.max) # Górna granica kubełka, jak w HdrHistogram
+        return self.max
+
+    def mean(self):
+        return self.sum / self.total if self.total else None
+
+    def to_dict(self):
+        """Kubełki jako [[od_µs, do_µs, liczba], ...] - do eksportu JSON."""
+        return [[*self._bucket_range(index), self.counts[index]] for index in sorted(self.counts)]
+
+
+class LoadGenerator:
+    """Generator obciążenia backendu: `clients` współbieżnych klientów asyncio na połączeniach keep-alive.
+
+    Przy rate=None każdy klient wysyła kolejne żądanie zaraz po odpowiedzi (zamknięta pętla).
+    Przy stałym `rate` (żądań/s) planista rozdziela terminy żądań, a opóźnienie liczone jest od
+    planowanego terminu, więc przeciążony backend nie zaniża wyników (korekta coordinated omission).
+    Działa we własnym wątku z własną pętlą zdarzeń; snapshot() można wołać z dowolnego wątku.
+    """
+    def __init__(self, port, routes=("/",), clients=10, rate=None, duration=10.0, host="127.0.0.1", timeout=5.0):
+        self.host = host
+        self.port = port
+        self.routes = list(routes) or ["/"]
+        self.clients = max(1, int(clients))
+        self.rate = rate if rate else None
+        self.duration = duration
+        self.timeout = timeout
+        self.histogram = LatencyHistogram()
+        self.requests = 0
+        self.errors = 0
+        self.statuses = {} # kod HTTP (lub nazwa wyjątku) -> liczba
+        self.bytes_received = 0
+        self.started_at = None
+        self.finished_at = None
+        self._lock = threading.Lock()
+        self._loop = None
+        self._stop_event = None
+        self._thread = None
+        self._done = threading.Event()
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="LoadGenerator", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Przerywa test przed upływem `duration`."""
+        if self._loop is not None and self._stop_event is not None:
+            self._loop.call_soon_threadsafe(self._stop_event.set)
+
+    def wait(self, timeout=None):
+        return self._done.wait(timeout)
+
+    @property
+    def running(self):
+        return self._thread is not None and not self._done.is_set()
+
+    def _run(self):
+        try:
+            asyncio.run(self._main())
+        finally:
+            self.finished_at = time.monotonic()
+            self._done.set()
+
+    async def _main(self):
+        self._loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+        tokens = asyncio.Queue() if self.rate else None
+        self.started_at = time.monotonic()
+        tasks = [asyncio.create_task(self._client(i, tokens)) for i in range(self.clients)]
+        if tokens is not None:
+            tasks.append(asyncio.create_task(self._schedule(tokens)))
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), self.duration)
+        except asyncio.TimeoutError:
+            pass
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _schedule(self, tokens):
+        interval = 1.0 / self.rate
+        start = time.monotonic()
+        for k in itertools.count():
+            due = start + k * interval
+            delay = due - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tokens.put_nowait(due)
+
+    async def _client(self, index, tokens):
+        routes = itertools.cycle(self.routes[index % len(self.routes):] + self.routes[:index % len(self.routes)])
+        reader = writer = None
+        try:
+            while True:
+                due = await tokens.get() if tokens is not None else time.monotonic()
+                try:
+                    if writer is None:
+                        reader, writer = await asyncio.wait_for(asyncio.open_connection(self.host, self.port), self.timeout)
+                        writer.get_extra_info("socket").setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                    status, size, keep_alive = await asyncio.wait_for(self._request(reader, writer, next(routes)), self.timeout)
+                    self._record(due, status, size)
+                    if not keep_alive:
+                        writer.close()
+                        writer = None
+                except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError) as e:
+                    self._record(due, type(e).__name__, 0, error=True)
+                    if writer is not None:
+                        writer.close()
+                        writer = None
+                    if tokens is None:
+                        await asyncio.sleep(ERROR_BACKOFF)
+        finally:
+            if writer is not None:
+                writer.close()
+
+    async def _request(self, reader, writer, route):
+        writer.write(f"GET {route} HTTP/1.1\r\nHost: {self.host}:{self.port}\r\nConnection: keep-alive\r\n\r\n".encode("ascii"))
+        await writer.drain()
+        status_line = await reader.readline()
+        if not status_line:
+            raise asyncio.IncompleteReadError(b"", None)
+        status = int(status_line.split()[1])
+        headers = {}
+        for _ in range(MAX_HEADER_LINES):
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        keep_alive = headers.get("connection", "").lower() != "close" and not status_line.startswith(b"HTTP/1.0")
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            size = 0
+            while True:
+                chunk_size = int((await reader.readline()).split(b";")[0], 16)
+                await reader.readexactly(chunk_size + 2)
+                size += chunk_size
+                if chunk_size == 0:
+                    break
+        elif "content-length" in headers:
+            size = int(headers["content-length"])
+            await reader.readexactly(size)
+        else:
+            size = len(await reader.read()) # Treść do końca połączenia
+            keep_alive = False
+        return status, size, keep_alive
+
+    def _record(self, due, status, size, error=False):
+        latency_us = (time.monotonic() - due) * 1_000_000
+        with self._lock:
+            self.requests += 1
+            self.statuses[status] = self.statuses.get(status, 0) + 1
+            self.bytes_received += size
+            if error or status >= 500:
+                self.errors += 1
+            else:
+                self.histogram.record(latency_us)
+
+    def snapshot(self):
+        """Bieżące wyniki: przepustowość, percentyle opóźnień (ms), błędy i kody odpowiedzi."""
+        with self._lock:
+            end = self.finished_at or time.monotonic()
+            elapsed = end - self.started_at if self.started_at else 0.0
+            hist = self.histogram
+
+            def ms(value):
+                return None if value is None else round(value / 1000, 3)
+            return {
+                "mode": "open" if self.rate else "closed",
+                "target_rate": self.rate,
+                "clients": self.clients,
+                "routes": list(self.routes),
+                "elapsed": round(elapsed, 3),
+                "requests": self.requests,
+                "errors": self.errors,
+                "throughput": round(self.requests / elapsed, 1) if elapsed else 0.0,
+                "bytes_received": self.bytes_received,
+                "latency_ms": {
+                    "p50": ms(hist.percentile(0.50)),
+                    "p95": ms(hist.percentile(0.95)),
+                    "p99": ms(hist.percentile(0.99)),
+                    "max": ms(hist.max if hist.total else None),
+                    "mean": ms(hist.mean()),
+                },
+                "statuses": {str(k): v for k, v in self.statuses.items()},
+            }
+
+    def histogram_buckets(self):
+        with self._lock:
+            return self.histogram.to_dict()
+
+    def export_json(self, path):
+        """Zapisuje wyniki i kubełki histogramu do pliku JSON."""
+        data = self.snapshot()
+        data["histogram_us"] = self.histogram_buckets()
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
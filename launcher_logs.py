@@ -0,0 +1,234 @@
+import datetime
+import re
+import time
+from queue import Empty, Queue
+
+# --- Domyślne ustawienia ujścia logów ---
+DEFAULT_MAX_LINES = 5000 # Maksymalna liczba linii przechowywanych w polu logów
+DEFAULT_BATCH_SIZE = 1000 # Maksymalna liczba linii wstawianych w jednym cyklu
+DEFAULT_DRAIN_INTERVAL = 50 # Odstęp między cyklami opróżniania kolejki (ms)
+
+# --- Poziomy logów (wyższa liczba = ważniejszy) ---
+LOG_LEVEL_PRIORITIES = {"DEBUG": 10, "INFO": 20, "SUCCESS": 25, "WARNING": 30, "ERROR": 40, "CRITICAL": 50}
+WALL_CLOCK_OFFSET = time.time() - time.monotonic() # Przeliczenie znacznika monotonicznego na czas ścienny
+
+# Znaczniki logów procesów potomnych w kolejności pierwszeństwa (pierwsze dopasowanie wygrywa)
+LOG_TAG_RULES = (
+    ("FRONTEND_INFO", "FRONTEND"),
+    ("FRONTEND_BŁĄD", "ERROR"), ("FRONTEND_ERROR", "ERROR"),
+    ("FRONTEND_SUKCES", "SUCCESS"), ("FRONTEND_SUCCESS", "SUCCESS"),
+    ("FRONTEND_LICENCJA", "LICENCJA"),
+    ("FRONTEND_KRYTYCZNY", "CRITICAL"), ("FRONTEND_CRITICAL", "CRITICAL"),
+
+    ("BACKEND_INFO", "BACKEND"),
+    ("BACKEND_DEBUG", "DEBUG"),
+    ("BACKEND_SUKCES", "SUCCESS"), ("BACKEND_SUCCESS", "SUCCESS"),
+    ("BACKEND_BŁĄD", "ERROR"), ("BACKEND_ERROR", "ERROR"),
+    ("BACKEND_LICENCJA", "LICENCJA"),
+    ("BACKEND_KRYTYCZNY", "CRITICAL"), ("BACKEND_CRITICAL", "CRITICAL"),
+
+    ("PANEL_ADMINA_FLASK_OUTPUT", "BACKEND"), # Nadal używamy tego taga dla logów z admina
+    ("BACKEND_GRY_OUTPUT", "BACKEND"),
+
+    ("LAUNCHER", "LAUNCHER"),
+    ("LAUNCHER_ERROR", "ERROR"),
+    ("LAUNCHER_WARNING", "WARNING"),
+
+    ("INFO", "INFO"),
+    ("WARNING", "WARNING"),
+    ("ERROR", "ERROR"),
+    ("CRITICAL", "CRITICAL"),
+)
+
+
+class LogQueue(Queue):
+    """Kolejka wpisów logu z opcjonalnym obserwatorem (np. pomiar opóźnień przy odtwarzaniu sesji wyjścia).
+
+    observer.put(wpis) i observer.get(wpis) są wywoływane pod blokadą kolejki, więc muszą być krótkie.
+    """
+    def __init__(self):
+        Queue.__init__(self)
+        self.observer = None
+
+    def _put(self, item):
+        Queue._put(self, item)
+        if self.observer is not None:
+            self.observer.put(item)
+
+    def _get(self):
+        item = Queue._get(self)
+        if self.observer is not None:
+            self.observer.get(item)
+        return item
+
+
+class LogRecord:
+    """Ustrukturyzowany wpis logu. Tekst powstaje dopiero przy wyświetleniu lub zapisie (format())."""
+    __slots__ = ("level", "component", "created", "msg", "args", "tag", "_message")
+
+    def __init__(self, level, component, msg, args=(), tag=None, created=None):
+        self.level = level
+        self.component = component
+        self.created = time.monotonic() if created is None else created # Znacznik monotoniczny
+        self.msg = msg
+        self.args = args # Argumenty formatowania %, stosowane leniwie
+        self.tag = tag or level # Tag kolorowania w GUI
+        self._message = None
+
+    @property
+    def message(self):
+        if self._message is None:
+            self._message = self.msg
+            if self.args:
+                try:
+                    self._message = self.msg % self.args
+                except (TypeError, ValueError):
+                    self._message = f"{self.msg} {self.args!r}"
+        return self._message
+
+    @property
+    def wall_time(self):
+        """Czas uniksowy wpisu."""
+        return WALL_CLOCK_OFFSET + self.created
+
+    def format(self):
+        timestamp = datetime.datetime.fromtimestamp(self.wall_time).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3] # ms
+        return f"[{timestamp}] [{self.level}] [{self.component}] {self.message}"
+
+
+class OutputLogRecord(LogRecord):
+    """Linia wyjścia procesu potomnego; poziomem jest tag z LogTagClassifier (lub OUTPUT)."""
+    __slots__ = ()
+
+    def format(self):
+        return f"[{self.component}_OUTPUT] {self.message}"
+
+
+def level_priority(level):
+    """Priorytet poziomu; nieznane poziomy (np. tagi wyjścia procesów) nie są odfiltrowywane."""
+    return LOG_LEVEL_PRIORITIES.get(level, 100)
+
+
+class LogTagClassifier:
+    """Wyznacza tag linii logu jednym przebiegiem skompilowanego wyrażenia po znacznikach [KOMPONENT_POZIOM]."""
+    def __init__(self, extra_rules=None):
+        self._table = {}
+        # Reguły użytkownika mają pierwszeństwo przed wbudowanymi
+        rules = list((extra_rules or {}).items()) + list(LOG_TAG_RULES)
+        for priority, (marker, tag) in enumerate(rules):
+            marker = marker.strip("[]")
+            if marker and marker not in self._table:
+                self._table[marker] = (priority, tag)
+        alternatives = "|".join(re.escape(marker) for marker in sorted(self._table, key=len, reverse=True))
+        self._findall = re.compile(r"\[(" + alternatives + r")\]").findall
+
+    def classify(self, line):
+        """Zwraca tag dla linii albo None, jeśli nie zawiera znanego znacznika."""
+        found = self._findall(line)
+        if not found:
+            return None
+        if len(found) == 1:
+            return self._table[found[0]][1]
+        return min(map(self._table.__getitem__, found))[1] # Najwyższy priorytet jak w dawnym łańcuchu if/elif
+
+class LogSink:
+    """Opróżnia kolejkę logów partiami w wątku Tk i utrzymuje ograniczoną historię w widżecie Text."""
+    def __init__(self, text_widget, log_queue, max_lines=DEFAULT_MAX_LINES,
+                 batch_size=DEFAULT_BATCH_SIZE, interval=DEFAULT_DRAIN_INTERVAL, on_stats=None):
+        self.text_widget = text_widget
+        self.log_queue = log_queue
+        self.max_lines = max(1, int(max_lines))
+        self.batch_size = max(1, int(batch_size))
+        self.interval = interval
+        self.on_stats = on_stats # Wywoływane z (queued, dropped) tylko przy zmianie wartości
+
+        self.line_count = 0 # Liczba linii aktualnie w widżecie
+        self.displayed = 0 # Linie wstawione do widżetu
+        self.dropped = 0 # Linie pominięte, bo i tak wypadłyby poza historię
+        self.trimmed = 0 # Linie usunięte z początku widżetu (bufor cykliczny)
+        self._last_stats = None
+        self._after_id = None
+
+    def start(self):
+        """Planuje cykliczne opróżnianie kolejki w pętli zdarzeń Tk."""
+        if self._after_id is None:
+            self._after_id = self.text_widget.after(self.interval, self._drain)
+
+    def stop(self):
+        if self._after_id is not None:
+            self.text_widget.after_cancel(self._after_id)
+            self._after_id = None
+
+    def stats(self):
+        """Zwraca liczniki ujścia logów."""
+        return {
+            "queued": self.log_queue.qsize(),
+            "displayed": self.displayed,
+            "dropped": self.dropped,
+            "trimmed": self.trimmed,
+            "lines": self.line_count,
+        }
+
+    def _drain(self):
+        try:
+            self._skip_overflow()
+            batch = []
+            while len(batch) < self.batch_size:
+                try:
+                    item = self.log_queue.get_nowait()
+                except Empty:
+                    break
+                if isinstance(item, list): # Partia linii z czytnika wyjścia procesów
+                    batch.extend(item)
+                else:
+                    batch.append(item)
+            if batch:
+                self.write(batch)
+            self._report_stats()
+        finally:
+            self._after_id = self.text_widget.after(self.interval, self._drain)
+
+    def _skip_overflow(self):
+        """Pomija najstarsze zaległe wpisy, których i tak nie zmieściłaby historia (partie liczą się jako jeden)."""
+        excess = self.log_queue.qsize() - self.max_lines
+        for _ in range(max(0, excess)):
+            try:
+                item = self.log_queue.get_nowait()
+            except Empty:
+                break
+            self.dropped += len(item) if isinstance(item, list) else 1
+
+    def write(self, entries):
+        """Wstawia partię wpisów LogRecord jedną operacją i przycina historię."""
+        if len(entries) > self.max_lines:
+            self.dropped += len(entries) - self.max_lines
+            entries = entries[-self.max_lines:]
+
+        args = []
+        lines = 0
+        for record in entries:
+            message = record.format()
+            args.append(message + "\n")
+            args.append(record.tag or ())
+            lines += message.count("\n") + 1
+
+        widget = self.text_widget
+        widget.config(state="normal")
+        widget.insert("end", *args)
+        self.line_count += lines
+        self.displayed += len(entries)
+        excess = self.line_count - self.max_lines
+        if excess > 0:
+            widget.delete("1.0", f"{excess + 1}.0")
+            self.line_count -= excess
+            self.trimmed += excess
+        widget.see("end")
+        widget.config(state="disabled")
+
+    def _report_stats(self):
+        if self.on_stats is None:
+            return
+        current = (self.log_queue.qsize(), self.dropped)
+        if current != self._last_stats:
+            self._last_stats = current
+            self.on_stats(*current)
@@ -0,0 +1,337 @@
+import gzip
+import json
+import os
+import re
+import shutil
+import threading
+from collections import deque
+from queue import Queue, Empty
+
+SEGMENT_PREFIX = "launcher-"
+INDEX_FILE_NAME = "index.json"
+WRITER_BATCH_SIZE = 500 # Maks. liczba linii zapisywanych jednym write()
+SEGMENT_PATTERN = re.compile(re.escape(SEGMENT_PREFIX) + r"(\d+)\.log(\.gz)?$")
+ESCAPE_PATTERN = re.compile(r"\\(.)") # Sekwencje z _encode_line, dekodowane w jednym przejściu od lewej
+UNESCAPED = {"n": "\n", "r": "\r", "\\": "\\"}
+
+
+class StoredRecord:
+    """Linia logu odczytana z magazynu."""
+    __slots__ = ("timestamp", "level", "component", "message")
+
+    def __init__(self, timestamp, level, component, message):
+        self.timestamp = timestamp # Czas uniksowy (sekundy)
+        self.level = level
+        self.component = component
+        self.message = message
+
+
+def _escape(text):
+    return text.replace("\\", "\\\\").replace("\n", "\\n").replace("\r", "\\r")
+
+
+def _encode_line(timestamp, level, component, message):
+    return f"{timestamp:.3f}\t{level}\t{component}\t{_escape(message)}\n"
+
+
+def _decode_line(line):
+    parts = line.rstrip("\n").split("\t", 3)
+    if len(parts) != 4:
+        return None
+    try:
+        timestamp = float(parts[0])
+    except ValueError:
+        return None
+    message = ESCAPE_PATTERN.sub(lambda m: UNESCAPED.get(m.group(1), m.group(0)), parts[3])
+    return StoredRecord(timestamp, parts[1], parts[2], message)
+
+
+class SegmentIndex:
+    """Podsumowanie segmentu: zakres czasu oraz liczba linii według poziomu i komponentu."""
+    def __init__(self, name, start=None, end=None, lines=0, levels=None, components=None):
+        self.name = name
+        self.start = start
+        self.end = end
+        self.lines = lines
+        self.levels = levels or {}
+        self.components = components or {}
+
+    def add(self, timestamp, level, component):
+        if self.start is None:
+            self.start = timestamp
+        self.end = timestamp
+        self.lines += 1
+        self.levels[level] = self.levels.get(level, 0) + 1
+        self.components[component] = self.components.get(component, 0) + 1
+
+    def may_contain(self, levels=None, component=None, since=None, until=None):
+        """Czy segment może zawierać pasujące linie (pozwala pominąć go bez czytania)."""
+        if self.lines == 0:
+            return False
+        if levels is not None and not any(level in self.levels for level in levels):
+            return False
+        if component is not None and component not in self.components:
+            return False
+        if since is not None and self.end < since:
+            return False
+        if until is not None and self.start > until:
+            return False
+        return True
+
+    def to_dict(self):
+        return {"name": self.name, "start": self.start, "end": self.end, "lines": self.lines,
+                "levels": self.levels, "components": self.components}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["name"], data.get("start"), data.get("end"), data.get("lines", 0),
+                   data.get("levels"), data.get("components"))
+
+
+class LogStore:
+    """Trwały magazyn logów: buforowany zapis w wątku tła, rotacja po rozmiarze i kompresja segmentów.
+
+    append() tylko wstawia linię do kolejki. Zamknięte segmenty są kompresowane gzipem,
+    a najstarsze usuwane ponad max_segments. Mały indeks (index.json) pozwala wyszukiwaniu
+    pomijać segmenty spoza zakresu czasu, poziomu lub komponentu.
+    """
+    def __init__(self, directory, max_segment_bytes=5 * 1024 * 1024, max_segments=20, flush_interval=0.5):
+        self.directory = directory
+        self.max_segment_bytes = max_segment_bytes
+        self.max_segments = max_segments
+        self.flush_interval = flush_interval
+        self.enabled = True
+        self.segments = [] # SegmentIndex, od najstarszego
+        self._queue = Queue()
+        self._lock = threading.Lock() # Chroni listę segmentów i plik bieżącego segmentu
+        self._file = None
+        self._file_size = 0
+        self._thread = None
+        self._closed = threading.Event()
+
+    def append(self, record):
+        """Dodaje wpis LogRecord do zapisu (nie blokuje). Wpisy sprzed start() czekają w kolejce."""
+        if self.enabled:
+            self._queue.put(record)
+
+    def append_many(self, records):
+        """Dodaje partię wpisów jedną operacją na kolejce."""
+        if self.enabled and records:
+            self._queue.put(records)
+
+    def start(self):
+        """Otwiera katalog magazynu i uruchamia wątek zapisu. Rzuca OSError, gdy katalog jest niedostępny."""
+        os.makedirs(self.directory, exist_ok=True)
+        self._load_index()
+        self._open_new_segment()
+        self._thread = threading.Thread(target=self._run, name="LogStoreWriter", daemon=True)
+        self._thread.start()
+
+    def disable(self):
+        """Wyłącza magazyn przed start() i porzuca zgromadzone linie."""
+        self.enabled = False
+        self._queue = Queue()
+
+    def flush(self, timeout=5):
+        """Czeka, aż linie dodane do tej pory trafią na dysk (kolejne linie nie wydłużają oczekiwania)."""
+        if self._thread is not None and self._thread.is_alive():
+            marker = threading.Event()
+            self._queue.put(marker)
+            marker.wait(timeout)
+
+    def close(self):
+        """Zapisuje zaległe linie, zamyka bieżący segment i zapisuje indeks."""
+        self.enabled = False
+        if self._thread is None:
+            return
+        self._closed.set()
+        self._thread.join(timeout=5)
+        self._thread = None
+        with self._lock:
+            self._file.close()
+            self._file = None
+            if self.segments[-1].lines == 0: # Nie zostawiamy pustych segmentów po krótkich sesjach
+                os.remove(os.path.join(self.directory, self.segments.pop().name))
+            self._save_index()
+
+    # --- Zapis ---
+
+    def _run(self):
+        while True:
+            closing = self._closed.is_set()
+            batch = self._take_batch(timeout=self.flush_interval)
+            entries = []
+            markers = []
+            for item in batch:
+                if isinstance(item, threading.Event):
+                    markers.append(item)
+                elif isinstance(item, list):
+                    entries.extend(item)
+                else:
+                    entries.append(item)
+            if entries:
+                self._write_batch(entries)
+            for marker in markers:
+                marker.set() # Znacznik flush(): wszystko przed nim jest już zapisane
+            if not batch and closing:
+                break
+
+    def _take_batch(self, timeout):
+        try:
+            batch = [self._queue.get(timeout=timeout)]
+        except Empty:
+            return []
+        while len(batch) < WRITER_BATCH_SIZE:
+            try:
+                batch.append(self._queue.get_nowait())
+            except Empty:
+                break
+        return batch
+
+    def _write_batch(self, batch):
+        with self._lock:
+            current = self.segments[-1]
+            chunk = []
+            for record in batch: # Tekst wpisów formatowany dopiero tutaj, w wątku zapisu
+                timestamp = record.wall_time
+                chunk.append(_encode_line(timestamp, record.level, record.component, record.message))
+                current.add(timestamp, record.level, record.component)
+            data = "".join(chunk).encode("utf-8")
+            self._file.write(data)
+            self._file.flush()
+            self._file_size += len(data)
+            if self._file_size >= self.max_segment_bytes:
+                self._rotate()
+
+    def _rotate(self):
+        closed = self.segments[-1]
+        self._file.close()
+        self._compress(closed)
+        self._open_new_segment()
+        while len(self.segments) > self.max_segments:
+            oldest = self.segments.pop(0)
+            try:
+                os.remove(os.path.join(self.directory, oldest.name))
+            except OSError:
+                pass
+        self._save_index()
+
+    def _compress(self, segment):
+        path = os.path.join(self.directory, segment.name)
+        with open(path, "rb") as src, gzip.open(path + ".gz", "wb", compresslevel=6) as dst:
+            shutil.copyfileobj(src, dst)
+        os.remove(path)
+        segment.name += ".gz"
+
+    def _open_new_segment(self):
+        number = 1
+        if self.segments:
+            number = int(SEGMENT_PATTERN.match(self.segments[-1].name).group(1)) + 1
+        segment = SegmentIndex(f"{SEGMENT_PREFIX}{number:06d}.log")
+        self.segments.append(segment)
+        self._file = open(os.path.join(self.directory, segment.name), "ab")
+        self._file_size = 0
+
+    # --- Indeks ---
+
+    def _load_index(self):
+        """Wczytuje indeks; segmenty spoza indeksu (np. po awarii) indeksuje i kompresuje od nowa."""
+        indexed = {}
+        try:
+            with open(os.path.join(self.directory, INDEX_FILE_NAME), "r", encoding="utf-8") as f:
+                for data in json.load(f):
+                    indexed[data["name"]] = SegmentIndex.from_dict(data)
+        except (OSError, ValueError, KeyError):
+            pass
+        names = sorted((n for n in os.listdir(self.directory) if SEGMENT_PATTERN.match(n)),
+                       key=lambda n: int(SEGMENT_PATTERN.match(n).group(1)))
+        self.segments = []
+        for name in names:
+            if name.endswith(".gz"):
+                segment = indexed.get(name) or self._scan_segment(name)
+            else:
+                # Segment otwarty w chwili awarii - indeks nie zna jego końcówki, więc zawsze skanujemy go od nowa
+                segment = self._scan_segment(name)
+                self._compress(segment)
+            self.segments.append(segment)
+        self._save_index()
+
+    def _scan_segment(self, name):
+        segment = SegmentIndex(name)
+        for record in self._read_segment(name):
+            segment.add(record.timestamp, record.level, record.component)
+        return segment
+
+    def _save_index(self):
+        # Otwarty segment wciąż rośnie - jego wpis w indeksie byłby nieaktualny po awarii
+        closed = self.segments if self._file is None else self.segments[:-1]
+        path = os.path.join(self.directory, INDEX_FILE_NAME)
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump([segment.to_dict() for segment in closed], f)
+        os.replace(path + ".tmp", path)
+
+    # --- Wyszukiwanie ---
+
+    def _read_lines(self, name):
+        path = os.path.join(self.directory, name)
+        opener = gzip.open if name.endswith(".gz") else open
+        try:
+            # Tylko \n kończy linię - samotne \r (np. w starszych segmentach) nie dzieli wpisu
+            with opener(path, "rt", encoding="utf-8", errors="replace", newline="\n") as f:
+                yield from f
+        except (OSError, EOFError):
+            return # Segment usunięty przez rotację lub niedokończony po awarii
+
+    def _read_segment(self, name):
+        for line in self._read_lines(name):
+            record = _decode_line(line)
+            if record is not None:
+                yield record
+
+    def iter_records(self, text=None, levels=None, component=None, since=None, until=None):
+        """Strumieniowo zwraca pasujące linie, od najstarszych. Nie wczytuje segmentów do pamięci."""
+        self.flush()
+        with self._lock:
+            segments = [s for s in self.segments if s.may_contain(levels, component, since, until)]
+        needle = text.lower() if text else None
+        raw_needle = _escape(needle) if needle else None # Surowa linia ma znaki specjalne w postaci zakodowanej
+        for segment in segments:
+            for line in self._read_lines(segment.name):
+                if raw_needle is not None and raw_needle not in line.lower():
+                    continue # Tani filtr na surowej linii przed dekodowaniem
+                record = _decode_line(line)
+                if record is None:
+                    continue
+                if levels is not None and record.level not in levels:
+                    continue
+                if component is not None and record.component != component:
+                    continue
+                if since is not None and record.timestamp < since:
+                    continue
+                if until is not None and record.timestamp > until:
+                    break
+                if needle is not None and needle not in record.message.lower():
+                    continue
+                yield record
+
+    def search(self, text=None, levels=None, component=None, since=None, until=None, limit=1000):
+        """Zwraca (liczba_trafień, ostatnie `limit` pasujących linii) - pamięć ograniczona do `limit`."""
+        newest = deque(maxlen=limit)
+        matches = 0
+        for record in self.iter_records(text, levels, component, since, until):
+            newest.append(record)
+            matches += 1
+        return matches, list(newest)
+
+    def components(self):
+        """Wszystkie komponenty występujące w indeksie (do filtrów w GUI)."""
+        with self._lock:
+            names = set()
+            for segment in self.segments:
+                names.update(segment.components)
+        return sorted(names)
+
+    def stats(self):
+        with self._lock:
+            return {"segments": len(self.segments), "lines": sum(s.lines for s in self.segments),
+                    "queued": self._queue.qsize()}
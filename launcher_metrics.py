@@ -0,0 +1,173 @@
+import os
+import threading
+import time
+from collections import deque
+
+PROC_DIR = "/proc"
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+class ProcessSample:
+    """Pojedynczy pomiar procesu."""
+    __slots__ = ("timestamp", "cpu_percent", "rss_bytes", "threads", "open_fds")
+
+    def __init__(self, timestamp, cpu_percent, rss_bytes, threads, open_fds):
+        self.timestamp = timestamp
+        self.cpu_percent = cpu_percent # Procent jednego rdzenia od poprzedniego pomiaru
+        self.rss_bytes = rss_bytes
+        self.threads = threads
+        self.open_fds = open_fds
+
+
+def proc_available():
+    """Czy system udostępnia /proc (Linux)."""
+    return os.path.isdir(os.path.join(PROC_DIR, "self"))
+
+
+def read_proc_counters(pid):
+    """Czyta z /proc czas CPU (tiki), RSS, liczbę wątków i otwartych deskryptorów. Zwraca None, gdy proces zniknął."""
+    base = os.path.join(PROC_DIR, str(pid))
+    try:
+        with open(os.path.join(base, "stat"), "rb") as f:
+            stat = f.read()
+        # Nazwa procesu (pole 2) może zawierać spacje - dzielimy za ostatnim ')'
+        fields = stat[stat.rindex(b")") + 2:].split()
+        cpu_ticks = int(fields[11]) + int(fields[12]) # utime + stime
+        threads = int(fields[17])
+        rss_bytes = int(fields[21]) * PAGE_SIZE
+        try:
+            open_fds = len(os.listdir(os.path.join(base, "fd")))
+        except PermissionError:
+            open_fds = None
+        return cpu_ticks, rss_bytes, threads, open_fds
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class ProcessSampler:
+    """Próbkuje procesy potomne z /proc w wątku tła i trzyma historię o stałym rozmiarze dla każdego z nich.
+
+    get_targets() zwraca słownik {nazwa: pid} aktualnie działających procesów.
+    """
+    def __init__(self, get_targets, interval=1.0, history_size=60):
+        self.get_targets = get_targets
+        self.interval = interval
+        self.history_size = history_size
+        self.histories = {} # nazwa -> deque[ProcessSample]
+        self.pids = {} # nazwa -> pid
+        self._previous = {} # nazwa -> (pid, monotonic, cpu_ticks)
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None and proc_available():
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name="ProcessSampler", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 1)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            self.sample_once()
+            self._stop_event.wait(self.interval)
+
+    def sample_once(self):
+        targets = self.get_targets()
+        now = time.monotonic()
+        with self._lock:
+            for name in list(self.histories):
+                if name not in targets:
+                    del self.histories[name]
+                    self.pids.pop(name, None)
+                    self._previous.pop(name, None)
+            for name, pid in targets.items():
+                counters = read_proc_counters(pid)
+                if counters is None:
+                    continue
+                cpu_ticks, rss_bytes, threads, open_fds = counters
+                previous = self._previous.get(name)
+                cpu_percent = 0.0
+                if previous is not None and previous[0] == pid and now > previous[1]:
+                    cpu_percent = (cpu_ticks - previous[2]) / CLOCK_TICKS / (now - previous[1]) * 100
+                elif previous is not None and previous[0] != pid:
+                    self.histories.pop(name, None) # Nowy proces pod tą samą nazwą (np. po restarcie)
+                self._previous[name] = (pid, now, cpu_ticks)
+                self.pids[name] = pid
+                history = self.histories.setdefault(name, deque(maxlen=self.history_size))
+                history.append(ProcessSample(now, cpu_percent, rss_bytes, threads, open_fds))
+
+    def snapshot(self):
+        """Kopia historii: {nazwa: (pid, [ProcessSample, ...])}."""
+        with self._lock:
+            return {name: (self.pids.get(name), list(history)) for name, history in self.histories.items()}
+
+    def render_prometheus(self):
+        """Ostatnie pomiary w formacie tekstowym Prometheusa."""
+        metrics = (
+            ("geoguessr_process_cpu_percent", "CPU usage in percent of one core.", "cpu_percent"),
+            ("geoguessr_process_resident_memory_bytes", "Resident set size in bytes.", "rss_bytes"),
+            ("geoguessr_process_threads", "Number of OS threads.", "threads"),
+            ("geoguessr_process_open_fds", "Number of open file descriptors.", "open_fds"),
+        )
+        latest = {name: (pid, samples[-1]) for name, (pid, samples) in self.snapshot().items() if samples}
+        lines = []
+        for metric, help_text, attr in metrics:
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} gauge")
+            for name, (pid, sample) in sorted(latest.items()):
+                value = getattr(sample, attr)
+                if value is None:
+                    continue
+                if isinstance(value, float):
+                    value = round(value, 3)
+                label = name.replace("\\", "\\\\").replace('"', '\\"')
+                lines.append(f'{metric}{{process="{label}",pid="{pid}"}} {value}')
+        return "\n".join(lines) + "\n"
+
+
+class MetricsServer:
+    """Opcjonalny lokalny endpoint HTTP /metrics z danymi ProcessSampler w formacie Prometheusa."""
+    def __init__(self, sampler, port, host="127.0.0.1"):
+        self.sampler = sampler
+        self.port = port
+        self.host = host
+        self._server = None
+        self._thread = None
+
+    def start(self):
+        """Uruchamia serwer w wątku tła. Rzuca OSError, gdy port jest zajęty."""
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer # Import leniwy - endpoint jest opcjonalny
+        sampler = self.sampler
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = sampler.render_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass # Zapytania scraperów nie trafiają do logów launchera
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name="MetricsServer", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
@@ -0,0 +1,119 @@
+import socket
+import threading
+import time
+from collections import deque
+
+# --- Stany backendu gry widziane przez monitor ---
+STATE_ACTIVE = "active" # Proces działa i odpowiada na HTTP
+STATE_NOT_LISTENING = "not_listening" # Proces działa, ale nie odpowiada poprawnie
+STATE_STOPPED_PORT_FREE = "stopped_port_free" # Brak procesu, port wolny
+STATE_STOPPED_PORT_BUSY = "stopped_port_busy" # Brak procesu, port zajęty przez coś innego
+
+
+class HealthSample:
+    """Pojedynczy wynik sondy monitora."""
+    __slots__ = ("timestamp", "state", "latency", "http_status")
+
+    def __init__(self, timestamp, state, latency=None, http_status=None):
+        self.timestamp = timestamp # time.monotonic() w chwili sondy
+        self.state = state
+        self.latency = latency # Czas odpowiedzi HTTP (sekundy) lub None
+        self.http_status = http_status
+
+
+class HealthMonitor:
+    """Sonduje backend gry w wątku tła, używając jednej sesji HTTP keep-alive.
+
+    Do GUI trafiają wyłącznie zmiany stanu (on_transition), a historia sond
+    jest przechowywana w buforze o stałym rozmiarze.
+    """
+    def __init__(self, port, is_running, interval=1.0, timeout=1.0, health_path="/",
+                 history_size=300, on_transition=None, log=None):
+        self.port = port
+        self.is_running = is_running # Czy proces (pula procesów) backendu powinien działać
+        self.interval = interval
+        self.timeout = timeout
+        self.health_path = health_path
+        self.on_transition = on_transition # Wywoływane z wątku monitora: on_transition(poprzedni_stan, próbka)
+        self.log = log # log(komunikat, poziom, *argumenty_formatowania)
+        self.history = deque(maxlen=history_size)
+        self.state = None
+        self._session = None # Tworzona w wątku monitora, aby import requests nie spowalniał startu
+        self._request_error = None
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name="HealthMonitor", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.timeout + 1)
+            self._thread = None
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def _ensure_session(self):
+        if self._session is None:
+            import requests
+            self._session = requests.Session()
+            self._request_error = requests.exceptions.RequestException
+
+    def _run(self):
+        while True:
+            self._record(self.probe_once())
+            if self._stop_event.wait(self.interval):
+                break
+
+    def _record(self, sample):
+        self.history.append(sample)
+        previous = self.state
+        if sample.state != previous:
+            self.state = sample.state
+            if self.log:
+                self.log("Zmiana stanu backendu gry: %s -> %s.", "DEBUG", previous, sample.state)
+            if self.on_transition:
+                self.on_transition(previous, sample)
+
+    def probe_once(self):
+        """Wykonuje jedną sondę i zwraca HealthSample."""
+        now = time.monotonic()
+        if self.is_running():
+            self._ensure_session()
+            url = f"http://127.0.0.1:{self.port}{self.health_path}"
+            start = time.perf_counter()
+            try:
+                response = self._session.get(url, timeout=self.timeout)
+                latency = time.perf_counter() - start
+                state = STATE_ACTIVE if response.status_code == 200 else STATE_NOT_LISTENING
+                return HealthSample(now, state, latency, response.status_code)
+            except self._request_error:
+                return HealthSample(now, STATE_NOT_LISTENING)
+        if self._port_in_use():
+            return HealthSample(now, STATE_STOPPED_PORT_BUSY)
+        return HealthSample(now, STATE_STOPPED_PORT_FREE)
+
+    def _port_in_use(self):
+        # Połączenie zamiast bind(), aby sonda nigdy nie zajęła portu startującemu backendowi
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            s.settimeout(self.timeout)
+            return s.connect_ex(("127.0.0.1", self.port)) == 0
+
+    def stats(self):
+        """Podsumowanie historii sond: liczba, średnie i p95 opóźnienie oraz dostępność."""
+        samples = list(self.history)
+        latencies = sorted(s.latency for s in samples if s.latency is not None)
+        active = sum(1 for s in samples if s.state == STATE_ACTIVE)
+        return {
+            "samples": len(samples),
+            "state": self.state,
+            "availability": active / len(samples) if samples else None,
+            "latency_avg": sum(latencies) / len(latencies) if latencies else None,
+            "latency_p95": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] if latencies else None,
+            "latency_last": samples[-1].latency if samples else None,
+        }
@@ -0,0 +1,185 @@
+import os
+import selectors
+import socket
+import threading
+from queue import Queue, Empty
+
+READ_CHUNK_SIZE = 65536 # Ile bajtów czytać z potoku jednym wywołaniem
+MAX_LINE_BYTES = 65536 # Dłuższa linia bez znaku nowej linii jest przekazywana w częściach
+
+
+class LineSplitter:
+    """Przyrostowo dzieli surowe bajty na linie, buforując niedokończoną końcówkę."""
+    def __init__(self, encoding="utf-8"):
+        self.encoding = encoding
+        self._pending = b""
+
+    def feed(self, data):
+        """Zwraca listę pełnych linii (bez znaków końca linii) z dotychczasowych danych."""
+        data = self._pending + data
+        parts = data.split(b"\n")
+        self._pending = parts.pop()
+        if len(self._pending) > MAX_LINE_BYTES:
+            parts.append(self._pending)
+            self._pending = b""
+        return [self._decode(part) for part in parts]
+
+    def flush(self):
+        """Zwraca niedokończoną ostatnią linię (przy końcu strumienia)."""
+        rest, self._pending = self._pending, b""
+        return [self._decode(rest)] if rest else []
+
+    def _decode(self, raw):
+        # Procesy potomne nie zawsze piszą poprawnym UTF-8 - błędne bajty zastępujemy
+        return raw.rstrip(b"\r").decode(self.encoding, errors="replace")
+
+
+class OutputCounters:
+    """Liczniki wyjścia jednego procesu potomnego."""
+    __slots__ = ("bytes", "lines")
+
+    def __init__(self):
+        self.bytes = 0
+        self.lines = 0
+
+
+class OutputMultiplexer:
+    """Czyta wyjście wszystkich procesów potomnych w jednym wątku (selectors).
+
+    on_lines(name, lines) dostaje partie zdekodowanych linii z jednego odczytu potoku,
+    on_closed(name, counters) - informację o końcu strumienia, a on_error(name, error) - wyjątek
+    z obsługi wyjścia, po którym odłączany jest tylko ten jeden strumień. Wszystkie wywoływane są
+    z wątku czytnika.
+    """
+    def __init__(self, on_lines, on_closed=None, on_error=None):
+        self.on_lines = on_lines
+        self.on_closed = on_closed
+        self.on_error = on_error
+        self.counters = {} # nazwa procesu -> OutputCounters (sumowane po restartach)
+        self.recorder = None # SessionRecorder zapisujący surowe wyjście (launcher_replay), jeśli włączono nagrywanie
+        self._pending = Queue() # Strumienie do zarejestrowania przez wątek czytnika
+        self._lock = threading.Lock()
+        self._selector = None
+        self._wakeup_r = self._wakeup_w = None
+        self._thread = None
+
+    def add(self, name, stream):
+        """Przekazuje strumień (binarny potok stdout procesu) do czytnika."""
+        with self._lock:
+            self.counters.setdefault(name, OutputCounters())
+            if os.name == "nt":
+                # Na Windows selectors nie obsługuje potoków - osobny wątek, ta sama logika dzielenia
+                threading.Thread(target=self._read_blocking, args=(name, stream), daemon=True).start()
+                return
+            if self._thread is None:
+                self._start()
+        self._pending.put((name, stream))
+        self._wakeup_w.send(b"\0")
+
+    def stats(self):
+        with self._lock:
+            return {name: {"bytes": c.bytes, "lines": c.lines} for name, c in self.counters.items()}
+
+    def _start(self):
+        self._selector = selectors.DefaultSelector()
+        self._wakeup_r, self._wakeup_w = socket.socketpair()
+        self._wakeup_r.setblocking(False)
+        self._selector.register(self._wakeup_r, selectors.EVENT_READ)
+        self._thread = threading.Thread(target=self._run, name="OutputMultiplexer", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            for key, _events in self._selector.select():
+                if key.fileobj is self._wakeup_r:
+                    self._register_pending()
+                    continue
+                try:
+                    self._read(key)
+                except Exception as e:
+                    # Błąd jednego strumienia nie może zatrzymać czytania pozostałych potoków
+                    if self._selector.get_map().get(key.fd) is key: # Przy EOF (_finish) strumień jest już zamknięty
+                        self._selector.unregister(key.fileobj)
+                        key.fileobj.close()
+                    self._report_error(key.data[0], e)
+
+    def _register_pending(self):
+        try:
+            self._wakeup_r.recv(4096)
+        except BlockingIOError:
+            pass
+        while True:
+            try:
+                name, stream = self._pending.get_nowait()
+            except Empty:
+                break
+            self._selector.register(stream, selectors.EVENT_READ, (name, LineSplitter()))
+
+    def _read(self, key):
+        name, splitter = key.data
+        try:
+            data = os.read(key.fd, READ_CHUNK_SIZE)
+        except OSError:
+            data = b""
+        if data:
+            self._record(name, data)
+            self._deliver(name, len(data), splitter.feed(data))
+            return
+        self._selector.unregister(key.fileobj)
+        key.fileobj.close()
+        self._finish(name, splitter)
+
+    def _read_blocking(self, name, stream):
+        splitter = LineSplitter()
+        try:
+            with stream:
+                while True:
+                    data = stream.read1(READ_CHUNK_SIZE) if hasattr(stream, "read1") else stream.read(READ_CHUNK_SIZE)
+                    if not data:
+                        break
+                    self._record(name, data)
+                    self._deliver(name, len(data), splitter.feed(data))
+            self._finish(name, splitter)
+        except Exception as e:
+            self._report_error(name, e)
+
+    def _record(self, name, data):
+        recorder = self.recorder
+        if recorder is None:
+            return
+        try:
+            recorder.data(name, data)
+        except OSError as e:
+            # Np. pełny dysk - kończymy nagrywanie, ale wyjście procesu nadal jest obsługiwane
+            self.recorder = None
+            try:
+                recorder.close()
+            except OSError:
+                pass
+            self._report_error(name, e)
+
+    def _report_error(self, name, error):
+        if self.on_error is None:
+            return
+        try:
+            self.on_error(name, error)
+        except Exception:
+            pass # Wątek czytnika musi przetrwać także błąd zgłaszania
+
+    def _deliver(self, name, size, lines):
+        counters = self.counters[name]
+        with self._lock:
+            counters.bytes += size
+            counters.lines += len(lines)
+        if lines:
+            self.on_lines(name, lines)
+
+    def _finish(self, name, splitter):
+        recorder = self.recorder
+        if recorder is not None:
+            recorder.closed(name)
+        rest = splitter.flush()
+        if rest:
+            self._deliver(name, 0, rest)
+        if self.on_closed:
+            self.on_closed(name, self.counters[name])
@@ -0,0 +1,185 @@
+import ast
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+PREFLIGHT_CHECK_TIMEOUT = 20.0 # Limit czasu sprawdzenia importów w jednym procesie interpretera (sekundy)
+
+# Uruchamiane w docelowym interpreterze: find_spec nie wykonuje kodu modułów, więc jest szybkie i bez skutków ubocznych
+CHECK_IMPORTS_CODE = (
+    "import importlib.util, json, sys\n"
+    "missing = []\n"
+    "for name in sys.argv[1:]:\n"
+    "    try:\n"
+    "        found = importlib.util.find_spec(name) is not None\n"
+    "    except (ImportError, ValueError):\n"
+    "        found = False\n"
+    "    if not found:\n"
+    "        missing.append(name)\n"
+    "print(json.dumps({'version': sys.version.split()[0], 'missing': missing}))\n"
+)
+
+
+class PreflightResult:
+    """Wynik sprawdzenia środowiska przed uruchomieniem."""
+    __slots__ = ("ok", "problems", "interpreter", "python_version", "cached", "elapsed")
+
+    def __init__(self, ok, problems, interpreter=None, python_version=None, cached=False, elapsed=0.0):
+        self.ok = ok
+        self.problems = problems # Lista czytelnych komunikatów
+        self.interpreter = interpreter
+        self.python_version = python_version
+        self.cached = cached
+        self.elapsed = elapsed
+
+
+def resolve_interpreter(name):
+    """Zwraca bezwzględną ścieżkę interpretera (nazwa z PATH lub ścieżka) albo None."""
+    if os.path.dirname(name):
+        return os.path.abspath(name) if os.path.isfile(name) and os.access(name, os.X_OK) else None
+    return shutil.which(name)
+
+
+def script_imports(script_path):
+    """Moduły najwyższego poziomu importowane przez skrypt, bez modułów leżących obok niego.
+
+    Importy wewnątrz try/except ImportError są traktowane jako opcjonalne i pomijane.
+    """
+    with open(script_path, "rb") as f:
+        tree = ast.parse(f.read(), filename=script_path)
+    optional = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Try) and any(_catches_import_error(h) for h in node.handlers):
+            optional.update(id(child) for stmt in node.body for child in ast.walk(stmt))
+    names = set()
+    for node in ast.walk(tree):
+        if id(node) in optional:
+            continue
+        if isinstance(node, ast.Import):
+            names.update(alias.name.split(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            names.add(node.module.split(".")[0])
+    local_dir = os.path.dirname(os.path.abspath(script_path))
+    return sorted(name for name in names
+                  if not os.path.exists(os.path.join(local_dir, name + ".py"))
+                  and not os.path.isdir(os.path.join(local_dir, name)))
+
+
+def _catches_import_error(handler):
+    if handler.type is None:
+        return True
+    types = handler.type.elts if isinstance(handler.type, ast.Tuple) else [handler.type]
+    return any(isinstance(t, ast.Name) and t.id in ("ImportError", "ModuleNotFoundError", "Exception") for t in types)
+
+
+def check_imports(interpreter, modules, timeout=PREFLIGHT_CHECK_TIMEOUT):
+    """Sprawdza w osobnym procesie interpretera, które moduły są dostępne. Zwraca (wersja, brakujące)."""
+    result = subprocess.run([interpreter, "-c", CHECK_IMPORTS_CODE] + list(modules),
+                            capture_output=True, text=True, timeout=timeout)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else f"kod wyjścia {result.returncode}")
+    data = json.loads(result.stdout)
+    return data["version"], data["missing"]
+
+
+def manifest_hash(scripts, manifests=()):
+    """Skrót treści skryptów i plików zależności (np. requirements.txt) - zmiana unieważnia pamięć podręczną."""
+    digest = hashlib.sha256()
+    for path in list(scripts) + list(manifests):
+        digest.update(path.encode("utf-8"))
+        try:
+            with open(path, "rb") as f:
+                digest.update(hashlib.sha256(f.read()).digest())
+        except OSError:
+            digest.update(b"-") # Brak pliku też jest częścią stanu
+    return digest.hexdigest()
+
+
+class Preflight:
+    """Sprawdza interpreter i importy skryptów równolegle (proces interpretera na skrypt), z pamięcią podręczną.
+
+    Klucz pamięci podręcznej: ścieżka i mtime interpretera oraz skrót skryptów i plików zależności,
+    więc kolejne uruchomienia bez zmian pomijają sprawdzanie importów całkowicie.
+    """
+    def __init__(self, interpreter_name, scripts, cache_path, manifests=()):
+        self.interpreter_name = interpreter_name
+        self.scripts = dict(scripts) # nazwa -> ścieżka skryptu
+        self.cache_path = cache_path
+        self.manifests = list(manifests)
+
+    def _cache_key(self, interpreter):
+        st = os.stat(interpreter)
+        return hashlib.sha256(f"{interpreter}\0{st.st_mtime_ns}\0{st.st_size}\0{sys.platform}\0"
+                              f"{manifest_hash(sorted(self.scripts.values()), self.manifests)}".encode("utf-8")).hexdigest()
+
+    def _load_cache(self):
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+            return cache if isinstance(cache, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _save_cache(self, key, version):
+        # Zapamiętywany jest tylko wynik pozytywny - po doinstalowaniu pakietu nie trzeba niczego czyścić
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            tmp_path = self.cache_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"key": key, "python_version": version}, f)
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            pass
+
+    def run(self):
+        """Zwraca PreflightResult dla interpretera i importów skryptów."""
+        started = time.monotonic()
+        interpreter = resolve_interpreter(self.interpreter_name)
+        if interpreter is None:
+            return PreflightResult(False, [f"Nie znaleziono interpretera '{self.interpreter_name}' (PYTHON_EXECUTABLE w config.py)."],
+                                   elapsed=time.monotonic() - started)
+        key = self._cache_key(interpreter)
+        cache = self._load_cache()
+        if cache.get("key") == key:
+            return PreflightResult(True, [], interpreter, cache.get("python_version"), cached=True,
+                                   elapsed=time.monotonic() - started)
+
+        problems = []
+        modules = {}
+        for name, path in self.scripts.items():
+            try:
+                modules[name] = script_imports(path)
+            except (OSError, SyntaxError) as e:
+                problems.append(f"Nie można odczytać skryptu {name} ({path}): {e}")
+        version = None
+        with ThreadPoolExecutor(max_workers=max(1, len(modules))) as pool:
+            futures = {name: pool.submit(check_imports, interpreter, mods) for name, mods in modules.items()}
+            for name, future in futures.items():
+                try:
+                    version, missing = future.result()
+                except (OSError, RuntimeError, ValueError, subprocess.TimeoutExpired) as e:
+                    problems.append(f"Nie udało się sprawdzić importów {name}: {e}")
+                    continue
+                if missing:
+                    problems.append(f"Brak modułów dla {name}: {', '.join(missing)} (pip install dla {interpreter}).")
+        if not problems:
+            self._save_cache(key, version)
+        return PreflightResult(not problems, problems, interpreter, version, elapsed=time.monotonic() - started)
+
+
+def check_disk(path, min_free_bytes):
+    """Zwraca komunikat o problemie z miejscem na dysku lub zapisem w `path` albo None."""
+    try:
+        free = shutil.disk_usage(path).free
+    except OSError as e:
+        return f"Nie można sprawdzić miejsca na dysku ({path}): {e}"
+    if free < min_free_bytes:
+        return f"Za mało miejsca na dysku w {path}: {free // (1024 * 1024)} MB wolne, wymagane {min_free_bytes // (1024 * 1024)} MB."
+    if not os.access(path, os.W_OK):
+        return f"Brak uprawnień do zapisu w {path}."
+    return None
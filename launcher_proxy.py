@@ -0,0 +1,183 @@
+import asyncio
+import itertools
+import threading
+
+PROXY_BUFFER_SIZE = 65536 # Rozmiar porcji kopiowanej między klientem a workerem (bajty)
+NO_BACKEND_RESPONSE = (b"HTTP/1.1 503 Service Unavailable\r\nContent-Type: text/plain\r\n"
+                       b"Content-Length: 26\r\nConnection: close\r\n\r\nBrak aktywnych workerow.\r\n")
+
+
+class ProxyBackend:
+    """Worker widziany przez proxy: adres, stan w rotacji i liczniki połączeń."""
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.healthy = True # Czy worker jest w rotacji
+        self.alive = True # Stan procesu zgłaszany z zewnątrz (set_alive)
+        self.active = 0 # Aktualnie obsługiwane połączenia
+        self.total = 0 # Wszystkie przekazane połączenia
+        self.failures = 0 # Nieudane próby połączenia
+
+    @property
+    def available(self):
+        return self.alive and self.healthy
+
+
+class LoadBalancingProxy:
+    """Lokalne proxy TCP rozdzielające połączenia między workery backendu (least-connections).
+
+    Działa na własnej pętli asyncio w wątku tła. Workery, do których nie da się połączyć,
+    wypadają z rotacji i wracają po udanej sondzie zdrowia.
+    """
+    def __init__(self, listen_port, backend_ports, host="127.0.0.1", health_interval=1.0,
+                 connect_timeout=1.0, log=None):
+        self.listen_port = listen_port
+        self.host = host
+        self.backends = [ProxyBackend(host, port) for port in backend_ports]
+        self.health_interval = health_interval
+        self.connect_timeout = connect_timeout
+        self.log = log
+        self._rotation = itertools.count()
+        self._loop = None
+        self._server = None
+        self._thread = None
+        self._started = threading.Event()
+        self._start_error = None
+        self._handlers = set() # Zadania obsługujące aktywne połączenia
+        self._writers = set() # Strumienie zapisu klientów i workerów (do zamknięcia przy stop)
+
+    def _log(self, message, level):
+        if self.log:
+            self.log(message, level)
+
+    def start(self):
+        """Uruchamia proxy i czeka na związanie portu. Rzuca OSError, gdy port jest zajęty."""
+        self._thread = threading.Thread(target=self._run, name="LoadBalancingProxy", daemon=True)
+        self._thread.start()
+        self._started.wait()
+        if self._start_error is not None:
+            self._thread.join()
+            self._thread = None
+            raise self._start_error
+
+    def stop(self):
+        if self._loop is not None and self._thread is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=2)
+        self._thread = None
+
+    def set_alive(self, port, alive):
+        """Zgłasza stan procesu workera (np. z nadzorcy); martwy worker wypada z rotacji."""
+        for backend in self.backends:
+            if backend.port == port:
+                backend.alive = alive
+
+    def stats(self):
+        return [{"port": b.port, "available": b.available, "active": b.active,
+                 "total": b.total, "failures": b.failures} for b in self.backends]
+
+    def _run(self):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._server = self._loop.run_until_complete(
+                asyncio.start_server(self._handle_client, self.host, self.listen_port, reuse_address=True))
+        except OSError as e:
+            self._start_error = e
+            self._started.set()
+            self._loop.close()
+            return
+        health_task = self._loop.create_task(self._health_loop())
+        self._started.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            health_task.cancel()
+            self._server.close()
+            # Zerwanie połączeń kończy potoki w naturalny sposób, bez anulowania zadań obsługi
+            for writer in list(self._writers):
+                writer.transport.abort()
+            pending = [health_task] + list(self._handlers)
+            self._loop.run_until_complete(asyncio.wait(pending, timeout=1))
+            self._loop.close()
+
+    def _candidates(self):
+        """Dostępne workery, najpierw najmniej obciążone; remisy rozstrzyga rotacja."""
+        available = [b for b in self.backends if b.available]
+        if not available:
+            return []
+        offset = next(self._rotation) % len(available)
+        rotated = available[offset:] + available[:offset]
+        return sorted(rotated, key=lambda b: b.active)
+
+    async def _connect(self):
+        for backend in self._candidates():
+            try:
+                reader, writer = await asyncio.wait_for(
+                    asyncio.open_connection(backend.host, backend.port), self.connect_timeout)
+                return backend, reader, writer
+            except (OSError, asyncio.TimeoutError):
+                backend.failures += 1
+                if backend.healthy:
+                    backend.healthy = False
+                    self._log(f"Worker na porcie {backend.port} nie przyjmuje połączeń - usunięty z rotacji.", "WARNING")
+        return None, None, None
+
+    async def _handle_client(self, client_reader, client_writer):
+        task = asyncio.current_task()
+        self._handlers.add(task)
+        self._writers.add(client_writer)
+        try:
+            backend, backend_reader, backend_writer = await self._connect()
+            if backend is None:
+                client_writer.write(NO_BACKEND_RESPONSE)
+                return
+            self._writers.add(backend_writer)
+            backend.active += 1
+            backend.total += 1
+            try:
+                await asyncio.gather(self._pipe(client_reader, backend_writer),
+                                     self._pipe(backend_reader, client_writer))
+            finally:
+                backend.active -= 1
+                self._writers.discard(backend_writer)
+                await self._close(backend_writer)
+        finally:
+            self._handlers.discard(task)
+            self._writers.discard(client_writer)
+            await self._close(client_writer)
+
+    async def _pipe(self, reader, writer):
+        try:
+            while True:
+                data = await reader.read(PROXY_BUFFER_SIZE)
+                if not data:
+                    break
+                writer.write(data)
+                await writer.drain()
+            if writer.can_write_eof():
+                writer.write_eof()
+        except (OSError, RuntimeError):
+            pass
+
+    async def _close(self, writer):
+        try:
+            writer.close()
+            await writer.wait_closed()
+        except OSError:
+            pass
+
+    async def _health_loop(self):
+        while True:
+            await asyncio.sleep(self.health_interval)
+            for backend in self.backends:
+                if backend.healthy or not backend.alive:
+                    continue
+                try:
+                    _, writer = await asyncio.wait_for(
+                        asyncio.open_connection(backend.host, backend.port), self.connect_timeout)
+                    await self._close(writer)
+                    backend.healthy = True
+                    self._log(f"Worker na porcie {backend.port} ponownie w rotacji.", "INFO")
+                except (OSError, asyncio.TimeoutError):
+                    pass
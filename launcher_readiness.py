@@ -0,0 +1,120 @@
+import socket
+import time
+
+# --- Wyniki oczekiwania na gotowość ---
+READY = "ready"
+TIMEOUT = "timeout"
+EXITED = "exited"
+CANCELLED = "cancelled"
+
+
+class ReadinessResult:
+    """Wynik oczekiwania na gotowość backendu gry."""
+    def __init__(self, status, elapsed, attempts, detail=None, exit_code=None):
+        self.status = status
+        self.elapsed = elapsed # Zmierzony czas do gotowości (sekundy)
+        self.attempts = attempts
+        self.detail = detail
+        self.exit_code = exit_code
+
+    @property
+    def ready(self):
+        return self.status == READY
+
+    def __repr__(self):
+        return (f"ReadinessResult(status={self.status!r}, elapsed={self.elapsed:.3f}, "
+                f"attempts={self.attempts}, exit_code={self.exit_code!r})")
+
+
+class ReadinessProbe:
+    """Sonduje port, a następnie ścieżkę HTTP backendu z wykładniczym backoffem i limitem czasu.
+
+    Gdy port związał launcher (aktywacja gniazd), połączenie TCP udaje się od razu, więc sprawdzenie
+    portu zastępuje `port_check` (np. pierwsze wyjście procesu), a GET ma krótki `probe_timeout`.
+    """
+    def __init__(self, port, host="127.0.0.1", health_path="/", deadline=30.0,
+                 initial_interval=0.05, max_interval=1.0, backoff=1.5, probe_timeout=1.0, port_check=None):
+        self.port = port
+        self.host = host
+        self.health_path = health_path
+        self.deadline = deadline
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.probe_timeout = probe_timeout
+        self.port_check = port_check or self.check_port
+        self.cheap_port_check = port_check is not None # Tanie sprawdzenie nie potrzebuje backoffu
+
+    def check_port(self):
+        """Sprawdza, czy ktoś przyjmuje połączenia TCP na porcie."""
+        try:
+            with socket.create_connection((self.host, self.port), timeout=self.probe_timeout):
+                return True
+        except OSError:
+            return False
+
+    def check_health(self):
+        """Wysyła GET na ścieżkę zdrowia. Zwraca kod HTTP lub None przy błędzie połączenia."""
+        import http.client # Import leniwy - http.client jest kosztowny przy starcie trybu bezgłowego
+        conn = http.client.HTTPConnection(self.host, self.port, timeout=self.probe_timeout)
+        try:
+            conn.request("GET", self.health_path)
+            response = conn.getresponse()
+            response.read()
+            return response.status
+        except (OSError, http.client.HTTPException):
+            return None
+        finally:
+            conn.close()
+
+    def wait(self, process=None, on_progress=None, log=None, cancel_event=None, on_attempt=None):
+        """Czeka, aż backend będzie gotowy, proces się zakończy, minie limit czasu albo ustawiono cancel_event.
+
+        on_attempt(start, end, port_open, status) jest wywoływane po każdej próbie (czasy z time.monotonic()),
+        a log(komunikat, poziom, *argumenty) formatuje % dopiero po filtrze poziomu.
+        """
+        start = time.monotonic()
+        end = start + self.deadline
+        interval = self.initial_interval
+        attempts = 0
+        port_open = False
+        last_status = None
+
+        while True:
+            if cancel_event is not None and cancel_event.is_set():
+                return ReadinessResult(CANCELLED, time.monotonic() - start, attempts)
+            if process is not None and process.poll() is not None:
+                return ReadinessResult(EXITED, time.monotonic() - start, attempts,
+                                       detail="Proces backendu zakończył się przed gotowością.",
+                                       exit_code=process.returncode)
+            attempts += 1
+            attempt_start = time.monotonic()
+            status = None
+            if not port_open:
+                port_open = self.port_check()
+                if port_open:
+                    interval = self.initial_interval # Sondowanie HTTP zaczyna od krótkich odstępów
+                    if log:
+                        log("Port %d gotowy do sondowania HTTP po %.3fs.", "DEBUG", self.port, time.monotonic() - start)
+            if port_open:
+                status = last_status = self.check_health()
+                if last_status is None:
+                    port_open = False # Połączenie zerwane - wróć do sondowania portu
+            if on_attempt:
+                on_attempt(attempt_start, time.monotonic(), port_open, status)
+            if status == 200:
+                return ReadinessResult(READY, time.monotonic() - start, attempts)
+
+            now = time.monotonic()
+            if on_progress:
+                on_progress(now - start, self.deadline)
+            if now >= end:
+                detail = (f"Ostatni status HTTP: {last_status}" if last_status is not None
+                          else f"Port {self.port} nie odpowiada.")
+                return ReadinessResult(TIMEOUT, now - start, attempts, detail=detail)
+            if cancel_event is not None:
+                cancel_event.wait(min(interval, end - now))
+            else:
+                time.sleep(min(interval, end - now))
+            if port_open or not self.cheap_port_check:
+                interval = min(interval * self.backoff, self.max_interval)
@@ -0,0 +1,223 @@
+import gzip
+import math
+import os
+import struct
+import threading
+import time
+
+from launcher_loadtest import LatencyHistogram
+from launcher_logs import OutputLogRecord
+
+SESSION_MAGIC = b"GGOS"
+SESSION_VERSION = 1
+SESSION_HEADER = struct.Struct("<4sBd") # magia, wersja, czas uniksowy początku nagrania
+RECORD_HEADER = struct.Struct("<BHQI") # rodzaj, id strumienia, µs od początku nagrania, długość danych
+RECORD_STREAM = 1 # Nowy strumień; dane to nazwa procesu (UTF-8)
+RECORD_DATA = 2 # Surowe bajty z jednego odczytu potoku
+RECORD_CLOSE = 3 # Koniec strumienia
+SESSION_COMPRESS_LEVEL = 1 # gzip w trybie najszybszym - nagrywanie nie może spowalniać czytnika wyjścia
+REPLAY_SAMPLE_INTERVAL = 0.01 # Odstęp próbkowania głębokości kolejki podczas odtwarzania (sekundy)
+REPLAY_DRAIN_TIMEOUT = 30.0 # Jak długo czekać po odtworzeniu, aż ujście opróżni kolejkę (sekundy)
+
+
+class SessionRecorder:
+    """Zapisuje surowe wyjście procesów potomnych ze znacznikami czasu do pliku sesji (gzip).
+
+    Wywoływany z wątku czytnika wyjścia; nazwy strumieni zapisywane są raz, a każdy odczyt
+    potoku to jeden rekord z 15-bajtowym nagłówkiem.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.started = time.monotonic()
+        self._file = gzip.open(path, "wb", compresslevel=SESSION_COMPRESS_LEVEL)
+        self._file.write(SESSION_HEADER.pack(SESSION_MAGIC, SESSION_VERSION, time.time()))
+        self._streams = {} # nazwa -> id
+        self._lock = threading.Lock() # Na Windows każdy strumień ma własny wątek czytający
+        self.bytes = 0
+
+    def _write(self, kind, name, payload):
+        t_us = int((time.monotonic() - self.started) * 1_000_000)
+        with self._lock:
+            if self._file is None:
+                return
+            stream_id = self._streams.get(name)
+            if stream_id is None:
+                stream_id = self._streams[name] = len(self._streams)
+                encoded = name.encode("utf-8")
+                self._file.write(RECORD_HEADER.pack(RECORD_STREAM, stream_id, t_us, len(encoded)) + encoded)
+            self._file.write(RECORD_HEADER.pack(kind, stream_id, t_us, len(payload)))
+            if payload:
+                self._file.write(payload)
+            self.bytes += len(payload)
+
+    def data(self, name, payload):
+        self._write(RECORD_DATA, name, payload)
+
+    def closed(self, name):
+        self._write(RECORD_CLOSE, name, b"")
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def read_session(path):
+    """Generator zdarzeń (sekundy od początku, rodzaj, nazwa strumienia, dane) z pliku sesji.
+
+    Obcięty plik (np. po awarii launchera) jest czytany do ostatniego pełnego rekordu.
+    Rzuca ValueError dla pliku w nieznanym formacie.
+    """
+    with gzip.open(path, "rb") as f:
+        header = f.read(SESSION_HEADER.size)
+        if len(header) < SESSION_HEADER.size:
+            raise ValueError("pusty lub uszkodzony plik sesji")
+        magic, version, _started = SESSION_HEADER.unpack(header)
+        if magic != SESSION_MAGIC or version != SESSION_VERSION:
+            raise ValueError("nieznany format pliku sesji")
+        names = {}
+        while True:
+            try:
+                raw = f.read(RECORD_HEADER.size)
+                if len(raw) < RECORD_HEADER.size:
+                    return
+                kind, stream_id, t_us, length = RECORD_HEADER.unpack(raw)
+                payload = f.read(length) if length else b""
+            except (EOFError, OSError):
+                return
+            if len(payload) < length:
+                return
+            if kind == RECORD_STREAM:
+                names[stream_id] = payload.decode("utf-8", errors="replace")
+            elif stream_id in names:
+                yield t_us / 1_000_000, kind, names[stream_id], payload
+
+
+class ReplayStats:
+    """Obserwator kolejki logów (LogQueue.observer) podczas odtwarzania sesji.
+
+    Liczy linie wyjścia procesów w kolejce i mierzy ich opóźnienie od utworzenia wpisu
+    w wątku czytnika do wyjęcia z kolejki przez ujście (GUI lub strumień).
+    """
+    def __init__(self):
+        self.latency = LatencyHistogram() # µs
+        self.depth_samples = []
+        self.depth = 0 # Linie wyjścia procesów aktualnie w kolejce
+        self.max_depth = 0
+        self.enqueued = 0
+        self.dequeued = 0
+        self.fed_lines = 0 # Linie podane do potoków (wg znaków nowej linii w nagraniu)
+        self.fed_bytes = 0
+        self.max_feed_lag = 0.0 # Największe spóźnienie podawania względem harmonogramu (sekundy)
+        self.elapsed = 0.0
+
+    @staticmethod
+    def _output_lines(item):
+        if isinstance(item, list):
+            return item
+        return (item,) if isinstance(item, OutputLogRecord) else ()
+
+    def put(self, item):
+        count = len(self._output_lines(item))
+        self.enqueued += count
+        self.depth += count
+        self.max_depth = max(self.max_depth, self.depth)
+
+    def get(self, item):
+        records = self._output_lines(item)
+        now = time.monotonic()
+        for record in records:
+            self.latency.record((now - record.created) * 1_000_000)
+        self.dequeued += len(records)
+        self.depth -= len(records)
+
+    def sample_depth(self):
+        self.depth_samples.append(self.depth)
+
+    def summary(self, sink_dropped=0):
+        """Wyniki odtwarzania: przepustowość, głębokość kolejki (linie), opóźnienia (ms) i utracone linie."""
+        def ms(value):
+            return None if value is None else round(value / 1000, 3)
+        depths = sorted(self.depth_samples)
+        return {
+            "lines": self.fed_lines,
+            "bytes": self.fed_bytes,
+            "elapsed": round(self.elapsed, 3),
+            "throughput": round(self.dequeued / self.elapsed, 1) if self.elapsed else 0.0,
+            "queue_depth": {
+                "max": self.max_depth,
+                "p95": depths[max(0, math.ceil(0.95 * len(depths)) - 1)] if depths else 0,
+                "mean": round(sum(depths) / len(depths), 1) if depths else 0.0,
+            },
+            "latency_ms": {
+                "p50": ms(self.latency.percentile(0.50)),
+                "p95": ms(self.latency.percentile(0.95)),
+                "p99": ms(self.latency.percentile(0.99)),
+                "max": ms(self.latency.max if self.latency.total else None),
+            },
+            "dropped": sink_dropped, # Wyjęte z kolejki, ale pominięte przez ujście (przepełnienie historii GUI)
+            "filtered": max(0, self.fed_lines - self.enqueued), # Poniżej minimalnego poziomu logów
+            "max_feed_lag": round(self.max_feed_lag, 3),
+        }
+
+
+class SessionReplayer:
+    """Podaje nagraną sesję do czytnika wyjścia (OutputMultiplexer) przez potoki, bez uruchamiania procesów.
+
+    speed=1 odtwarza w czasie rzeczywistym, speed=N N razy szybciej, speed=None bez przerw.
+    Dane przechodzą przez tę samą ścieżkę co wyjście prawdziwych procesów: podział na linie,
+    klasyfikację tagów, kolejkę logów i ujście.
+    """
+    def __init__(self, path, output_reader, speed=1.0):
+        self.path = path
+        self.output_reader = output_reader
+        self.speed = speed if speed else None
+        self.stats = ReplayStats()
+        self._stop = threading.Event()
+        self._pipes = {} # nazwa -> deskryptor końca do zapisu
+
+    def stop(self):
+        self._stop.set()
+
+    def feed(self):
+        """Podaje całą sesję (blokuje do końca nagrania albo stop())."""
+        stats = self.stats
+        started = time.monotonic()
+        try:
+            for t, kind, name, payload in read_session(self.path):
+                if self._stop.is_set():
+                    break
+                if self.speed is not None:
+                    due = started + t / self.speed
+                    delay = due - time.monotonic()
+                    if delay > 0:
+                        if self._stop.wait(delay):
+                            break
+                    else:
+                        stats.max_feed_lag = max(stats.max_feed_lag, -delay)
+                if kind == RECORD_DATA:
+                    self._write(name, payload)
+                    stats.fed_bytes += len(payload)
+                    stats.fed_lines += payload.count(b"\n")
+                elif kind == RECORD_CLOSE:
+                    self._close(name)
+        finally:
+            for name in list(self._pipes):
+                self._close(name)
+
+    def _write(self, name, payload):
+        fd = self._pipes.get(name)
+        if fd is None:
+            read_fd, fd = os.pipe()
+            self._pipes[name] = fd
+            self.output_reader.add(name, os.fdopen(read_fd, "rb", buffering=0))
+        view = memoryview(payload)
+        while view:
+            # Zapis blokuje, gdy czytnik nie nadąża - jak u prawdziwego procesu z pełnym potokiem
+            view = view[os.write(fd, view):]
+
+    def _close(self, name):
+        fd = self._pipes.pop(name, None)
+        if fd is not None:
+            os.close(fd)
@@ -0,0 +1,163 @@
+import threading
+import time
+from collections import deque
+
+# --- Stany nadzorcy ---
+SUPERVISOR_IDLE = "idle"
+SUPERVISOR_RUNNING = "running" # Proces działa i przeszedł bramkę gotowości
+SUPERVISOR_BACKOFF = "backoff" # Odczekiwanie przed ponownym uruchomieniem
+SUPERVISOR_WAITING_READY = "waiting_ready" # Proces uruchomiony ponownie, czeka na gotowość
+SUPERVISOR_GAVE_UP = "gave_up" # Wykryto pętlę awarii, nadzór zakończony
+SUPERVISOR_STOPPED = "stopped"
+
+
+class RestartPolicy:
+    """Polityka restartów: wykładniczy backoff i wykrywanie pętli awarii."""
+    def __init__(self, initial_backoff=1.0, max_backoff=30.0, multiplier=2.0,
+                 crash_loop_window=60.0, crash_loop_max_restarts=5, stable_after=30.0):
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.multiplier = multiplier
+        self.crash_loop_window = crash_loop_window # Okno czasowe liczenia awarii (sekundy)
+        self.crash_loop_max_restarts = crash_loop_max_restarts # Maks. restartów w oknie przed poddaniem się
+        self.stable_after = stable_after # Po tylu sekundach pracy backoff wraca do wartości początkowej
+
+    def delay(self, consecutive_crashes):
+        """Opóźnienie przed restartem po `consecutive_crashes` kolejnych awariach (>= 1)."""
+        return min(self.max_backoff, self.initial_backoff * self.multiplier ** max(0, consecutive_crashes - 1))
+
+
+class BackendSupervisor:
+    """Nadzoruje proces backendu: wykrywa awarie, restartuje go z backoffem i czeka na gotowość.
+
+    spawn() uruchamia nowy proces (lub zwraca None), wait_ready(process, cancel_event)
+    zwraca ReadinessResult, a terminate(process) zamyka proces, który nie osiągnął gotowości.
+    """
+    def __init__(self, get_process, spawn, wait_ready, terminate, policy=None, interval=0.5,
+                 on_crash=None, on_restarting=None, on_restored=None, on_gave_up=None, log=None):
+        self.get_process = get_process
+        self.spawn = spawn
+        self.wait_ready = wait_ready
+        self.terminate = terminate
+        self.policy = policy or RestartPolicy()
+        self.interval = interval
+        self.on_crash = on_crash # on_crash(exit_code)
+        self.on_restarting = on_restarting # on_restarting(attempt, delay)
+        self.on_restored = on_restored # on_restored(readiness_result)
+        self.on_gave_up = on_gave_up # on_gave_up(message)
+        self.log = log
+
+        self.state = SUPERVISOR_IDLE
+        self.crashes = 0
+        self.restarts = 0
+        self.consecutive_crashes = 0
+        self.last_restart_at = None # time.monotonic() ostatniego restartu
+        self._started_at = None
+        self._crash_times = deque()
+        self._lock = threading.Lock() # Chroni decyzję "zatrzymano?" -> spawn()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._stop_event.clear()
+            self._started_at = time.monotonic()
+            self.state = SUPERVISOR_RUNNING
+            self._thread = threading.Thread(target=self._run, name="BackendSupervisor", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout=1.0):
+        """Kończy nadzór. Po powrocie nadzorca nie uruchomi już żadnego nowego procesu."""
+        with self._lock:
+            self._stop_event.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=timeout)
+        self._thread = None
+        if self.state != SUPERVISOR_GAVE_UP:
+            self.state = SUPERVISOR_STOPPED
+
+    def time_since_last_restart(self):
+        """Sekundy od ostatniego restartu lub None, jeśli restartu nie było."""
+        if self.last_restart_at is None:
+            return None
+        return time.monotonic() - self.last_restart_at
+
+    def stats(self):
+        return {
+            "state": self.state,
+            "crashes": self.crashes,
+            "restarts": self.restarts,
+            "consecutive_crashes": self.consecutive_crashes,
+            "time_since_last_restart": self.time_since_last_restart(),
+        }
+
+    def _log(self, message, level):
+        if self.log:
+            self.log(message, level)
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            process = self.get_process()
+            if process is not None and process.poll() is None:
+                self._stop_event.wait(self.interval)
+                continue
+            if self._stop_event.is_set():
+                break
+            exit_code = process.returncode if process is not None else None
+            if not self._handle_crash(exit_code):
+                break
+
+    def _handle_crash(self, exit_code):
+        """Rejestruje awarię i restartuje backend. Zwraca False, gdy nadzór ma się zakończyć."""
+        now = time.monotonic()
+        if self._started_at is not None and now - self._started_at >= self.policy.stable_after:
+            self.consecutive_crashes = 0
+        self.crashes += 1
+        self.consecutive_crashes += 1
+        self._crash_times.append(now)
+        while self._crash_times and now - self._crash_times[0] > self.policy.crash_loop_window:
+            self._crash_times.popleft()
+        self._log(f"Backend gry uległ awarii (kod wyjścia: {exit_code}, awaria nr {self.crashes}).", "ERROR")
+        if self.on_crash:
+            self.on_crash(exit_code)
+
+        if len(self._crash_times) > self.policy.crash_loop_max_restarts:
+            self.state = SUPERVISOR_GAVE_UP
+            message = (f"Pętla awarii: {len(self._crash_times)} awarii w ciągu "
+                       f"{self.policy.crash_loop_window:.0f}s. Automatyczne restarty wstrzymane.")
+            self._log(message, "CRITICAL")
+            if self.on_gave_up:
+                self.on_gave_up(message)
+            return False
+
+        delay = self.policy.delay(self.consecutive_crashes)
+        self.state = SUPERVISOR_BACKOFF
+        self._log(f"Restart backendu gry za {delay:.1f}s (próba {self.consecutive_crashes}).", "WARNING")
+        if self.on_restarting:
+            self.on_restarting(self.consecutive_crashes, delay)
+        if self._stop_event.wait(delay):
+            return False
+
+        with self._lock:
+            if self._stop_event.is_set():
+                return False
+            process = self.spawn()
+        self.restarts += 1
+        self.last_restart_at = self._started_at = time.monotonic()
+        if process is None:
+            return True # Nieudane uruchomienie liczy się jako kolejna awaria
+
+        self.state = SUPERVISOR_WAITING_READY
+        result = self.wait_ready(process, self._stop_event)
+        if self._stop_event.is_set():
+            return False
+        if not result.ready:
+            self._log(f"Backend gry po restarcie nie osiągnął gotowości ({result.status}).", "ERROR")
+            self.terminate(process)
+            return True
+
+        self.state = SUPERVISOR_RUNNING
+        self._log(f"Backend gry przywrócony po {result.elapsed:.3f}s od restartu.", "SUCCESS")
+        if self.on_restored:
+            self.on_restored(result)
+        return True
@@ -0,0 +1,144 @@
+import json
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+# --- Nazwy faz uruchamiania (klucze podsumowania p50/p95) ---
+PHASE_PREFLIGHT = "sprawdzenie środowiska"
+PHASE_PORT_CHECK = "sprawdzenie portów"
+PHASE_BACKEND_SPAWN = "uruchomienie backendu"
+PHASE_BACKEND_FIRST_OUTPUT = "pierwsze wyjście backendu"
+PHASE_BACKEND_READY = "gotowość backendu"
+PHASE_FIRST_HEALTHY_PROBE = "pierwsza udana sonda zdrowia"
+PHASE_WARMUP = "rozgrzewanie backendu"
+PHASE_FRONTEND_SPAWN = "uruchomienie frontendu"
+PHASE_FRONTEND_FIRST_OUTPUT = "pierwsze wyjście frontendu"
+PHASE_TOTAL = "całe uruchomienie"
+
+
+class StartupTracer:
+    """Zbiera monotoniczne przedziały czasu jednego uruchomienia i zapisuje je jako Chrome trace JSON.
+
+    Każda faza trafia do podsumowania tylko raz (pierwsze wystąpienie); zdarzenia szczegółowe
+    (np. pojedyncze próby sondy) są widoczne wyłącznie w pliku śladu.
+    """
+    def __init__(self):
+        self.origin = time.monotonic()
+        self.started_at = time.time()
+        self.events = []
+        self.phases = {} # faza -> czas trwania (sekundy)
+        self._marks = {} # nazwa znacznika -> time.monotonic()
+        self._output_phases = {} # nazwa procesu -> (faza pierwszego wyjścia, chwila uruchomienia)
+        self._phase_events = {} # faza -> threading.Event ustawiane po jej zarejestrowaniu
+        self._lock = threading.Lock()
+
+    def _us(self, t):
+        return round((t - self.origin) * 1_000_000)
+
+    def add_span(self, name, start, end, phase=True, **args):
+        """Rejestruje zakończony przedział [start, end] (wartości time.monotonic())."""
+        event = {"name": name, "cat": "faza" if phase else "szczegóły", "ph": "X", "ts": self._us(start),
+                 "dur": max(0, self._us(end) - self._us(start)), "pid": os.getpid(), "tid": threading.get_ident()}
+        if args:
+            event["args"] = args
+        with self._lock:
+            self.events.append(event)
+            if phase and name not in self.phases:
+                self.phases[name] = end - start
+                self._phase_events.setdefault(name, threading.Event()).set()
+
+    @contextmanager
+    def span(self, name, phase=True, **args):
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.add_span(name, start, time.monotonic(), phase=phase, **args)
+
+    def mark(self, name, when=None):
+        """Zapamiętuje chwilę (pierwszą dla danej nazwy), od której liczone są późniejsze fazy."""
+        with self._lock:
+            self._marks.setdefault(name, time.monotonic() if when is None else when)
+
+    def since_mark(self, phase, mark, **args):
+        """Rejestruje fazę od znacznika `mark` do teraz (jeśli znacznik istnieje)."""
+        start = self._marks.get(mark)
+        if start is not None and phase not in self.phases:
+            self.add_span(phase, start, time.monotonic(), **args)
+
+    def process_spawned(self, name, first_output_phase, when):
+        """Od tej chwili pierwsza linia wyjścia procesu `name` zamknie fazę `first_output_phase`."""
+        with self._lock:
+            self._output_phases.setdefault(name, (first_output_phase, when))
+
+    def process_output(self, name):
+        """Wywoływane przy każdej partii wyjścia procesu; rejestruje tylko pierwszą."""
+        entry = self._output_phases.get(name)
+        if entry is None:
+            return
+        with self._lock:
+            if self._output_phases.pop(name, None) is None:
+                return
+        phase, spawned = entry
+        now = time.monotonic()
+        self.add_span(f"{phase}: {name}", spawned, now, phase=False)
+        if phase not in self.phases:
+            self.add_span(phase, spawned, now)
+
+    def wait_for_phase(self, phase, timeout):
+        """Czeka (maks. `timeout` s), aż faza zostanie zarejestrowana. Zwraca True, jeśli tak."""
+        with self._lock:
+            event = self._phase_events.setdefault(phase, threading.Event())
+        return event.wait(timeout)
+
+    def instant(self, name, **args):
+        event = {"name": name, "ph": "i", "s": "g", "ts": self._us(time.monotonic()),
+                 "pid": os.getpid(), "tid": threading.get_ident()}
+        if args:
+            event["args"] = args
+        with self._lock:
+            self.events.append(event)
+
+    def write(self, path):
+        with self._lock:
+            data = {"traceEvents": list(self.events), "displayTimeUnit": "ms",
+                    "otherData": {"started_at": self.started_at}}
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+
+
+def percentile(values, fraction):
+    """Percentyl metodą najbliższej rangi."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+class PhaseHistory:
+    """Kroczące podsumowanie czasów faz z ostatnich uruchomień, trzymane w pliku JSON."""
+    def __init__(self, path, size=50):
+        self.path = path
+        self.size = size
+        self.durations = {} # faza -> [sekundy, ...] (najnowsze na końcu)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                self.durations = {phase: list(values)[-size:] for phase, values in json.load(f).items()}
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    def add(self, phases):
+        for phase, duration in phases.items():
+            values = self.durations.setdefault(phase, [])
+            values.append(duration)
+            del values[:-self.size]
+
+    def save(self):
+        with open(self.path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(self.durations, f)
+        os.replace(self.path + ".tmp", self.path)
+
+    def summary(self):
+        """{faza: (p50, p95, liczba uruchomień)}"""
+        return {phase: (percentile(values, 0.5), percentile(values, 0.95), len(values))
+                for phase, values in self.durations.items() if values}
@@ -0,0 +1,89 @@
+import threading
+
+DEFAULT_FRAME_INTERVAL = 33 # Odstęp między klatkami stosowania zmian w wątku Tk (ms, ok. 30 kl./s)
+
+
+class UiDispatcher:
+    """Kolejka zmian interfejsu z wątków roboczych, stosowanych w wątku Tk z ograniczoną częstotliwością.
+
+    Zmiany są kluczowane: config() scala opcje jednego widżetu (wygrywa najnowsza wartość),
+    a call() z tym samym kluczem zastępuje poprzednie, jeszcze niezastosowane wywołanie.
+    Kolejność stosowania odpowiada kolejności pierwszego zgłoszenia danego klucza.
+    """
+    def __init__(self, root, interval=DEFAULT_FRAME_INTERVAL, on_stats=None):
+        self.root = root
+        self.interval = interval
+        self.on_stats = on_stats # Wywoływane z (applied, coalesced) tylko przy zmianie wartości
+        self.applied = 0 # Zastosowane zmiany
+        self.coalesced = 0 # Zmiany zastąpione nowszymi, zanim zdążyły zostać zastosowane
+        self._pending = {} # klucz -> ("config", widżet, opcje) albo ("call", funkcja, argumenty)
+        self._lock = threading.Lock()
+        self._unique = 0 # Licznik kluczy dla wywołań, których nie wolno scalać
+        self._last_stats = None
+        self._after_id = None
+
+    def start(self):
+        """Planuje cykliczne stosowanie zmian w pętli zdarzeń Tk (wywoływać z wątku Tk)."""
+        if self._after_id is None:
+            self._after_id = self.root.after(self.interval, self._tick)
+
+    def stop(self):
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+
+    def config(self, widget, **options):
+        """Zmienia opcje widżetu przy najbliższej klatce."""
+        key = ("config", str(widget))
+        with self._lock:
+            entry = self._pending.get(key)
+            if entry is None:
+                self._pending[key] = ("config", widget, dict(options))
+                return
+            pending_options = entry[2]
+            self.coalesced += sum(1 for name in options if name in pending_options)
+            pending_options.update(options)
+
+    def call(self, key, func, *args):
+        """Wywołuje func(*args) w wątku Tk. Klucz None oznacza wywołanie, które nie jest scalane."""
+        with self._lock:
+            if key is None:
+                self._unique += 1
+                key = ("unique", self._unique)
+            elif key in self._pending:
+                self.coalesced += 1
+                self._pending[key] = ("call", func, args) # Zachowuje miejsce w kolejności
+                return
+            self._pending[key] = ("call", func, args)
+
+    def dialog(self, func, *args):
+        """Jak call(None, ...), ale func (okno modalne) rusza z after_idle, poza flush() - inaczej wstrzymałaby kolejne klatki."""
+        self.call(None, self.root.after_idle, func, *args)
+
+    def stats(self):
+        with self._lock:
+            return {"pending": len(self._pending), "applied": self.applied, "coalesced": self.coalesced}
+
+    def flush(self):
+        """Stosuje wszystkie oczekujące zmiany (wywoływać z wątku Tk)."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for kind, target, args in pending.values():
+            try:
+                if kind == "config":
+                    target.config(**args)
+                else:
+                    target(*args)
+            except Exception:
+                pass # Widżet mógł zostać zniszczony przy zamykaniu okna
+        with self._lock:
+            self.applied += len(pending)
+            stats = (self.applied, self.coalesced)
+        if self.on_stats and stats != self._last_stats:
+            self._last_stats = stats
+            self.on_stats(*stats)
+
+    def _tick(self):
+        self._after_id = None
+        self.flush()
+        self._after_id = self.root.after(self.interval, self._tick)
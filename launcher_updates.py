@@ -0,0 +1,302 @@
+import json
+import os
+import threading
+import time
+
+UPDATE_CHECK_TTL = 6 * 3600 # Jak długo wynik ostatniego sprawdzenia jest aktualny (sekundy)
+UPDATE_FAILURE_RETRY = 3600 # Po nieudanym sprawdzeniu kolejna automatyczna próba najwcześniej po tym czasie (sekundy)
+UPDATE_FETCH_TIMEOUT = 5 # Limit czasu zapytania o najnowszą wersję (sekundy)
+
+
+class UpdateCheckError(Exception):
+    """Nie udało się pobrać informacji o najnowszej wersji."""
+
+
+class FetchResponse:
+    """Odpowiedź pobieracza wersji: status HTTP, treść i nagłówki do ponownej walidacji."""
+    __slots__ = ("status", "text", "etag", "last_modified")
+
+    def __init__(self, status, text="", etag=None, last_modified=None):
+        self.status = status
+        self.text = text
+        self.etag = etag
+        self.last_modified = last_modified
+
+
+class HttpVersionFetcher:
+    """Pobiera plik z numerem najnowszej wersji, wysyłając If-None-Match / If-Modified-Since.
+
+    Dowolny obiekt z metodą fetch(etag, last_modified) -> FetchResponse może go zastąpić
+    (np. w testach z lokalnym serwerem HTTP).
+    """
+    def __init__(self, url, timeout=UPDATE_FETCH_TIMEOUT):
+        self.url = url
+        self.timeout = timeout
+
+    def fetch(self, etag=None, last_modified=None):
+        import requests # Import leniwy - potrzebny tylko przy aktualizacjach
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        try:
+            response = requests.get(self.url, headers=headers, timeout=self.timeout)
+            if response.status_code != 304:
+                response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            raise UpdateCheckError(str(e)) from e
+        return FetchResponse(response.status_code, response.text,
+                             response.headers.get("ETag"), response.headers.get("Last-Modified"))
+
+
+class UpdateCheckResult:
+    """Wynik sprawdzenia: najnowsza wersja i skąd pochodzi ("cache", "not_modified", "network")."""
+    __slots__ = ("version", "source", "age")
+
+    def __init__(self, version, source, age=0.0):
+        self.version = version
+        self.source = source
+        self.age = age # Wiek informacji o wersji (sekundy)
+
+
+class UpdateChecker:
+    """Sprawdza najnowszą wersję z pamięcią podręczną na dysku (TTL i warunkowe zapytania HTTP)."""
+    def __init__(self, fetcher, cache_path, ttl=UPDATE_CHECK_TTL, failure_retry=UPDATE_FAILURE_RETRY):
+        self.fetcher = fetcher
+        self.cache_path = cache_path
+        self.ttl = ttl
+        self.failure_retry = failure_retry
+        self.state = self._load()
+        self._lock = threading.Lock() # Ręczne i automatyczne sprawdzenie mogą zbiec się w czasie
+
+    def _load(self):
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            return state if isinstance(state, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self):
+        directory = os.path.dirname(self.cache_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = self.cache_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.state, f)
+        os.replace(tmp_path, self.cache_path)
+
+    def _cached(self, now):
+        version = self.state.get("version")
+        if version is None:
+            return None
+        return UpdateCheckResult(version, "cache", now - self.state.get("checked_at", 0))
+
+    def should_check(self, now=None):
+        """Czy automatyczne sprawdzenie ma sens (wynik przeterminowany i brak świeżej porażki)."""
+        now = time.time() if now is None else now
+        if now - self.state.get("failed_at", 0) < self.failure_retry:
+            return False
+        return self.state.get("version") is None or now - self.state.get("checked_at", 0) >= self.ttl
+
+    def check(self, force=False):
+        """Zwraca UpdateCheckResult. Bez force świeży wynik z dysku nie wymaga połączenia.
+
+        Rzuca UpdateCheckError, gdy pobranie się nie uda i nie ma wcześniejszego wyniku (albo przy force).
+        """
+        with self._lock:
+            return self._check(force, time.time())
+
+    def _check(self, force, now):
+        if not force and not self.should_check(now):
+            cached = self._cached(now)
+            if cached is None:
+                raise UpdateCheckError("Poprzednie sprawdzenie aktualizacji niedawno się nie powiodło.")
+            return cached
+        try:
+            response = self.fetcher.fetch(self.state.get("etag"), self.state.get("last_modified"))
+        except UpdateCheckError:
+            self.state["failed_at"] = now
+            self._save_quietly()
+            cached = self._cached(now)
+            if cached is None or force:
+                raise
+            return cached # Nieaktualny, ale lepszy niż żaden
+        self.state.pop("failed_at", None)
+        if response.status == 304:
+            if self.state.get("version") is None:
+                raise UpdateCheckError("Serwer odpowiedział 304 bez zapamiętanej wersji.")
+            self.state["checked_at"] = now
+            self._save_quietly()
+            return UpdateCheckResult(self.state["version"], "not_modified")
+        self.state.update(version=response.text.strip(), etag=response.etag,
+                          last_modified=response.last_modified, checked_at=now)
+        self._save_quietly()
+        return UpdateCheckResult(self.state["version"], "network")
+
+    def _save_quietly(self):
+        try:
+            self._save()
+        except OSError:
+            pass # Brak zapisu oznacza tylko ponowne zapytanie przy następnym starcie
+
+
+# --- Pobieranie aktualizacji ---
+
+DOWNLOAD_CHUNK_SIZE = 64 * 1024 # Rozmiar fragmentu zapisywanego na dysk (bajty)
+DOWNLOAD_TIMEOUT = 10 # Limit czasu połączenia i bezczynności transferu (sekundy)
+PART_SUFFIX = ".part" # Niedokończone pobrania; wznawiane zapytaniem Range przy kolejnej próbie
+BACKUP_SUFFIX = ".bak"
+
+
+class UpdateDownloadError(Exception):
+    """Pobranie, weryfikacja lub podmiana plików aktualizacji nie powiodła się."""
+
+
+class UpdateFile:
+    """Jeden plik aktualizacji: skąd go pobrać, dokąd zapisać i jaki ma mieć skrót SHA-256."""
+    __slots__ = ("url", "path", "sha256", "size")
+
+    def __init__(self, url, path, sha256, size=None):
+        self.url = url
+        self.path = path
+        self.sha256 = sha256.lower()
+        self.size = size # Rozmiar z manifestu (do paska postępu), jeśli znany
+
+
+def parse_manifest(data, base_dir):
+    """Zamienia manifest {"version", "files": [{"path", "url", "sha256", "size"}]} na listę UpdateFile.
+
+    Ścieżki są względne wobec base_dir; ścieżki wychodzące poza ten katalog są odrzucane.
+    """
+    root = os.path.realpath(base_dir)
+    files = []
+    try:
+        for entry in data["files"]:
+            path = os.path.realpath(os.path.join(root, entry["path"]))
+            if os.path.isabs(entry["path"]) or os.path.commonpath([root, path]) != root:
+                raise UpdateDownloadError(f"Niedozwolona ścieżka w manifeście: {entry['path']}")
+            files.append(UpdateFile(entry["url"], path, entry["sha256"], entry.get("size")))
+    except (KeyError, TypeError, AttributeError) as e:
+        raise UpdateDownloadError(f"Niepoprawny manifest aktualizacji: {e}") from e
+    if not files:
+        raise UpdateDownloadError("Manifest aktualizacji nie zawiera plików.")
+    return files
+
+
+def fetch_json(url, timeout=UPDATE_FETCH_TIMEOUT):
+    """Pobiera dokument JSON (np. manifest). Zwraca None, gdy go nie opublikowano (404)."""
+    import requests
+    try:
+        response = requests.get(url, timeout=timeout)
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        return response.json()
+    except (requests.exceptions.RequestException, ValueError) as e:
+        raise UpdateDownloadError(f"Nie udało się pobrać {url}: {e}") from e
+
+
+def fetch_sha256(url, timeout=UPDATE_FETCH_TIMEOUT):
+    """Pobiera opublikowany skrót w formacie sha256sum ("<skrót>  <nazwa>" lub sam skrót)."""
+    import requests
+    try:
+        response = requests.get(url, timeout=timeout)
+        response.raise_for_status()
+    except requests.exceptions.RequestException as e:
+        raise UpdateDownloadError(f"Brak opublikowanego skrótu SHA-256 ({url}): {e}") from e
+    digest = response.text.split()[0].lower() if response.text.strip() else ""
+    if len(digest) != 64 or any(c not in "0123456789abcdef" for c in digest):
+        raise UpdateDownloadError(f"Niepoprawny skrót SHA-256 w {url}.")
+    return digest
+
+
+class UpdateDownloader:
+    """Strumieniowo pobiera pliki do *.part (ze wznawianiem Range), weryfikuje SHA-256 i podmienia je.
+
+    on_progress(pobrane_bajty, łącznie_bajtów) jest wywoływane z wątku pobierania;
+    łączna liczba bajtów może być None, dopóki nie jest znana.
+    """
+    def __init__(self, on_progress=None, chunk_size=DOWNLOAD_CHUNK_SIZE, timeout=DOWNLOAD_TIMEOUT, log=None):
+        self.on_progress = on_progress
+        self.chunk_size = chunk_size
+        self.timeout = timeout
+        self.log = log # log(komunikat, poziom, *argumenty_formatowania)
+
+    def _log(self, message, level="DEBUG", *args):
+        if self.log:
+            self.log(message, level, *args)
+
+    def install(self, files):
+        """Pobiera i weryfikuje wszystkie pliki, a dopiero potem podmienia je (z kopiami *.bak)."""
+        total = sum(f.size for f in files) if all(f.size for f in files) else None
+        done = 0
+        for item in files:
+            done += self.download(item, done, total)
+        self._swap(files)
+
+    def download(self, item, done_before=0, total=None):
+        """Pobiera jeden plik do item.path + PART_SUFFIX i sprawdza skrót. Zwraca rozmiar pliku."""
+        import hashlib
+        import requests
+        part_path = item.path + PART_SUFFIX
+        os.makedirs(os.path.dirname(part_path), exist_ok=True)
+        digest = hashlib.sha256()
+        offset = 0
+        if os.path.exists(part_path):
+            with open(part_path, "rb") as f: # Skrót liczony też z już pobranej części
+                for chunk in iter(lambda: f.read(self.chunk_size), b""):
+                    digest.update(chunk)
+                    offset += len(chunk)
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+        try:
+            with requests.get(item.url, headers=headers, stream=True, timeout=self.timeout) as response:
+                if response.status_code == 416 and offset:
+                    pass # Część jest już kompletna - zostaje tylko weryfikacja
+                else:
+                    response.raise_for_status()
+                    if offset and response.status_code != 206:
+                        self._log("Serwer nie obsługuje wznawiania dla %s - pobieram od początku.", "DEBUG", item.url)
+                        digest = hashlib.sha256()
+                        offset = 0
+                    elif offset:
+                        self._log("Wznawiam pobieranie %s od bajtu %d.", "DEBUG", os.path.basename(item.path), offset)
+                    if total is None and response.headers.get("Content-Length"):
+                        total = done_before + offset + int(response.headers["Content-Length"])
+                    with open(part_path, "ab" if offset else "wb") as f:
+                        for chunk in response.iter_content(self.chunk_size):
+                            f.write(chunk)
+                            digest.update(chunk)
+                            offset += len(chunk)
+                            if self.on_progress:
+                                self.on_progress(done_before + offset, total)
+        except (requests.exceptions.RequestException, OSError) as e:
+            # *.part zostaje na dysku - kolejna próba wznowi pobieranie
+            raise UpdateDownloadError(f"Błąd pobierania {item.url}: {e}") from e
+        if digest.hexdigest() != item.sha256:
+            os.remove(part_path) # Uszkodzonej części nie wznawiamy
+            raise UpdateDownloadError(f"Niezgodny skrót SHA-256 pliku {os.path.basename(item.path)} "
+                                      f"(oczekiwano {item.sha256}, otrzymano {digest.hexdigest()}).")
+        return offset
+
+    def _swap(self, files):
+        """Podmienia pliki atomowo (os.replace); przy błędzie przywraca już podmienione z kopii."""
+        import shutil
+        replaced = []
+        try:
+            for item in files:
+                existed = os.path.exists(item.path)
+                if existed:
+                    shutil.copy2(item.path, item.path + BACKUP_SUFFIX)
+                    os.chmod(item.path + PART_SUFFIX, os.stat(item.path).st_mode & 0o7777)
+                os.replace(item.path + PART_SUFFIX, item.path)
+                replaced.append((item, existed))
+                self._log("Zastąpiono plik %s.", "DEBUG", item.path)
+        except OSError as e:
+            for item, existed in reversed(replaced):
+                if existed:
+                    os.replace(item.path + BACKUP_SUFFIX, item.path)
+                else:
+                    os.remove(item.path)
+            raise UpdateDownloadError(f"Nie udało się podmienić plików aktualizacji: {e}") from e
@@ -0,0 +1,124 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from launcher_trace import percentile
+
+PRELOAD_CHUNK_SIZE = 1024 * 1024 # Blok czytania pliku, gdy posix_fadvise jest niedostępne
+
+
+class RouteTiming:
+    """Czasy pierwszego (zimnego) i kolejnego (rozgrzanego) żądania jednej ścieżki na jednym workerze."""
+    __slots__ = ("port", "route", "cold", "warm", "status")
+
+    def __init__(self, port, route):
+        self.port = port
+        self.route = route
+        self.cold = None # Sekundy; None przy błędzie połączenia
+        self.warm = None
+        self.status = None # Kod HTTP pierwszego żądania albo nazwa wyjątku
+
+
+class WarmupResult:
+    __slots__ = ("timings", "preloaded_files", "preloaded_bytes", "preload_mode", "elapsed")
+
+    def __init__(self):
+        self.timings = []
+        self.preloaded_files = 0
+        self.preloaded_bytes = 0
+        self.preload_mode = None # "fadvise" albo "read"
+        self.elapsed = 0.0
+
+    def failed(self):
+        """Ścieżki, które zwróciły błąd (>= 500) albo nie odpowiedziały."""
+        return [t for t in self.timings if not isinstance(t.status, int) or t.status >= 500]
+
+    def latency_summary(self):
+        """Zwraca {"cold": (p50, max), "warm": (p50, max)} w sekundach albo None, gdy brak pomiarów."""
+        summary = {}
+        for kind in ("cold", "warm"):
+            values = [getattr(t, kind) for t in self.timings if getattr(t, kind) is not None]
+            summary[kind] = (percentile(values, 0.5), max(values)) if values else None
+        return summary
+
+
+def preload_file(path):
+    """Wczytuje plik do pamięci podręcznej stron systemu. Zwraca (rozmiar, tryb)."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        if hasattr(os, "posix_fadvise"):
+            # Jądro czyta plik w tle - bez kopiowania danych do procesu launchera
+            os.posix_fadvise(fd, 0, size, os.POSIX_FADV_WILLNEED)
+            return size, "fadvise"
+        while os.read(fd, PRELOAD_CHUNK_SIZE):
+            pass
+        return size, "read"
+    finally:
+        os.close(fd)
+
+
+class BackendWarmup:
+    """Rozgrzewa gotowy backend przed wpuszczeniem graczy.
+
+    Każda ścieżka z `routes` jest wysyłana do każdego workera (kompilacja tras i szablonów,
+    pamięci podręczne procesu) z ograniczoną współbieżnością, a w tym czasie pliki z
+    `preload_paths` trafiają do pamięci podręcznej stron. Potem każda ścieżka jest odpytywana
+    jeszcze raz, żeby porównać opóźnienie pierwszego żądania przed i po rozgrzaniu.
+    """
+    def __init__(self, ports, routes, concurrency=4, timeout=5.0, host="127.0.0.1", preload_paths=(), preload_max_bytes=None):
+        self.ports = list(ports)
+        self.routes = list(routes)
+        self.concurrency = max(1, int(concurrency))
+        self.timeout = timeout
+        self.host = host
+        self.preload_paths = list(preload_paths)
+        self.preload_max_bytes = preload_max_bytes # None = bez limitu
+
+    def run(self, cancel_event=None):
+        started = time.monotonic()
+        result = WarmupResult()
+        cancel_event = cancel_event or threading.Event()
+        result.timings = [RouteTiming(port, route) for route in self.routes for port in self.ports]
+        # Pliki wczytywane są we własnym wątku, żeby nie zajmować miejsca żądaniom HTTP
+        preload = threading.Thread(target=self._preload, args=(result, cancel_event), name="WarmupPreload", daemon=True)
+        preload.start()
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            list(pool.map(lambda t: self._measure(t, "cold", cancel_event), result.timings))
+            list(pool.map(lambda t: self._measure(t, "warm", cancel_event), result.timings))
+        preload.join()
+        result.elapsed = time.monotonic() - started
+        return result
+
+    def _measure(self, timing, kind, cancel_event):
+        if cancel_event.is_set():
+            return
+        import http.client # Import leniwy - http.client jest kosztowny przy starcie trybu bezgłowego
+        conn = http.client.HTTPConnection(self.host, timing.port, timeout=self.timeout)
+        start = time.perf_counter()
+        try:
+            conn.request("GET", timing.route)
+            response = conn.getresponse()
+            response.read()
+            status = response.status
+            setattr(timing, kind, time.perf_counter() - start)
+        except (OSError, http.client.HTTPException) as e:
+            status = type(e).__name__
+        finally:
+            conn.close()
+        if kind == "cold":
+            timing.status = status
+
+    def _preload(self, result, cancel_event):
+        for path in self.preload_paths:
+            if cancel_event.is_set():
+                return
+            if self.preload_max_bytes is not None and result.preloaded_bytes >= self.preload_max_bytes:
+                return
+            try:
+                size, result.preload_mode = preload_file(path)
+            except OSError:
+                continue
+            result.preloaded_files += 1
+            result.preloaded_bytes += size
@@ -0,0 +1,307 @@
+import importlib
+import json
+import os
+import runpy
+import select
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+import traceback
+from queue import Queue, Empty
+
+ZYGOTE_START_TIMEOUT = 30.0 # Maksymalny czas na wczytanie modułów przez zygotę (sekundy)
+SPAWN_REPLY_TIMEOUT = 5.0 # Maksymalny czas oczekiwania na odpowiedź zygoty na żądanie uruchomienia (sekundy)
+MESSAGE_SIZE = 65536 # Maksymalny rozmiar jednej wiadomości protokołu (bajty)
+MAX_PASSED_FDS = 16 # Maksymalna liczba deskryptorów w jednym żądaniu
+HIGH_FD_BASE = 100 # Deskryptory z żądania są najpierw przenoszone powyżej tej wartości
+
+
+def zygote_supported():
+    """Zygota wymaga fork() i przekazywania deskryptorów przez gniazda uniksowe."""
+    return hasattr(os, "fork") and hasattr(socket, "send_fds") and hasattr(socket, "SOCK_SEQPACKET")
+
+
+def _send(sock, message, fds=()):
+    data = json.dumps(message).encode("utf-8")
+    if fds:
+        socket.send_fds(sock, [data], list(fds))
+    else:
+        sock.send(data)
+
+
+# --- Strona zygoty (osobny proces) ---
+
+def _run_child(request, fds):
+    """Kod dziecka po fork(): przygotowuje stdio, środowisko i deskryptory, potem uruchamia skrypt."""
+    try:
+        os.setsid() # Własna grupa procesów, jak przy start_new_session w Popen
+        high = [os.dup2(fd, HIGH_FD_BASE + i) for i, fd in enumerate(fds)] if fds else []
+        os.dup2(high[0], 1)
+        os.dup2(high[0], 2)
+        for fd, target in zip(high[1:], request["pass_fds"]):
+            os.dup2(fd, target)
+            os.set_inheritable(target, True)
+        for fd in set(fds) | set(high):
+            if fd not in request["pass_fds"] and fd > 2:
+                os.close(fd)
+        os.chdir(request["cwd"] or os.getcwd())
+        os.environ.clear()
+        os.environ.update(request["env"])
+        script = request["script"]
+        sys.argv = [script]
+        sys.path[0] = os.path.dirname(os.path.abspath(script))
+        code = 0
+        try:
+            runpy.run_path(script, run_name="__main__")
+        except SystemExit as e:
+            code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        except BaseException:
+            traceback.print_exc()
+            code = 1
+        sys.stdout.flush()
+        sys.stderr.flush()
+    except BaseException:
+        code = 1
+    os._exit(code)
+
+
+def serve(sock, preload):
+    """Pętla zygoty: wczytuje moduły, a potem na każde żądanie forkuje się i uruchamia skrypt."""
+    started = time.perf_counter()
+    loaded = []
+    for name in preload:
+        try:
+            importlib.import_module(name)
+            loaded.append(name)
+        except Exception as e:
+            print(f"Zygota: nie udało się wczytać modułu {name}: {e}", flush=True)
+    wakeup_r, wakeup_w = os.pipe()
+    os.set_blocking(wakeup_w, False)
+    signal.set_wakeup_fd(wakeup_w)
+    signal.signal(signal.SIGCHLD, lambda signum, frame: None)
+    _send(sock, {"ready": time.perf_counter() - started, "modules": loaded})
+
+    while True:
+        readable, _, _ = select.select([sock, wakeup_r], [], [])
+        if wakeup_r in readable:
+            os.read(wakeup_r, 4096)
+            while True:
+                try:
+                    pid, status = os.waitpid(-1, os.WNOHANG)
+                except ChildProcessError:
+                    break
+                if pid == 0:
+                    break
+                _send(sock, {"exited": pid, "code": os.waitstatus_to_exitcode(status)})
+        if sock in readable:
+            data, fds, _flags, _addr = socket.recv_fds(sock, MESSAGE_SIZE, MAX_PASSED_FDS)
+            if not data:
+                return # Launcher zamknął połączenie
+            request = json.loads(data)
+            sys.stdout.flush()
+            pid = os.fork()
+            if pid == 0:
+                sock.close()
+                signal.set_wakeup_fd(-1)
+                signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+                os.close(wakeup_r)
+                os.close(wakeup_w)
+                _run_child(request, fds)
+            for fd in fds:
+                os.close(fd)
+            _send(sock, {"spawned": pid, "id": request.get("id")})
+
+
+# --- Strona launchera ---
+
+class ZygoteProcess:
+    """Proces uruchomiony przez zygotę; interfejs zgodny z używaną częścią subprocess.Popen."""
+    def __init__(self, client, pid, stdout):
+        self._client = client
+        self.pid = pid
+        self.stdout = stdout
+        self.returncode = None
+        self.from_zygote = True
+        self._exited = threading.Event()
+
+    def _set_exit(self, code):
+        self.returncode = code
+        self._exited.set()
+
+    def poll(self):
+        if self.returncode is None and not self._client.alive:
+            # Zygota nie żyje - nie dostaniemy kodu wyjścia, sprawdzamy tylko istnienie procesu
+            try:
+                os.kill(self.pid, 0)
+            except ProcessLookupError:
+                self._set_exit(-1)
+            except PermissionError:
+                pass
+        return self.returncode
+
+    def wait(self, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.poll() is None:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                raise subprocess.TimeoutExpired(str(self.pid), timeout)
+            self._exited.wait(0.1 if remaining is None else min(0.1, remaining))
+        return self.returncode
+
+    def send_signal(self, sig):
+        if self.returncode is None:
+            try:
+                os.kill(self.pid, sig)
+            except ProcessLookupError:
+                pass
+
+    def terminate(self):
+        self.send_signal(signal.SIGTERM)
+
+    def kill(self):
+        self.send_signal(signal.SIGKILL)
+
+
+class ZygoteClient:
+    """Uruchamia zygotę z wczytanymi modułami i zleca jej tworzenie procesów przez fork()."""
+    def __init__(self, python_executable, preload, log=None):
+        self.python_executable = python_executable
+        self.preload = list(preload)
+        self.log = log
+        self.process = None # subprocess.Popen samej zygoty
+        self.preload_time = None
+        self.loaded_modules = []
+        self.alive = False
+        self._sock = None
+        self._replies = Queue()
+        self._request_id = 0 # Numer ostatniego żądania; odpowiedź spóźniona po limicie czasu ma starszy numer
+        self._processes = {} # pid -> ZygoteProcess
+        self._early_exits = {} # pid -> kod wyjścia zgłoszony przed rejestracją procesu
+        self._orphans = set() # PID-y z odrzuconych, spóźnionych odpowiedzi - ich zakończenie ignorujemy
+        self._spawn_lock = threading.Lock() # Jedno żądanie uruchomienia naraz (odpowiedzi przychodzą po kolei)
+        self._registry_lock = threading.Lock() # Chroni _processes i _early_exits
+
+    def _log(self, message, level):
+        if self.log:
+            self.log(message, level)
+
+    def start(self, stdout=None):
+        """Uruchamia zygotę i czeka na wczytanie modułów. Rzuca OSError/RuntimeError przy błędzie."""
+        parent_sock, child_sock = socket.socketpair(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+        try:
+            self.process = subprocess.Popen(
+                [self.python_executable, os.path.abspath(__file__), str(child_sock.fileno())] + self.preload,
+                pass_fds=(child_sock.fileno(),),
+                stdout=stdout, stderr=subprocess.STDOUT if stdout is not None else None,
+                start_new_session=True,
+            )
+        finally:
+            child_sock.close()
+        self._sock = parent_sock
+        self._sock.settimeout(ZYGOTE_START_TIMEOUT)
+        try:
+            hello = json.loads(self._sock.recv(MESSAGE_SIZE) or b"null")
+        except (OSError, ValueError):
+            hello = None
+        if not hello or "ready" not in hello:
+            self.stop()
+            raise RuntimeError("Zygota nie zgłosiła gotowości.")
+        self._sock.settimeout(None)
+        self.preload_time = hello["ready"]
+        self.loaded_modules = hello["modules"]
+        self.alive = True
+        threading.Thread(target=self._read_messages, name="ZygoteClient", daemon=True).start()
+
+    def stop(self):
+        self.alive = False
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+        if self.process is not None and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+
+    def spawn(self, script, cwd=None, env=None, pass_fds=()):
+        """Forkuje zygotę i uruchamia w dziecku `script`. Zwraca ZygoteProcess z potokiem stdout."""
+        if not self.alive:
+            raise OSError("Zygota nie działa.")
+        read_fd, write_fd = os.pipe()
+        try:
+            with self._spawn_lock:
+                self._request_id += 1
+                request = {"id": self._request_id, "script": script, "cwd": cwd, "env": dict(env or os.environ),
+                           "pass_fds": list(pass_fds)}
+                _send(self._sock, request, [write_fd] + list(pass_fds))
+                reply = self._wait_reply(request["id"])
+            if reply is None:
+                raise OSError("Zygota zakończyła działanie.")
+            process = ZygoteProcess(self, reply["spawned"], os.fdopen(read_fd, "rb"))
+            read_fd = None
+            with self._registry_lock:
+                self._processes[process.pid] = process
+                code = self._early_exits.pop(process.pid, None)
+            if code is not None:
+                process._set_exit(code)
+            return process
+        finally:
+            os.close(write_fd)
+            if read_fd is not None:
+                os.close(read_fd)
+
+    def _wait_reply(self, request_id):
+        """Czeka na odpowiedź na żądanie `request_id`. Spóźnione odpowiedzi na wcześniejsze żądania są odrzucane."""
+        deadline = time.monotonic() + SPAWN_REPLY_TIMEOUT
+        while True:
+            try:
+                reply = self._replies.get(timeout=max(0.0, deadline - time.monotonic()))
+            except Empty:
+                raise OSError("Zygota nie odpowiedziała na żądanie uruchomienia.")
+            if reply is None or reply.get("id") == request_id:
+                return reply
+            self._discard_orphan(reply["spawned"])
+
+    def _discard_orphan(self, pid):
+        """Kończy proces z żądania, które przekroczyło limit czasu - nikt go nie śledzi ani nie czyta jego wyjścia."""
+        self._log(f"Spóźniona odpowiedź zygoty (PID {pid}) - kończę nieśledzony proces.", "WARNING")
+        with self._registry_lock:
+            if self._early_exits.pop(pid, None) is None:
+                self._orphans.add(pid)
+        try:
+            os.killpg(pid, signal.SIGKILL) # Dziecko zygoty ma własną grupę procesów (setsid)
+        except OSError:
+            pass
+
+    def _read_messages(self):
+        while True:
+            try:
+                data = self._sock.recv(MESSAGE_SIZE)
+            except (OSError, AttributeError):
+                data = b""
+            if not data:
+                break
+            message = json.loads(data)
+            if "spawned" in message:
+                self._replies.put(message)
+            elif "exited" in message:
+                with self._registry_lock:
+                    process = self._processes.pop(message["exited"], None)
+                    if process is None and message["exited"] in self._orphans:
+                        self._orphans.discard(message["exited"])
+                    elif process is None:
+                        self._early_exits[message["exited"]] = message["code"]
+                if process is not None:
+                    process._set_exit(message["code"])
+        if self.alive:
+            self._log("Zygota zakończyła działanie - kolejne procesy będą uruchamiane na zimno.", "WARNING")
+        self.alive = False
+        self._replies.put(None)
+
+
+if __name__ == "__main__":
+    serve(socket.socket(fileno=int(sys.argv[1])), sys.argv[2:])
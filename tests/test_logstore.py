@@ -0,0 +1,59 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from launcher_logs import LogRecord
+from launcher_logstore import LogStore, _decode_line, _encode_line
+
+ESCAPED_MESSAGES = [
+    "C:\\new\\table",
+    "dosłowne \\n w tekście",
+    "\\\\n",
+    "linia 1\nlinia 2",
+    "\\\n",
+    "kończy się ukośnikiem \\",
+    "progress 10%\rprogress 100%",
+    "\\r",
+]
+
+
+def test_encode_decode_round_trip():
+    for message in ESCAPED_MESSAGES:
+        line = _encode_line(1.5, "INFO", "BACKEND", message)
+        assert line.count("\n") == 1
+        assert _decode_line(line).message == message
+
+
+def test_store_search_returns_original_text(tmp_path):
+    store = LogStore(str(tmp_path))
+    store.start()
+    store.append_many([LogRecord("INFO", "BACKEND", message) for message in ESCAPED_MESSAGES])
+    try:
+        _count, records = store.search()
+        assert [record.message for record in records] == ESCAPED_MESSAGES
+        count, records = store.search(text="c:\\new")
+        assert count == 1 and records[0].message == "C:\\new\\table"
+    finally:
+        store.close()
+
+
+def test_restart_without_close_keeps_lines_since_rotation(tmp_path):
+    store = LogStore(str(tmp_path), max_segment_bytes=200)
+    store.start()
+    store.append_many([LogRecord("INFO", "BACKEND", f"przed rotacją {i}") for i in range(5)])
+    store.flush()
+    store.append(LogRecord("ERROR", "BACKEND", "crash-time"))
+    store.flush()
+    # Awaria: wątek zapisu kończy się bez close(), więc indeks nie jest zapisywany na koniec
+    store._closed.set()
+    store._thread.join()
+    store._file.close()
+
+    restarted = LogStore(str(tmp_path), max_segment_bytes=200)
+    restarted.start()
+    try:
+        assert restarted.search(text="crash-time")[0] == 1
+        assert restarted.search()[0] == 6
+    finally:
+        restarted.close()
@@ -0,0 +1,46 @@
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from launcher_output import OutputMultiplexer
+
+
+def _pipe(reader, name):
+    read_fd, write_fd = os.pipe()
+    reader.add(name, os.fdopen(read_fd, "rb", buffering=0))
+    return write_fd
+
+
+def test_error_at_eof_does_not_stop_other_streams():
+    lines = []
+    errors = []
+    closed = threading.Event()
+    good_line = threading.Event()
+
+    def on_lines(name, batch):
+        if name == "zły" and "końcówka" in batch:
+            raise RuntimeError("błąd przy ostatniej linii")
+        lines.extend((name, line) for line in batch)
+        if name == "dobry":
+            good_line.set()
+
+    def on_error(name, error):
+        errors.append((name, error))
+        closed.set()
+
+    reader = OutputMultiplexer(on_lines, on_error=on_error)
+    bad = _pipe(reader, "zły")
+    good = _pipe(reader, "dobry")
+    os.write(bad, "pierwsza\nkońcówka".encode())
+    os.close(bad) # EOF - niedokończona linia trafia do on_lines z _finish
+    assert closed.wait(5)
+
+    os.write(good, b"dalej czytany\n")
+    try:
+        assert good_line.wait(5)
+    finally:
+        os.close(good)
+    assert ("dobry", "dalej czytany") in lines
+    assert [name for name, _error in errors] == ["zły"]